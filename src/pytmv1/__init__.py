@@ -1,5 +1,19 @@
 from .__about__ import __version__
-from .client import Client, init
+from .adapter import PoolStats
+from .async_client import AsyncClient, init_async
+from .cache import EndpointCache, ResponseCache
+from .checkpoint import (
+    Checkpoint,
+    CheckpointStore,
+    FileCheckpointStore,
+    SQLiteCheckpointStore,
+)
+from .client import Client, ClientRegistry, init
+from .instrument import (
+    Instrumentation,
+    OpenTelemetryInstrumentation,
+    PrometheusInstrumentation,
+)
 from .mapper import map_cef
 from .model.common import (
     Account,
@@ -144,11 +158,16 @@ from .model.response import (
     TerminateProcessTaskResp,
     TextResp,
 )
+from .poll import PollStrategy
 from .result import MultiResult, Result, ResultCode
+from .retry import RetryPolicy
+from .sync import Deduplicator, IncrementalSync
+from .throttle import RateLimit, RateLimiter
 
 __all__ = [
     "__version__",
     "init",
+    "init_async",
     "map_cef",
     "Account",
     "AccountRequest",
@@ -162,16 +181,21 @@ __all__ = [
     "ApiKey",
     "ApiKeyRequest",
     "ApiStatus",
+    "AsyncClient",
     "BaseTaskResp",
     "BlockListTaskResp",
     "BytesResp",
+    "Checkpoint",
+    "CheckpointStore",
     "Client",
+    "ClientRegistry",
     "CollectFileRequest",
     "CollectFileTaskResp",
     "ConnectivityResp",
     "ConsumeLinkableResp",
     "CustomScriptRequest",
     "CustomScriptTaskResp",
+    "Deduplicator",
     "DeepfakeDetector",
     "Digest",
     "EdrSettings",
@@ -182,6 +206,7 @@ __all__ = [
     "EmailMessageUIdRequest",
     "Endpoint",
     "EndpointActivity",
+    "EndpointCache",
     "EndpointDetail",
     "EndpointDetailEdrSensor",
     "EndpointDetailEngine",
@@ -256,15 +281,26 @@ __all__ = [
     "OatRiskLevel",
     "EdrSensor",
     "DetectionType",
+    "FileCheckpointStore",
+    "IncrementalSync",
+    "Instrumentation",
     "ObjectRequest",
     "ObjectType",
+    "OpenTelemetryInstrumentation",
     "OperatingSystem",
+    "PollStrategy",
+    "PoolStats",
     "ProductCode",
+    "PrometheusInstrumentation",
     "Provenance",
     "Provider",
     "QueryOp",
+    "RateLimit",
+    "RateLimiter",
+    "ResponseCache",
     "Result",
     "ResultCode",
+    "RetryPolicy",
     "RiskLevel",
     "SaeAlert",
     "SaeIndicator",
@@ -276,6 +312,7 @@ __all__ = [
     "SandboxSuspiciousObject",
     "ScanAction",
     "Severity",
+    "SQLiteCheckpointStore",
     "Status",
     "SubmitFileToSandboxResp",
     "SuspiciousObject",
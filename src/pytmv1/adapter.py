@@ -1,23 +1,138 @@
+import io
+import os
+import time
 import typing
-from typing import Any
+from contextlib import contextmanager
+from dataclasses import dataclass, replace
+from threading import Lock
+from typing import Any, Iterator, Mapping, Optional, Tuple, Union
 
-from requests.adapters import DEFAULT_POOLBLOCK
+from requests import ConnectionError as RequestsConnectionError
+from requests import PreparedRequest, RequestException, Response, Timeout
+from requests.adapters import DEFAULT_POOLBLOCK, BaseAdapter
 from requests.adapters import HTTPAdapter as AdapterUrllib
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
 from urllib3.connectionpool import HTTPConnectionPool as HTTPUrllib
 from urllib3.connectionpool import HTTPSConnectionPool as HTTPSUrllib
+from urllib3.exceptions import EmptyPoolError
 from urllib3.poolmanager import PoolManager as ManagerUrllib
+from urllib3.poolmanager import ProxyManager as ProxyUrllib
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None  # type: ignore[assignment]
+
+
+POOL_TIMEOUT: float = 5
+
+
+def default_pool_maxsize() -> int:
+    """Default size of the connection pool, matching the default number of
+    workers of a thread pool so every worker gets its own connection.
+
+    :rtype: int
+    """
+    return min(32, (os.cpu_count() or 1) + 4)
+
+
+@dataclass(frozen=True)
+class PoolStats:
+    """Usage of the connections of a client since its creation.
+
+    :param in_use: Connections currently sending a request.
+    :type in_use: int
+    :param max_in_use: Highest number of connections in use at once.
+    :type max_in_use: int
+    :param created: Requests that opened a new connection.
+    :type created: int
+    :param reused: Requests sent over an already opened connection.
+    :type reused: int
+    :param wait_time: Total seconds spent waiting for a free connection.
+    :type wait_time: float
+    :param timeouts: Requests failed after waiting pool_timeout seconds.
+    :type timeouts: int
+    """
+
+    in_use: int = 0
+    max_in_use: int = 0
+    created: int = 0
+    reused: int = 0
+    wait_time: float = 0
+    timeouts: int = 0
+
+
+class _PoolMetrics:
+    def __init__(self) -> None:
+        self._stats = PoolStats()
+        self._lock = Lock()
+
+    def acquired(self, wait_time: float, created: bool) -> None:
+        with self._lock:
+            stats: PoolStats = self._stats
+            self._stats = replace(
+                stats,
+                in_use=stats.in_use + 1,
+                max_in_use=max(stats.max_in_use, stats.in_use + 1),
+                created=stats.created + created,
+                reused=stats.reused + (not created),
+                wait_time=stats.wait_time + wait_time,
+            )
+
+    def released(self) -> None:
+        with self._lock:
+            self._stats = replace(
+                self._stats, in_use=max(self._stats.in_use - 1, 0)
+            )
+
+    def timed_out(self, wait_time: float) -> None:
+        with self._lock:
+            self._stats = replace(
+                self._stats,
+                wait_time=self._stats.wait_time + wait_time,
+                timeouts=self._stats.timeouts + 1,
+            )
+
+    def snapshot(self) -> PoolStats:
+        return self._stats
 
 
 class HTTPConnectionPool(HTTPUrllib):
+    pool_timeout: float = POOL_TIMEOUT
+    metrics: Optional[_PoolMetrics] = None
+
     @typing.no_type_check
     def urlopen(self, method, url, **kwargs):
         return super().urlopen(
             method,
             url,
-            pool_timeout=5,
+            pool_timeout=self.pool_timeout,
             **kwargs,
         )
 
+    @typing.no_type_check
+    def _get_conn(self, timeout=None):
+        start: float = time.monotonic()
+        try:
+            conn = super()._get_conn(timeout)
+        except EmptyPoolError:
+            if self.metrics:
+                self.metrics.timed_out(time.monotonic() - start)
+            raise
+        # Connections open their socket on first use
+        if self.metrics:
+            self.metrics.acquired(
+                time.monotonic() - start, getattr(conn, "sock", None) is None
+            )
+        return conn
+
+    @typing.no_type_check
+    def _put_conn(self, conn):
+        if self.metrics:
+            self.metrics.released()
+        super()._put_conn(conn)
+
 
 class HTTPSConnectionPool(HTTPSUrllib, HTTPConnectionPool): ...
 
@@ -25,16 +140,45 @@ class HTTPSConnectionPool(HTTPSUrllib, HTTPConnectionPool): ...
 class PoolManager(ManagerUrllib):
     def __init__(
         self,
+        *args: Any,
+        pool_timeout: float = POOL_TIMEOUT,
+        metrics: Optional[_PoolMetrics] = None,
         **connection_pool_kw: Any,
     ):
-        super().__init__(**connection_pool_kw)
+        super().__init__(*args, **connection_pool_kw)
+        self.pool_timeout = pool_timeout
+        self.metrics = metrics or _PoolMetrics()
         self.pool_classes_by_scheme = {
             "http": HTTPConnectionPool,
             "https": HTTPSConnectionPool,
         }
 
+    @typing.no_type_check
+    def _new_pool(self, scheme, host, port, request_context=None):
+        pool = super()._new_pool(scheme, host, port, request_context)
+        pool.pool_timeout = self.pool_timeout
+        pool.metrics = self.metrics
+        return pool
+
+
+class ProxyManager(ProxyUrllib, PoolManager): ...
+
 
 class HTTPAdapter(AdapterUrllib):
+    def __init__(
+        self,
+        pool_connections: int,
+        pool_maxsize: int,
+        max_retries: int = 0,
+        pool_block: bool = DEFAULT_POOLBLOCK,
+        pool_timeout: float = POOL_TIMEOUT,
+    ):
+        self._pool_timeout = pool_timeout
+        self._metrics = _PoolMetrics()
+        super().__init__(
+            pool_connections, pool_maxsize, max_retries, pool_block
+        )
+
     @typing.no_type_check
     def init_poolmanager(
         self, connections, maxsize, block=DEFAULT_POOLBLOCK, **pool_kwargs
@@ -44,5 +188,179 @@ class HTTPAdapter(AdapterUrllib):
             num_pools=connections,
             maxsize=maxsize,
             block=block,
+            pool_timeout=self._pool_timeout,
+            metrics=self._metrics,
             **pool_kwargs,
         )
+
+    @typing.no_type_check
+    def proxy_manager_for(self, proxy, **proxy_kwargs):
+        # SOCKS proxies keep the stock manager of requests
+        if proxy not in self.proxy_manager and not proxy.lower().startswith(
+            "socks"
+        ):
+            self.proxy_manager[proxy] = ProxyManager(
+                proxy,
+                proxy_headers=self.proxy_headers(proxy),
+                num_pools=self._pool_connections,
+                maxsize=self._pool_maxsize,
+                block=self._pool_block,
+                pool_timeout=self._pool_timeout,
+                metrics=self._metrics,
+                **proxy_kwargs,
+            )
+        return super().proxy_manager_for(proxy, **proxy_kwargs)
+
+    @typing.no_type_check
+    def send(self, request, *args, **kwargs):
+        try:
+            return super().send(request, *args, **kwargs)
+        except EmptyPoolError as exc:
+            raise RequestsConnectionError(exc, request=request) from exc
+
+    def stats(self) -> PoolStats:
+        """Usage of the connections of this adapter.
+
+        :rtype: PoolStats
+        """
+        return self._metrics.snapshot()
+
+
+class HttpxAdapter(BaseAdapter):
+    """Transport adapter sending requests through httpx, by default over
+    HTTP/2 so concurrent requests to Vision One share one TLS connection.
+
+    :param pool_maxsize: Maximum number of connections.
+    :type pool_maxsize: int
+    :param proxies: Proxy url by scheme (ie: https).
+    :type proxies: Optional[Mapping[str, str]]
+    :param http2: Negotiate HTTP/2 (requires pip install pytmv1[http2]).
+    :type http2: bool
+    """
+
+    def __init__(
+        self,
+        pool_maxsize: int,
+        proxies: Optional[Mapping[str, str]] = None,
+        http2: bool = True,
+    ):
+        super().__init__()
+        if httpx is None:
+            raise ImportError(
+                "httpx is required by the HTTP/2 transport,"
+                " install it with: pip install pytmv1[http2]"
+            )
+        limits = httpx.Limits(
+            max_connections=max(pool_maxsize, 1),
+            max_keepalive_connections=max(pool_maxsize, 1),
+        )
+        self._client = httpx.Client(
+            transport=httpx.HTTPTransport(limits=limits, http2=http2),
+            mounts={
+                f"{scheme}://": httpx.HTTPTransport(
+                    limits=limits, http2=http2, proxy=proxy
+                )
+                for scheme, proxy in (proxies or {}).items()
+            },
+            trust_env=False,
+        )
+
+    def send(
+        self,
+        request: PreparedRequest,
+        stream: bool = False,
+        timeout: Union[
+            None, float, Tuple[float, float], Tuple[float, None]
+        ] = None,
+        verify: Union[bool, str] = True,
+        cert: Any = None,
+        proxies: Optional[Mapping[str, str]] = None,
+    ) -> Response:
+        connect, read = (
+            timeout if isinstance(timeout, tuple) else (timeout, timeout)
+        )
+        with http_errors():
+            raw_response: httpx.Response = self._client.send(
+                self._client.build_request(
+                    str(request.method),
+                    str(request.url),
+                    headers=dict(request.headers),
+                    content=request.body,
+                    timeout=httpx.Timeout(None, connect=connect, read=read),
+                ),
+                stream=stream,
+            )
+        response: Response = requests_response(raw_response)
+        if stream:
+            response.raw = _StreamReader(raw_response)
+        response.request = request
+        return response
+
+    def close(self) -> None:
+        self._client.close()
+
+
+class _StreamReader(io.RawIOBase):
+    def __init__(self, raw_response: "httpx.Response"):
+        self._response = raw_response
+        self._chunks: Iterator[bytes] = raw_response.iter_bytes()
+        self._buffer: bytes = b""
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        with http_errors():
+            while not self._buffer:
+                chunk: Optional[bytes] = next(self._chunks, None)
+                if chunk is None:
+                    return 0
+                self._buffer = chunk
+        size: int = min(len(buffer), len(self._buffer))
+        buffer[:size] = self._buffer[:size]
+        self._buffer = self._buffer[size:]
+        return size
+
+    def close(self) -> None:
+        self._response.close()
+        super().close()
+
+
+def requests_response(raw_response: "httpx.Response") -> Response:
+    """Requests response holding the status, headers and, when read, the
+    body of an httpx response, so both transports share one parsing path.
+
+    :param raw_response: Response received with httpx.
+    :type raw_response: httpx.Response
+    :rtype: Response
+    """
+    headers: CaseInsensitiveDict[str] = CaseInsensitiveDict()
+    for raw_key, raw_value in raw_response.headers.raw:
+        key, value = raw_key.decode("latin-1"), raw_value.decode("latin-1")
+        headers[key] = f"{headers[key]}, {value}" if key in headers else value
+    response = Response()
+    response.status_code = raw_response.status_code
+    response.reason = raw_response.reason_phrase
+    response.url = str(raw_response.url)
+    response.headers = headers
+    response.encoding = get_encoding_from_headers(headers)
+    if raw_response.is_stream_consumed:
+        response.raw = io.BytesIO(raw_response.content)
+    return response
+
+
+@contextmanager
+def http_errors() -> Iterator[None]:
+    """Raises the httpx errors of the block as their requests counterpart
+    (Timeout, ConnectionError or RequestException).
+
+    :rtype: Iterator[None]
+    """
+    try:
+        yield
+    except httpx.TimeoutException as exc:
+        raise Timeout(exc) from exc
+    except httpx.TransportError as exc:
+        raise RequestsConnectionError(exc) from exc
+    except httpx.HTTPError as exc:
+        raise RequestException(exc) from exc
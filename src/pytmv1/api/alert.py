@@ -1,6 +1,7 @@
-from typing import Callable, Optional, Union
+from typing import Callable, Iterator, Optional, Union
 
 from .. import utils
+from ..checkpoint import CheckpointStore
 from ..core import Core
 from ..model.common import SaeAlert, TiAlert
 from ..model.enum import (
@@ -17,7 +18,8 @@ from ..model.response import (
     ListAlertsResp,
     NoContentResp,
 )
-from ..result import Result
+from ..result import Result, ResultCode
+from ..sync import IncrementalSync
 
 
 class Alert:
@@ -121,6 +123,8 @@ class Alert:
         end_time: Optional[str] = None,
         date_time_target: Optional[str] = "createdDateTime",
         op: QueryOp = QueryOp.AND,
+        prefetch: int = 0,
+        checkpoint: Optional[CheckpointStore] = None,
         **fields: str,
     ) -> Result[ConsumeLinkableResp]:
         """Retrieves and consume workbench alerts.
@@ -137,6 +141,16 @@ class Alert:
         :type end_time: Optional[str]
         :param op: Operator to apply between fields (ie: ... OR ...).
         :type op: QueryOp
+        :param prefetch: (optional) Number of pages fetched ahead in the
+         background while the consumer processes the current one.
+        :type prefetch: int
+        :param checkpoint: (optional) Store of the consumption progress,
+         a consumption interrupted by an error resumes after the last
+         consumed record, after a crash records of the page being
+         consumed may be consumed again (at-least-once), and a
+         completed one makes the next consumption start
+         where its time range ended.
+        :type checkpoint: Optional[CheckpointStore]
         :param fields: Field/value used to filter result (i.e:fileName="1.sh"),
         check Vision One API documentation for full list of supported fields.
         :type fields: Dict[str, str]
@@ -146,6 +160,101 @@ class Alert:
             ListAlertsResp,
             Api.GET_ALERT_LIST,
             consumer,
+            prefetch=prefetch,
+            checkpoint=checkpoint,
+            params=utils.filter_none(
+                {
+                    "startDateTime": start_time,
+                    "endDateTime": end_time,
+                    "dateTimeTarget": date_time_target,
+                    "orderBy": "createdDateTime desc",
+                }
+            ),
+            headers=utils.tmv1_filter(op, fields),
+        )
+
+    def sync(
+        self,
+        consumer: Callable[[Union[SaeAlert, TiAlert]], None],
+        state: IncrementalSync,
+        start_time: Optional[str] = None,
+        op: QueryOp = QueryOp.AND,
+        prefetch: int = 0,
+        **fields: str,
+    ) -> Result[ConsumeLinkableResp]:
+        """Consumes the workbench alerts created or updated since the
+        previous sync, an updated alert is consumed again.
+
+        :param consumer: Function which will consume every new record.
+        :type consumer: Callable[[Union[SaeAlert, TiAlert]], None]
+        :param state: Watermark and already consumed alerts, to reuse
+         across syncs.
+        :type state: IncrementalSync
+        :param start_time: Date that indicates the start of the first sync
+        (yyyy-MM-ddThh:mm:ssZ), ignored once a watermark is saved.
+        Defaults to 24 hours before the request is made.
+        :type start_time: Optional[str]
+        :param op: Operator to apply between fields (ie: ... OR ...).
+        :type op: QueryOp
+        :param prefetch: (optional) Number of pages fetched ahead in the
+         background while the consumer processes the current one.
+        :type prefetch: int
+        :param fields: Field/value used to filter result (i.e:fileName="1.sh"),
+        check Vision One API documentation for full list of supported fields.
+        :type fields: Dict[str, str]
+        :rtype: Result[ConsumeLinkableResp]:
+        """
+        result: Result[ConsumeLinkableResp] = self._core.send_linkable(
+            ListAlertsResp,
+            Api.GET_ALERT_LIST,
+            state.track(
+                consumer,
+                lambda alert: alert.id,
+                lambda alert: alert.updated_date_time,
+                versioned=True,
+            ),
+            prefetch=prefetch,
+            params=utils.filter_none(
+                {
+                    "startDateTime": state.start_time(start_time),
+                    "dateTimeTarget": "updatedDateTime",
+                    "orderBy": "createdDateTime desc",
+                }
+            ),
+            headers=utils.tmv1_filter(op, fields),
+        )
+        if result.result_code == ResultCode.SUCCESS:
+            state.commit()
+        return result
+
+    def iter(
+        self,
+        start_time: Optional[str] = None,
+        end_time: Optional[str] = None,
+        date_time_target: Optional[str] = "createdDateTime",
+        op: QueryOp = QueryOp.AND,
+        **fields: str,
+    ) -> Iterator[Union[SaeAlert, TiAlert]]:
+        """Lazily iterates over workbench alerts.
+
+        :param start_time: Date that indicates the start of the data retrieval
+        time range (yyyy-MM-ddThh:mm:ssZ).
+        Defaults to 24 hours before the request is made.
+        :type start_time: Optional[str]
+        :param end_time: Date that indicates the end of the data retrieval
+        time range (yyyy-MM-ddThh:mm:ssZ).
+        Defaults to the time the request is made.
+        :type end_time: Optional[str]
+        :param op: Operator to apply between fields (ie: ... OR ...).
+        :type op: QueryOp
+        :param fields: Field/value used to filter result (i.e:fileName="1.sh"),
+        check Vision One API documentation for full list of supported fields.
+        :type fields: Dict[str, str]
+        :rtype: Iterator[Union[SaeAlert, TiAlert]]
+        """
+        return self._core.iter_linkable(
+            ListAlertsResp,
+            Api.GET_ALERT_LIST,
             params=utils.filter_none(
                 {
                     "startDateTime": start_time,
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Callable, Optional
+from typing import Callable, Iterator, Optional
 
 from .. import utils
 from ..core import Core
@@ -157,3 +157,27 @@ class ApiKey:
             params={"orderBy": "createdDateTime desc", "top": top},
             headers=utils.tmv1_filter(op, fields),
         )
+
+    def iter(
+        self,
+        top: int = 50,
+        op: QueryOp = QueryOp.AND,
+        **fields: str,
+    ) -> Iterator[Apk]:
+        """Lazily iterates over API keys.
+
+        :param top: Number of records displayed on a page.
+        :type top: int
+        :param op: Query operator to apply.
+        :type op: QueryOp
+        :param fields: Field/value used to filter result (ie: id="...")
+        :type fields: Dict[str, str]
+        check Vision One API documentation for full list of supported fields.
+        :return: Iterator[ApiKey]
+        """
+        return self._core.iter_linkable(
+            ListApiKeyResp,
+            Api.GET_API_KEY_LIST,
+            params={"orderBy": "createdDateTime desc", "top": top},
+            headers=utils.tmv1_filter(op, fields),
+        )
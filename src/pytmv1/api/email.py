@@ -1,9 +1,11 @@
-from typing import Callable, List, Optional, Union
+from typing import Any, Callable, Iterator, List, Optional, Tuple, Union
 
 from .. import utils
+from ..checkpoint import CheckpointStore
 from ..core import Core
 from ..model.common import EmailActivity
 from ..model.enum import Api, QueryOp, SearchMode
+from ..model.projection import project
 from ..model.request import EmailMessageIdRequest, EmailMessageUIdRequest
 from ..model.response import (
     ConsumeLinkableResp,
@@ -141,6 +143,8 @@ class Email:
         :type end_time: Optional[str]
         :param select: List of fields to include in the search results,
         if no fields are specified, the query returns all supported fields.
+        Records are parsed into a model declaring only the selected
+        fields (ie: EmailActivityProjection).
         :type select: Optional[List[str]]
         :param top: Number of records fetched per page.
         :type top: int
@@ -152,7 +156,7 @@ class Email:
         :rtype: Result[GetEmailActivityDataResp]:
         """
         return self._core.send(
-            ListEmailActivityResp,
+            project(ListEmailActivityResp, select),
             Api.GET_EMAIL_ACTIVITY_DATA,
             params=utils.build_activity_request(
                 start_time,
@@ -172,6 +176,10 @@ class Email:
         select: Optional[List[str]] = None,
         top: int = 500,
         op: QueryOp = QueryOp.AND,
+        prefetch: int = 0,
+        windows: int = 1,
+        stream: bool = False,
+        checkpoint: Optional[CheckpointStore] = None,
         **fields: str,
     ) -> Result[ConsumeLinkableResp]:
         """Retrieves and consume email activity data in a paginated list
@@ -189,20 +197,179 @@ class Email:
         :type end_time: Optional[str]
         :param select: List of fields to include in the search results,
         if no fields are specified, the query returns all supported fields.
+        Records are parsed into a model declaring only the selected
+        fields (ie: EmailActivityProjection).
         :type select: Optional[List[str]]
         :param top: Number of records fetched per page.
         :type top: int
         :param op: Operator to apply between fields (ie: uuid=... OR tags=...)
         :type op: QueryOp
+        :param prefetch: (optional) Number of pages fetched ahead in the
+         background while the consumer processes the current one.
+        :type prefetch: int
+        :param windows: (optional) Number of sub-ranges the time range is
+         split into and searched concurrently (bounded by the client
+         pool size), records of different sub-ranges are consumed in no
+         particular order. Sub-ranges are contiguous, records of a
+         boundary second returned by both sub-ranges are consumed once
+         (eventTime is added to select to find them).
+        :type windows: int
+        :param stream: (optional) Parse each page incrementally and hand
+         records to the consumer as they are read, instead of loading
+         the whole page in memory (prefetch does not apply).
+        :type stream: bool
+        :param checkpoint: (optional) Store of the consumption progress,
+         a consumption interrupted by an error resumes after the last
+         consumed record, after a crash records of the page being
+         consumed may be consumed again (at-least-once), and a
+         completed one makes the next consumption start
+         where its time range ended (raises ValueError with windows
+         or stream).
+        :type checkpoint: Optional[CheckpointStore]
         :param fields: Field/value used to filter result (ie: uuid="123456")
         check Vision One API documentation for full list of supported fields.
         :type fields: Dict[str, str]
         :rtype: Result[ConsumeLinkableResp]:
         """
+        if checkpoint is not None and (windows > 1 or stream):
+            raise ValueError("checkpoint does not support windows or stream")
+        if windows > 1:
+            select = utils.window_select(select)
+            time_windows: List[Tuple[str, str]] = utils.split_time_range(
+                start_time, end_time, windows
+            )
+            return self._core.send_linkable_parallel(
+                project(ListEmailActivityResp, select),
+                Api.GET_EMAIL_ACTIVITY_DATA,
+                consumer,
+                [
+                    utils.build_activity_request(
+                        window_start,
+                        window_end,
+                        select,
+                        top,
+                        SearchMode.DEFAULT,
+                    )
+                    for window_start, window_end in time_windows
+                ],
+                prefetch=prefetch,
+                stream=stream,
+                boundaries=utils.window_boundaries(time_windows),
+                headers=utils.tmv1_activity_query(op, fields),
+            )
         return self._core.send_linkable(
-            ListEmailActivityResp,
+            project(ListEmailActivityResp, select),
             Api.GET_EMAIL_ACTIVITY_DATA,
             consumer,
+            prefetch=prefetch,
+            checkpoint=checkpoint,
+            stream=stream,
+            params=utils.build_activity_request(
+                start_time,
+                end_time,
+                select,
+                top,
+                SearchMode.DEFAULT,
+            ),
+            headers=utils.tmv1_activity_query(op, fields),
+        )
+
+    def consume_activity_batches(
+        self,
+        consumer: Callable[[Any], None],
+        start_time: Optional[str] = None,
+        end_time: Optional[str] = None,
+        select: Optional[List[str]] = None,
+        top: int = 500,
+        op: QueryOp = QueryOp.AND,
+        arrow: bool = False,
+        **fields: str,
+    ) -> Result[ConsumeLinkableResp]:
+        """Retrieves email activity data page by page as column oriented
+         batches filtered by provided values.
+
+        Each page is handed to the consumer as a dict of column name to
+        values (nested fields are flattened, ie: endpoint.ips) without
+        building a model per record, or as a pyarrow RecordBatch.
+
+        :param consumer: Function which will consume every batch in result.
+        :type consumer: Callable[[Dict[str, List[Any]]], None]
+        :param start_time: Date that indicates the start of the data retrieval
+        time range (yyyy-MM-ddThh:mm:ssZ).
+        Defaults to 24 hours before the request is made.
+        :type start_time: Optional[str]
+        :param end_time: Date that indicates the end of the data retrieval
+        time range (yyyy-MM-ddThh:mm:ssZ).
+        Defaults to the time the request is made.
+        :type end_time: Optional[str]
+        :param select: List of fields to include in the search results,
+        if no fields are specified, the query returns all supported fields.
+        Batches only hold the selected columns.
+        :type select: Optional[List[str]]
+        :param top: Number of records fetched per page.
+        :type top: int
+        :param op: Operator to apply between fields (ie: uuid=... OR tags=...))
+        :type op: QueryOp
+        :param arrow: (optional) Hand pyarrow RecordBatch to the consumer
+         instead of dicts (requires pytmv1[arrow]).
+        :type arrow: bool
+        :param fields: Field/value used to filter result (ie: uuid="123456"))
+        check Vision One API documentation for full list of supported fields.
+        :type fields: Dict[str, str]
+        :rtype: Result[ConsumeLinkableResp]:
+        """
+        return self._core.send_batches(
+            project(ListEmailActivityResp, select),
+            Api.GET_EMAIL_ACTIVITY_DATA,
+            consumer,
+            arrow=arrow,
+            params=utils.build_activity_request(
+                start_time,
+                end_time,
+                select,
+                top,
+                SearchMode.DEFAULT,
+            ),
+            headers=utils.tmv1_activity_query(op, fields),
+        )
+
+    def iter_activity(
+        self,
+        start_time: Optional[str] = None,
+        end_time: Optional[str] = None,
+        select: Optional[List[str]] = None,
+        top: int = 500,
+        op: QueryOp = QueryOp.AND,
+        **fields: str,
+    ) -> Iterator[EmailActivity]:
+        """Lazily iterates over email activity data in a paginated list
+         filtered by provided values.
+
+        :param start_time: Date that indicates the start of the data retrieval
+        time range (yyyy-MM-ddThh:mm:ssZ).
+        Defaults to 24 hours before the request is made.
+        :type start_time: Optional[str]
+        :param end_time: Date that indicates the end of the data retrieval
+        time range (yyyy-MM-ddThh:mm:ssZ).
+        Defaults to the time the request is made.
+        :type end_time: Optional[str]
+        :param select: List of fields to include in the search results,
+        if no fields are specified, the query returns all supported fields.
+        Records are parsed into a model declaring only the selected
+        fields (ie: EmailActivityProjection).
+        :type select: Optional[List[str]]
+        :param top: Number of records fetched per page.
+        :type top: int
+        :param op: Operator to apply between fields (ie: uuid=... OR tags=...)
+        :type op: QueryOp
+        :param fields: Field/value used to filter result (ie: uuid="123456")
+        check Vision One API documentation for full list of supported fields.
+        :type fields: Dict[str, str]
+        :rtype: Iterator[EmailActivity]
+        """
+        return self._core.iter_linkable(
+            project(ListEmailActivityResp, select),
+            Api.GET_EMAIL_ACTIVITY_DATA,
             params=utils.build_activity_request(
                 start_time,
                 end_time,
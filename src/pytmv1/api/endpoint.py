@@ -1,10 +1,12 @@
-from typing import Callable, List, Optional
+from typing import Any, Callable, Iterator, List, Optional, Tuple
 
 from .. import utils
+from ..checkpoint import CheckpointStore
 from ..core import Core
 from ..model.common import Endpoint as Ept
 from ..model.common import EndpointActivity, EndpointSecurityEndpoint
 from ..model.enum import Api, QueryOp, SearchMode
+from ..model.projection import project
 from ..model.request import (
     CollectFileRequest,
     EndpointRequest,
@@ -158,6 +160,8 @@ class Endpoint:
         :type end_time: Optional[str]
         :param select: List of fields to include in the search results,
         if no fields are specified, the query returns all supported fields.
+        Records are parsed into a model declaring only the selected
+        fields (ie: EndpointActivityProjection).
         :type select: Optional[List[str]]
         :param top: Number of records fetched per page.
         :type top: int
@@ -169,7 +173,7 @@ class Endpoint:
         :rtype: Result[GetEndpointActivityDataResp]:
         """
         return self._core.send(
-            ListEndpointActivityResp,
+            project(ListEndpointActivityResp, select),
             Api.GET_ENDPOINT_ACTIVITY_DATA,
             params=utils.build_activity_request(
                 start_time,
@@ -185,6 +189,7 @@ class Endpoint:
         self,
         consumer: Callable[[Ept], None],
         op: QueryOp,
+        prefetch: int = 0,
         **fields: str,
     ) -> Result[ConsumeLinkableResp]:
         """Retrieves and consume endpoints.
@@ -193,6 +198,9 @@ class Endpoint:
         :type consumer: Callable[[Endpoint], None]
         :param op: Query operator to apply.
         :type op: QueryOp
+        :param prefetch: (optional) Number of pages fetched ahead in the
+         background while the consumer processes the current one.
+        :type prefetch: int
         :param fields: Field/value used to filter result (i.e:ip="1.1.1.1")
         check Vision One API documentation for full list of supported fields.
         :type fields: Dict[str, str]
@@ -202,6 +210,27 @@ class Endpoint:
             ListEndpointDataResp,
             Api.GET_ENDPOINT_DATA,
             consumer,
+            prefetch=prefetch,
+            headers=utils.tmv1_query(op, fields),
+        )
+
+    def iter_data(
+        self,
+        op: QueryOp,
+        **fields: str,
+    ) -> Iterator[Ept]:
+        """Lazily iterates over endpoints.
+
+        :param op: Query operator to apply.
+        :type op: QueryOp
+        :param fields: Field/value used to filter result (i.e:ip="1.1.1.1")
+        check Vision One API documentation for full list of supported fields.
+        :type fields: Dict[str, str]
+        :rtype: Iterator[Endpoint]
+        """
+        return self._core.iter_linkable(
+            ListEndpointDataResp,
+            Api.GET_ENDPOINT_DATA,
             headers=utils.tmv1_query(op, fields),
         )
 
@@ -213,6 +242,10 @@ class Endpoint:
         select: Optional[List[str]] = None,
         top: int = 500,
         op: QueryOp = QueryOp.AND,
+        prefetch: int = 0,
+        windows: int = 1,
+        stream: bool = False,
+        checkpoint: Optional[CheckpointStore] = None,
         **fields: str,
     ) -> Result[ConsumeLinkableResp]:
         """Retrieves and consume endpoint activity data in a paginated list
@@ -230,20 +263,179 @@ class Endpoint:
         :type end_time: Optional[str]
         :param select: List of fields to include in the search results,
         if no fields are specified, the query returns all supported fields.
+        Records are parsed into a model declaring only the selected
+        fields (ie: EndpointActivityProjection).
         :type select: Optional[List[str]]
         :param top: Number of records fetched per page.
         :type top: int
         :param op: Operator to apply between fields (ie: dpt=... OR src=...)
         :type op: QueryOp
+        :param prefetch: (optional) Number of pages fetched ahead in the
+         background while the consumer processes the current one.
+        :type prefetch: int
+        :param windows: (optional) Number of sub-ranges the time range is
+         split into and searched concurrently (bounded by the client
+         pool size), records of different sub-ranges are consumed in no
+         particular order. Sub-ranges are contiguous, records of a
+         boundary second returned by both sub-ranges are consumed once
+         (eventTime is added to select to find them).
+        :type windows: int
+        :param stream: (optional) Parse each page incrementally and hand
+         records to the consumer as they are read, instead of loading
+         the whole page in memory (prefetch does not apply).
+        :type stream: bool
+        :param checkpoint: (optional) Store of the consumption progress,
+         a consumption interrupted by an error resumes after the last
+         consumed record, after a crash records of the page being
+         consumed may be consumed again (at-least-once), and a
+         completed one makes the next consumption start
+         where its time range ended (raises ValueError with windows
+         or stream).
+        :type checkpoint: Optional[CheckpointStore]
         :param fields: Field/value used to filter result (ie: dpt="443")
         check Vision One API documentation for full list of supported fields.
         :type fields: Dict[str, str]
         :rtype: Result[ConsumeLinkableResp]:
         """
+        if checkpoint is not None and (windows > 1 or stream):
+            raise ValueError("checkpoint does not support windows or stream")
+        if windows > 1:
+            select = utils.window_select(select)
+            time_windows: List[Tuple[str, str]] = utils.split_time_range(
+                start_time, end_time, windows
+            )
+            return self._core.send_linkable_parallel(
+                project(ListEndpointActivityResp, select),
+                Api.GET_ENDPOINT_ACTIVITY_DATA,
+                consumer,
+                [
+                    utils.build_activity_request(
+                        window_start,
+                        window_end,
+                        select,
+                        top,
+                        SearchMode.DEFAULT,
+                    )
+                    for window_start, window_end in time_windows
+                ],
+                prefetch=prefetch,
+                stream=stream,
+                boundaries=utils.window_boundaries(time_windows),
+                headers=utils.tmv1_activity_query(op, fields),
+            )
         return self._core.send_linkable(
-            ListEndpointActivityResp,
+            project(ListEndpointActivityResp, select),
             Api.GET_ENDPOINT_ACTIVITY_DATA,
             consumer,
+            prefetch=prefetch,
+            checkpoint=checkpoint,
+            stream=stream,
+            params=utils.build_activity_request(
+                start_time,
+                end_time,
+                select,
+                top,
+                SearchMode.DEFAULT,
+            ),
+            headers=utils.tmv1_activity_query(op, fields),
+        )
+
+    def consume_activity_batches(
+        self,
+        consumer: Callable[[Any], None],
+        start_time: Optional[str] = None,
+        end_time: Optional[str] = None,
+        select: Optional[List[str]] = None,
+        top: int = 500,
+        op: QueryOp = QueryOp.AND,
+        arrow: bool = False,
+        **fields: str,
+    ) -> Result[ConsumeLinkableResp]:
+        """Retrieves endpoint activity data page by page as column oriented
+         batches filtered by provided values.
+
+        Each page is handed to the consumer as a dict of column name to
+        values (nested fields are flattened, ie: endpoint.ips) without
+        building a model per record, or as a pyarrow RecordBatch.
+
+        :param consumer: Function which will consume every batch in result.
+        :type consumer: Callable[[Dict[str, List[Any]]], None]
+        :param start_time: Date that indicates the start of the data retrieval
+        time range (yyyy-MM-ddThh:mm:ssZ).
+        Defaults to 24 hours before the request is made.
+        :type start_time: Optional[str]
+        :param end_time: Date that indicates the end of the data retrieval
+        time range (yyyy-MM-ddThh:mm:ssZ).
+        Defaults to the time the request is made.
+        :type end_time: Optional[str]
+        :param select: List of fields to include in the search results,
+        if no fields are specified, the query returns all supported fields.
+        Batches only hold the selected columns.
+        :type select: Optional[List[str]]
+        :param top: Number of records fetched per page.
+        :type top: int
+        :param op: Operator to apply between fields (ie: dpt=... OR src=...))
+        :type op: QueryOp
+        :param arrow: (optional) Hand pyarrow RecordBatch to the consumer
+         instead of dicts (requires pytmv1[arrow]).
+        :type arrow: bool
+        :param fields: Field/value used to filter result (ie: dpt="443"))
+        check Vision One API documentation for full list of supported fields.
+        :type fields: Dict[str, str]
+        :rtype: Result[ConsumeLinkableResp]:
+        """
+        return self._core.send_batches(
+            project(ListEndpointActivityResp, select),
+            Api.GET_ENDPOINT_ACTIVITY_DATA,
+            consumer,
+            arrow=arrow,
+            params=utils.build_activity_request(
+                start_time,
+                end_time,
+                select,
+                top,
+                SearchMode.DEFAULT,
+            ),
+            headers=utils.tmv1_activity_query(op, fields),
+        )
+
+    def iter_activity(
+        self,
+        start_time: Optional[str] = None,
+        end_time: Optional[str] = None,
+        select: Optional[List[str]] = None,
+        top: int = 500,
+        op: QueryOp = QueryOp.AND,
+        **fields: str,
+    ) -> Iterator[EndpointActivity]:
+        """Lazily iterates over endpoint activity data in a paginated list
+         filtered by provided values.
+
+        :param start_time: Date that indicates the start of the data retrieval
+        time range (yyyy-MM-ddThh:mm:ssZ).
+        Defaults to 24 hours before the request is made.
+        :type start_time: Optional[str]
+        :param end_time: Date that indicates the end of the data retrieval
+        time range (yyyy-MM-ddThh:mm:ssZ).
+        Defaults to the time the request is made.
+        :type end_time: Optional[str]
+        :param select: List of fields to include in the search results,
+        if no fields are specified, the query returns all supported fields.
+        Records are parsed into a model declaring only the selected
+        fields (ie: EndpointActivityProjection).
+        :type select: Optional[List[str]]
+        :param top: Number of records fetched per page.
+        :type top: int
+        :param op: Operator to apply between fields (ie: dpt=... OR src=...)
+        :type op: QueryOp
+        :param fields: Field/value used to filter result (ie: dpt="443")
+        check Vision One API documentation for full list of supported fields.
+        :type fields: Dict[str, str]
+        :rtype: Iterator[EndpointActivity]
+        """
+        return self._core.iter_linkable(
+            project(ListEndpointActivityResp, select),
+            Api.GET_ENDPOINT_ACTIVITY_DATA,
             params=utils.build_activity_request(
                 start_time,
                 end_time,
@@ -255,17 +447,15 @@ class Endpoint:
         )
 
     def get_endpoint(self, endpoint_id: str) -> Result[GetEndpointDetailsResp]:
-        """Displays the detailed profile of the specified endpoint.
+        """Displays the detailed profile of the specified endpoint, served
+        from the endpoint cache of the client when it holds it.
 
         :param endpoint_id: The ID of the endpoint
         on the Vision One platform.
         :type endpoint_id: str
         :rtype: Result[GetEndpointDetailsResp]
         """
-        return self._core.send(
-            GetEndpointDetailsResp,
-            Api.GET_ENDPOINT_DETAILS.value.format(endpoint_id),
-        )
+        return self._core.send_endpoint_details(endpoint_id)
 
     def list_endpoints(
         self,
@@ -313,9 +503,11 @@ class Endpoint:
         top: int = 100,
         order_by: Optional[str] = None,
         op: QueryOp = QueryOp.AND,
+        prefetch: int = 0,
         **fields: str,
     ) -> Result[ConsumeLinkableResp]:
-        """Retrieves and consume endpoint security endpoints.
+        """Retrieves and consume endpoint security endpoints, consumed
+        endpoints warm the endpoint cache of the client up when it holds it.
 
         :param consumer: Function which will consume every record in result.
         :type consumer: Callable[[EndpointSecurityEndpoint], None]
@@ -329,6 +521,9 @@ class Endpoint:
         :type order_by: Optional[str]
         :param op: Query operator to apply.
         :type op: QueryOp
+        :param prefetch: (optional) Number of pages fetched ahead in the
+         background while the consumer processes the current one.
+        :type prefetch: int
         :param fields: Field/value used to filter result
         (i.e: osPlatform="windows"),
         check Vision One API documentation for full list of supported fields.
@@ -339,6 +534,46 @@ class Endpoint:
             ListEndpointSecurityResp,
             Api.GET_ENDPOINT_LIST,
             consumer,
+            prefetch=prefetch,
+            params=utils.filter_none(
+                {
+                    "select": ",".join(select) if select else None,
+                    "top": top,
+                    "orderBy": order_by,
+                }
+            ),
+            headers=utils.tmv1_filter(op, fields),
+        )
+
+    def iter_endpoints(
+        self,
+        select: Optional[List[str]] = None,
+        top: int = 100,
+        order_by: Optional[str] = None,
+        op: QueryOp = QueryOp.AND,
+        **fields: str,
+    ) -> Iterator[EndpointSecurityEndpoint]:
+        """Lazily iterates over endpoint security endpoints.
+
+        :param select: List of endpoint information fields to include
+        in the response; if no fields are specified, all fields are returned.
+        :type select: Optional[List[str]]
+        :param top: Number of records displayed on a page.
+        :type top: int
+        :param order_by: Field by which the results are sorted
+        (e.g. "agentGuid desc").
+        :type order_by: Optional[str]
+        :param op: Query operator to apply.
+        :type op: QueryOp
+        :param fields: Field/value used to filter result
+        (i.e: osPlatform="windows"),
+        check Vision One API documentation for full list of supported fields.
+        :type fields: Dict[str, str]
+        :rtype: Iterator[EndpointSecurityEndpoint]
+        """
+        return self._core.iter_linkable(
+            ListEndpointSecurityResp,
+            Api.GET_ENDPOINT_LIST,
             params=utils.filter_none(
                 {
                     "select": ",".join(select) if select else None,
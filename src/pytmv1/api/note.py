@@ -1,4 +1,4 @@
-from typing import Callable, Optional
+from typing import Callable, Iterator, Optional
 
 from .. import utils
 from ..core import Core
@@ -182,3 +182,45 @@ class Note:
             ),
             headers=utils.tmv1_filter(op, fields),
         )
+
+    def iter(
+        self,
+        alert_id: str,
+        top: int = 50,
+        start_time: Optional[str] = None,
+        end_time: Optional[str] = None,
+        op: QueryOp = QueryOp.AND,
+        **fields: str,
+    ) -> Iterator[AlertNote]:
+        """Lazily iterates over workbench alert notes.
+
+        :param alert_id: Workbench alert id.
+        :type alert_id: str
+        :param top: Number of records fetched per page.
+        :type top: int
+        :param start_time: Date that indicates the start of the data retrieval
+        time range (yyyy-MM-ddThh:mm:ssZ).
+        :type start_time: Optional[str]
+        :param end_time: Date that indicates the end of the data retrieval
+        time range (yyyy-MM-ddThh:mm:ssZ).
+        :type end_time: Optional[str]
+        :param op: Operator to apply between fields (ie: ... OR ...).
+        :type op: QueryOp
+        :param fields: Field/value used to filter result (i.e:id="1"),
+        check Vision One API documentation for full list of supported fields.
+        :type fields: Dict[str, str]
+        :rtype: Iterator[AlertNote]
+        """
+        return self._core.iter_linkable(
+            ListAlertNoteResp,
+            Api.GET_ALERT_NOTE_LIST.value.format(alert_id),
+            params=utils.filter_none(
+                {
+                    "startDateTime": start_time,
+                    "endDateTime": end_time,
+                    "orderBy": "createdDateTime desc",
+                    "top": top,
+                }
+            ),
+            headers=utils.tmv1_filter(op, fields),
+        )
@@ -1,6 +1,7 @@
-from typing import Callable, List, Optional
+from typing import Any, Callable, Iterator, List, Optional
 
 from .. import utils
+from ..checkpoint import CheckpointStore
 from ..core import Core
 from ..model.common import OatEvent, OatPackage
 from ..model.enum import Api, HttpMethod, OatRiskLevel, QueryOp
@@ -15,7 +16,8 @@ from ..model.response import (
     NoContentResp,
     OatPipelineResp,
 )
-from ..result import MultiResult, Result
+from ..result import MultiResult, Result, ResultCode
+from ..sync import IncrementalSync
 
 
 class Oat:
@@ -83,6 +85,9 @@ class Oat:
         ingested_end_date_time: Optional[str] = None,
         top: int = 50,
         op: QueryOp = QueryOp.AND,
+        prefetch: int = 0,
+        stream: bool = False,
+        checkpoint: Optional[CheckpointStore] = None,
         **fields: str,
     ) -> Result[ConsumeLinkableResp]:
         """Retrieves and consume OAT events.
@@ -107,6 +112,20 @@ class Oat:
         :type top: int
         :param op: Operator to apply between fields (ie: ... OR ...).
         :type op: QueryOp
+        :param prefetch: (optional) Number of pages fetched ahead in the
+         background while the consumer processes the current one.
+        :type prefetch: int
+        :param stream: (optional) Parse each page incrementally and hand
+         records to the consumer as they are read, instead of loading
+         the whole page in memory (prefetch does not apply).
+        :type stream: bool
+        :param checkpoint: (optional) Store of the consumption progress,
+         a consumption interrupted by an error resumes after the last
+         consumed record, after a crash records of the page being
+         consumed may be consumed again (at-least-once), and a
+         completed one makes the next consumption start
+         where its time range ended (stream does not apply).
+        :type checkpoint: Optional[CheckpointStore]
         :param fields: Field/value used to filter result (i.e:uuid="123"),
         check Vision One API documentation for full list of supported fields.
         :type fields: Dict[str, str]
@@ -116,6 +135,179 @@ class Oat:
             ListOatsResp,
             Api.GET_OAT_LIST,
             consumer,
+            prefetch=prefetch,
+            checkpoint=checkpoint,
+            time_range=("detectedStartDateTime", "detectedEndDateTime"),
+            stream=stream,
+            params=utils.filter_none(
+                {
+                    "detectedStartDateTime": detected_start_date_time,
+                    "detectedEndDateTime": detected_end_date_time,
+                    "ingestedStartDateTime": ingested_start_date_time,
+                    "ingestedEndDateTime": ingested_end_date_time,
+                    "top": top,
+                }
+            ),
+            headers=utils.tmv1_filter(op, fields),
+        )
+
+    def sync(
+        self,
+        consumer: Callable[[OatEvent], None],
+        state: IncrementalSync,
+        ingested_start_date_time: Optional[str] = None,
+        top: int = 50,
+        op: QueryOp = QueryOp.AND,
+        prefetch: int = 0,
+        **fields: str,
+    ) -> Result[ConsumeLinkableResp]:
+        """Consumes the OAT events ingested since the previous sync.
+
+        :param consumer: Function which will consume every new record.
+        :type consumer: Callable[[OatEvent], None]
+        :param state: Watermark and already consumed events, to reuse
+         across syncs.
+        :type state: IncrementalSync
+        :param ingested_start_date_time: Date that indicates the start of
+        the data ingestion time range of the first sync
+        (yyyy-MM-ddThh:mm:ssZ), ignored once a watermark is saved.
+        :type ingested_start_date_time: Optional[str]
+        :param top: Number of records displayed on a page.
+        :type top: int
+        :param op: Operator to apply between fields (ie: ... OR ...).
+        :type op: QueryOp
+        :param prefetch: (optional) Number of pages fetched ahead in the
+         background while the consumer processes the current one.
+        :type prefetch: int
+        :param fields: Field/value used to filter result (i.e:uuid="123"),
+        check Vision One API documentation for full list of supported fields.
+        :type fields: Dict[str, str]
+        :rtype: Result[ConsumeLinkableResp]
+        """
+        result: Result[ConsumeLinkableResp] = self._core.send_linkable(
+            ListOatsResp,
+            Api.GET_OAT_LIST,
+            state.track(
+                consumer,
+                lambda oat: oat.uuid,
+                lambda oat: oat.ingested_date_time,
+            ),
+            prefetch=prefetch,
+            params=utils.filter_none(
+                {
+                    "ingestedStartDateTime": state.start_time(
+                        ingested_start_date_time
+                    ),
+                    "top": top,
+                }
+            ),
+            headers=utils.tmv1_filter(op, fields),
+        )
+        if result.result_code == ResultCode.SUCCESS:
+            state.commit()
+        return result
+
+    def consume_batches(
+        self,
+        consumer: Callable[[Any], None],
+        detected_start_date_time: Optional[str] = None,
+        detected_end_date_time: Optional[str] = None,
+        ingested_start_date_time: Optional[str] = None,
+        ingested_end_date_time: Optional[str] = None,
+        top: int = 50,
+        op: QueryOp = QueryOp.AND,
+        arrow: bool = False,
+        **fields: str,
+    ) -> Result[ConsumeLinkableResp]:
+        """Retrieves OAT events page by page as column oriented batches.
+
+        Each page is handed to the consumer as a dict of column name to
+        values (nested fields are flattened, ie: endpoint.ips) without
+        building a model per record, or as a pyarrow RecordBatch.
+
+        :param consumer: Function which will consume every batch in result.
+        :type consumer: Callable[[Dict[str, List[Any]]], None]
+        :param detected_start_date_time: Date that indicates the start of
+        the event detection data retrieval time range (yyyy-MM-ddThh:mm:ssZ).
+        Defaults to 24 hours before the request is made.
+        :type detected_start_date_time: Optional[str]
+        :param detected_end_date_time: Date that indicates the end of
+        the event detection data retrieval time range (yyyy-MM-ddThh:mm:ssZ).
+        Defaults to the time the request is made.
+        :type detected_end_date_time: Optional[str]
+        :param ingested_start_date_time: Date that indicates the start of
+        the data ingestion time range (yyyy-MM-ddThh:mm:ssZ).
+        :type ingested_start_date_time: Optional[str]
+        :param ingested_end_date_time: Date that indicates the end of
+        the data ingestion time range (yyyy-MM-ddThh:mm:ssZ).
+        :type ingested_end_date_time: Optional[str]
+        :param top: Number of records displayed on a page.
+        :type top: int
+        :param op: Operator to apply between fields (ie: ... OR ...).
+        :type op: QueryOp
+        :param arrow: (optional) Hand pyarrow RecordBatch to the consumer
+         instead of dicts (requires pytmv1[arrow]).
+        :type arrow: bool
+        :param fields: Field/value used to filter result (i.e:uuid="123"),
+        check Vision One API documentation for full list of supported fields.
+        :type fields: Dict[str, str]
+        :rtype: Result[ConsumeLinkableResp]
+        """
+        return self._core.send_batches(
+            ListOatsResp,
+            Api.GET_OAT_LIST,
+            consumer,
+            arrow=arrow,
+            params=utils.filter_none(
+                {
+                    "detectedStartDateTime": detected_start_date_time,
+                    "detectedEndDateTime": detected_end_date_time,
+                    "ingestedStartDateTime": ingested_start_date_time,
+                    "ingestedEndDateTime": ingested_end_date_time,
+                    "top": top,
+                }
+            ),
+            headers=utils.tmv1_filter(op, fields),
+        )
+
+    def iter(
+        self,
+        detected_start_date_time: Optional[str] = None,
+        detected_end_date_time: Optional[str] = None,
+        ingested_start_date_time: Optional[str] = None,
+        ingested_end_date_time: Optional[str] = None,
+        top: int = 50,
+        op: QueryOp = QueryOp.AND,
+        **fields: str,
+    ) -> Iterator[OatEvent]:
+        """Lazily iterates over OAT events.
+
+        :param detected_start_date_time: Date that indicates the start of
+        the event detection data retrieval time range (yyyy-MM-ddThh:mm:ssZ).
+        Defaults to 24 hours before the request is made.
+        :type detected_start_date_time: Optional[str]
+        :param detected_end_date_time: Date that indicates the end of
+        the event detection data retrieval time range (yyyy-MM-ddThh:mm:ssZ).
+        Defaults to the time the request is made.
+        :type detected_end_date_time: Optional[str]
+        :param ingested_start_date_time: Date that indicates the start of
+        the data ingestion time range (yyyy-MM-ddThh:mm:ssZ).
+        :type ingested_start_date_time: Optional[str]
+        :param ingested_end_date_time: Date that indicates the end of
+        the data ingestion time range (yyyy-MM-ddThh:mm:ssZ).
+        :type ingested_end_date_time: Optional[str]
+        :param top: Number of records displayed on a page.
+        :type top: int
+        :param op: Operator to apply between fields (ie: ... OR ...).
+        :type op: QueryOp
+        :param fields: Field/value used to filter result (i.e:uuid="123"),
+        check Vision One API documentation for full list of supported fields.
+        :type fields: Dict[str, str]
+        :rtype: Iterator[OatEvent]
+        """
+        return self._core.iter_linkable(
+            ListOatsResp,
+            Api.GET_OAT_LIST,
             params=utils.filter_none(
                 {
                     "detectedStartDateTime": detected_start_date_time,
@@ -285,6 +477,7 @@ class Oat:
         start_date_time: Optional[str] = None,
         end_date_time: Optional[str] = None,
         top: int = 500,
+        prefetch: int = 0,
     ) -> Result[ConsumeLinkableResp]:
         """Displays and consume all the available packages from a data pipeline
          in a paginated list.
@@ -301,12 +494,50 @@ class Oat:
         :type end_date_time: Optional[str]
         :param top: Number of records displayed on a page.
         :type top: int
+        :param prefetch: (optional) Number of pages fetched ahead in the
+         background while the consumer processes the current one.
+        :type prefetch: int
         :return: Result[ConsumeLinkableResp]
         """
         return self._core.send_linkable(
             ListOatPackagesResp,
             Api.LIST_OAT_PACKAGE.value.format(pipeline_id),
             consumer,
+            prefetch=prefetch,
+            params=utils.filter_none(
+                {
+                    "startDateTime": start_date_time,
+                    "endDateTime": end_date_time,
+                    "top": top,
+                }
+            ),
+        )
+
+    def iter_packages(
+        self,
+        pipeline_id: str,
+        start_date_time: Optional[str] = None,
+        end_date_time: Optional[str] = None,
+        top: int = 500,
+    ) -> Iterator[OatPackage]:
+        """Lazily iterates over all the available packages
+        from a data pipeline.
+
+        :param pipeline_id: Pipeline ID.
+        :type pipeline_id: str
+        :param start_date_time: Date that indicates the start of
+        the data retrieval time range. (yyyy-MM-ddThh:mm:ssZ).
+        :type start_date_time: Optional[str]
+        :param end_date_time: Date that indicates the end of
+        the data retrieval time range. (yyyy-MM-ddThh:mm:ssZ).
+        :type end_date_time: Optional[str]
+        :param top: Number of records displayed on a page.
+        :type top: int
+        :return: Iterator[OatPackage]
+        """
+        return self._core.iter_linkable(
+            ListOatPackagesResp,
+            Api.LIST_OAT_PACKAGE.value.format(pipeline_id),
             params=utils.filter_none(
                 {
                     "startDateTime": start_date_time,
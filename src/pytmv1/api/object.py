@@ -1,4 +1,4 @@
-from typing import Callable
+from typing import Callable, Iterator
 
 from .. import utils
 from ..core import Core
@@ -135,6 +135,15 @@ class Object:
             ListExceptionsResp, Api.GET_EXCEPTION_OBJECTS, consumer
         )
 
+    def iter_exception(self) -> Iterator[ExceptionObject]:
+        """Lazily iterates over exception objects.
+
+        :rtype: Iterator[ExceptionObject]
+        """
+        return self._core.iter_linkable(
+            ListExceptionsResp, Api.GET_EXCEPTION_OBJECTS
+        )
+
     def consume_suspicious(
         self, consumer: Callable[[SuspiciousObject], None]
     ) -> Result[ConsumeLinkableResp]:
@@ -147,3 +156,12 @@ class Object:
         return self._core.send_linkable(
             ListSuspiciousResp, Api.GET_SUSPICIOUS_OBJECTS, consumer
         )
+
+    def iter_suspicious(self) -> Iterator[SuspiciousObject]:
+        """Lazily iterates over suspicious objects.
+
+        :rtype: Iterator[SuspiciousObject]
+        """
+        return self._core.iter_linkable(
+            ListSuspiciousResp, Api.GET_SUSPICIOUS_OBJECTS
+        )
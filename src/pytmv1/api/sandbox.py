@@ -11,6 +11,7 @@ from ..model.response import (
     SandboxSubmissionStatusResp,
     SubmitFileToSandboxResp,
 )
+from ..poll import PollStrategy
 from ..result import MultiResult, Result
 
 
@@ -73,6 +74,7 @@ class Sandbox:
         submit_id: str,
         poll: bool = True,
         poll_time_sec: float = 1800,
+        poll_strategy: Optional[PollStrategy] = None,
     ) -> Result[BytesResp]:
         """Downloads the analysis results of the specified object as PDF.
 
@@ -84,6 +86,9 @@ class Sandbox:
         :param poll_time_sec: Maximum time to wait for the result to
          be available.
         :type poll_time_sec: float
+        :param poll_strategy: (optional) Delays between status checks,
+         defaults to the strategy of the client.
+        :type poll_strategy: Optional[PollStrategy]
         :rtype: Result[BytesResp]:
         """
         return self._core.send_sandbox_result(
@@ -92,6 +97,7 @@ class Sandbox:
             submit_id,
             poll,
             poll_time_sec,
+            poll_strategy,
         )
 
     def download_investigation_package(
@@ -99,6 +105,7 @@ class Sandbox:
         submit_id: str,
         poll: bool = True,
         poll_time_sec: float = 1800,
+        poll_strategy: Optional[PollStrategy] = None,
     ) -> Result[BytesResp]:
         """Downloads the Investigation Package of the specified object.
 
@@ -110,6 +117,9 @@ class Sandbox:
         :param poll_time_sec: Maximum time to wait for the result to
          be available.
         :type poll_time_sec: float
+        :param poll_strategy: (optional) Delays between status checks,
+         defaults to the strategy of the client.
+        :type poll_strategy: Optional[PollStrategy]
         :rtype: Result[BytesResp]:
         """
         return self._core.send_sandbox_result(
@@ -118,6 +128,7 @@ class Sandbox:
             submit_id,
             poll,
             poll_time_sec,
+            poll_strategy,
         )
 
     def get_analysis_result(
@@ -125,6 +136,7 @@ class Sandbox:
         submit_id: str,
         poll: bool = True,
         poll_time_sec: float = 1800,
+        poll_strategy: Optional[PollStrategy] = None,
     ) -> Result[SandboxAnalysisResultResp]:
         """Retrieves the analysis results of the specified object.
 
@@ -136,6 +148,9 @@ class Sandbox:
         :param poll_time_sec: Maximum time to wait for the result
          to be available.
         :type poll_time_sec: float
+        :param poll_strategy: (optional) Delays between status checks,
+         defaults to the strategy of the client.
+        :type poll_strategy: Optional[PollStrategy]
         :rtype: Result[SandboxAnalysisResultResp]:
         """
         return self._core.send_sandbox_result(
@@ -144,6 +159,7 @@ class Sandbox:
             submit_id,
             poll,
             poll_time_sec,
+            poll_strategy,
         )
 
     def get_submission_status(
@@ -165,6 +181,7 @@ class Sandbox:
         submit_id: str,
         poll: bool = True,
         poll_time_sec: float = 1800,
+        poll_strategy: Optional[PollStrategy] = None,
     ) -> Result[ListSandboxSuspiciousResp]:
         """Retrieves the suspicious object list associated to the
         specified object.
@@ -177,6 +194,9 @@ class Sandbox:
         :param poll_time_sec: Maximum time to wait for the result
          to be available.
         :type poll_time_sec: float
+        :param poll_strategy: (optional) Delays between status checks,
+         defaults to the strategy of the client.
+        :type poll_strategy: Optional[PollStrategy]
         :rtype: Result[SandboxSuspiciousListResp]:
         """
         return self._core.send_sandbox_result(
@@ -185,4 +205,5 @@ class Sandbox:
             submit_id,
             poll,
             poll_time_sec,
+            poll_strategy,
         )
@@ -1,4 +1,4 @@
-from typing import Callable, Optional
+from typing import Callable, Iterator, Optional
 
 from .. import utils
 from ..core import Core
@@ -178,3 +178,23 @@ class CustomScript:
             consumer,
             params=utils.filter_query(op, fields),
         )
+
+    def iter(
+        self,
+        op: QueryOp = QueryOp.AND,
+        **fields: str,
+    ) -> Iterator[Script]:
+        """Lazily iterates over cust. scripts filtered by provided values.
+
+        :param op: Operator to apply between fields (ie: ... OR ...).
+        :type op: QueryOp
+        :param fields: Field/value used to filter result (i.e:fileName="1.sh"),
+        check Vision One API documentation for full list of supported fields.
+        :type fields: Dict[str, str]
+        :return: Iterator[Script]
+        """
+        return self._core.iter_linkable(
+            ListCustomScriptsResp,
+            Api.GET_CUSTOM_SCRIPTS,
+            params=utils.filter_query(op, fields),
+        )
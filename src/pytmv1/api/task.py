@@ -1,7 +1,8 @@
-from typing import Type
+from typing import Iterator, Optional, Tuple, Type
 
 from ..core import Core
 from ..model.response import BaseTaskResp, T
+from ..poll import PollStrategy
 from ..result import Result
 
 
@@ -16,6 +17,7 @@ class Task:
         task_id: str,
         poll: bool = True,
         poll_time_sec: float = 1800,
+        poll_strategy: Optional[PollStrategy] = None,
     ) -> Result[BaseTaskResp]:
         """Retrieves the result of a response task.
 
@@ -27,10 +29,13 @@ class Task:
         :param poll_time_sec: Maximum time to wait for the result
         to be available.
         :type poll_time_sec: float
+        :param poll_strategy: (optional) Delays between status checks,
+         defaults to the strategy of the client.
+        :type poll_strategy: Optional[PollStrategy]
         :rtype: Result[T]:
         """
         return self.get_result_class(
-            task_id, BaseTaskResp, poll, poll_time_sec
+            task_id, BaseTaskResp, poll, poll_time_sec, poll_strategy
         )
 
     def get_result_class(
@@ -39,6 +44,7 @@ class Task:
         class_: Type[T],
         poll: bool = True,
         poll_time_sec: float = 1800,
+        poll_strategy: Optional[PollStrategy] = None,
     ) -> Result[T]:
         """Retrieves the result of a response task.
 
@@ -52,8 +58,39 @@ class Task:
         :param poll_time_sec: Maximum time to wait for the result
         to be available.
         :type poll_time_sec: float
+        :param poll_strategy: (optional) Delays between status checks,
+         defaults to the strategy of the client.
+        :type poll_strategy: Optional[PollStrategy]
         :rtype: Result[T]:
         """
         return self._core.send_task_result(
-            class_, task_id, poll, poll_time_sec
+            class_, task_id, poll, poll_time_sec, poll_strategy
+        )
+
+    def wait_all(
+        self,
+        *task_ids: str,
+        poll_time_sec: float = 1800,
+        poll_strategy: Optional[PollStrategy] = None,
+    ) -> Iterator[Tuple[str, Result[BaseTaskResp]]]:
+        """Polls the results of many response tasks together and yields
+        every result as soon as its task is finished.
+
+        All pending tasks are checked at once following a single poll
+        strategy, results are yielded in completion order along with their
+        task id. Tasks still running after poll_time_sec are yielded with
+        their last status.
+
+        :param task_ids: Task id(s).
+        :type task_ids: Tuple[str, ...]
+        :param poll_time_sec: Maximum time to wait for all the results
+        to be available.
+        :type poll_time_sec: float
+        :param poll_strategy: (optional) Delays between status checks,
+         defaults to the strategy of the client.
+        :type poll_strategy: Optional[PollStrategy]
+        :rtype: Iterator[Tuple[str, Result[BaseTaskResp]]]
+        """
+        return self._core.iter_task_results(
+            BaseTaskResp, list(task_ids), poll_time_sec, poll_strategy
         )
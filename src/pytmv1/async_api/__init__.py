@@ -0,0 +1,27 @@
+from .account import Account
+from .alert import Alert
+from .api_key import ApiKey
+from .email import Email
+from .endpoint import Endpoint
+from .note import Note
+from .oat import Oat
+from .object import Object
+from .sandbox import Sandbox
+from .script import CustomScript
+from .system import System
+from .task import Task
+
+__all__ = [
+    "Account",
+    "Alert",
+    "ApiKey",
+    "CustomScript",
+    "Email",
+    "Endpoint",
+    "Note",
+    "Oat",
+    "Object",
+    "Sandbox",
+    "System",
+    "Task",
+]
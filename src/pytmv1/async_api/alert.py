@@ -0,0 +1,273 @@
+from typing import AsyncIterator, Awaitable, Callable, Optional, Union
+
+from .. import utils
+from ..async_core import AsyncCore
+from ..checkpoint import CheckpointStore
+from ..model.common import SaeAlert, TiAlert
+from ..model.enum import (
+    AlertStatus,
+    Api,
+    HttpMethod,
+    InvestigationResult,
+    InvestigationStatus,
+    QueryOp,
+)
+from ..model.response import (
+    ConsumeLinkableResp,
+    GetAlertResp,
+    ListAlertsResp,
+    NoContentResp,
+)
+from ..result import Result, ResultCode
+from ..sync import IncrementalSync
+
+
+class Alert:
+    _core: AsyncCore
+
+    def __init__(self, core: AsyncCore):
+        self._core = core
+
+    async def update_status(
+        self,
+        alert_id: str,
+        etag: str,
+        status: Optional[AlertStatus] = None,
+        inv_result: Optional[InvestigationResult] = None,
+        inv_status: Optional[InvestigationStatus] = None,
+    ) -> Result[NoContentResp]:
+        """Edit the status of an alert or investigation triggered in Workbench.
+
+        :param alert_id: Workbench alert id.
+        :type alert_id: str
+        :param status: Status of a case or investigation.
+        :type status: Optional[AlertStatus]
+        :param inv_result: Findings of a case or investigation.
+        :type inv_result: Optional[InvestigationResult]
+        :param inv_status: (deprecated) Status of an investigation.
+        :type inv_status: Optional[InvestigationStatus]
+        :param etag: Target resource will be updated only if
+         it matches ETag of the target one.
+        :type etag: str
+        :rtype: Result[NoContentResp]:
+        """
+        return await self._core.send(
+            NoContentResp,
+            Api.UPDATE_ALERT_STATUS.value.format(alert_id),
+            HttpMethod.PATCH,
+            json=utils.filter_none(
+                {
+                    "status": status,
+                    "investigationResult": inv_result,
+                    "investigationStatus": inv_status,
+                }
+            ),
+            headers={
+                "If-Match": etag if etag.startswith('"') else '"' + etag + '"'
+            },
+        )
+
+    async def get(self, alert_id: str) -> Result[GetAlertResp]:
+        """Displays information about the specified alert.
+
+        :param alert_id: Workbench alert id.
+        :type alert_id: str
+        :rtype: Result[GetAlertDetailsResp]:
+        """
+        return await self._core.send(
+            GetAlertResp,
+            Api.GET_ALERT.value.format(alert_id),
+        )
+
+    async def list(
+        self,
+        start_time: Optional[str] = None,
+        end_time: Optional[str] = None,
+        op: QueryOp = QueryOp.AND,
+        **fields: str,
+    ) -> Result[ListAlertsResp]:
+        """Retrieves workbench alerts in a paginated list.
+
+        :param start_time: Date that indicates the start of the data retrieval
+        time range (yyyy-MM-ddThh:mm:ssZ).
+        Defaults to 24 hours before the request is made.
+        :type start_time: Optional[str]
+        :param end_time: Date that indicates the end of the data retrieval
+        time range (yyyy-MM-ddThh:mm:ssZ).
+        Defaults to the time the request is made.
+        :type end_time: Optional[str]
+        :param op: Operator to apply between fields (ie: ... OR ...).
+        :type op: QueryOp
+        :param fields: Field/value used to filter result (i.e:fileName="1.sh"),
+        check Vision One API documentation for full list of supported fields.
+        :type fields: Dict[str, str]
+        :rtype: Result[GetAlertListResp]:
+        """
+        return await self._core.send(
+            ListAlertsResp,
+            Api.GET_ALERT_LIST,
+            params=utils.filter_none(
+                {
+                    "startDateTime": start_time,
+                    "endDateTime": end_time,
+                    "orderBy": "createdDateTime desc",
+                }
+            ),
+            headers=utils.tmv1_filter(op, fields),
+        )
+
+    async def consume(
+        self,
+        consumer: Callable[
+            [Union[SaeAlert, TiAlert]], Optional[Awaitable[None]]
+        ],
+        start_time: Optional[str] = None,
+        end_time: Optional[str] = None,
+        date_time_target: Optional[str] = "createdDateTime",
+        op: QueryOp = QueryOp.AND,
+        prefetch: int = 0,
+        checkpoint: Optional[CheckpointStore] = None,
+        **fields: str,
+    ) -> Result[ConsumeLinkableResp]:
+        """Retrieves and consume workbench alerts.
+
+        :param consumer: Function which will consume every record in result.
+        :type consumer: Callable[[Union[SaeAlert, TiAlert]],
+         Optional[Awaitable[None]]]
+        :param start_time: Date that indicates the start of the data retrieval
+        time range (yyyy-MM-ddThh:mm:ssZ).
+        Defaults to 24 hours before the request is made.
+        :type start_time: Optional[str]
+        :param end_time: Date that indicates the end of the data retrieval
+        time range (yyyy-MM-ddThh:mm:ssZ).
+        Defaults to the time the request is made.
+        :type end_time: Optional[str]
+        :param op: Operator to apply between fields (ie: ... OR ...).
+        :type op: QueryOp
+        :param prefetch: (optional) Number of pages fetched ahead in the
+         background while the consumer processes the current one.
+        :type prefetch: int
+        :param checkpoint: (optional) Store of the consumption progress,
+         a consumption interrupted by an error resumes after the last
+         consumed record, after a crash records of the page being
+         consumed may be consumed again (at-least-once), and a
+         completed one makes the next consumption start
+         where its time range ended.
+        :type checkpoint: Optional[CheckpointStore]
+        :param fields: Field/value used to filter result (i.e:fileName="1.sh"),
+        check Vision One API documentation for full list of supported fields.
+        :type fields: Dict[str, str]
+        :rtype: Result[ConsumeLinkableResp]:
+        """
+        return await self._core.send_linkable(
+            ListAlertsResp,
+            Api.GET_ALERT_LIST,
+            consumer,
+            prefetch=prefetch,
+            checkpoint=checkpoint,
+            params=utils.filter_none(
+                {
+                    "startDateTime": start_time,
+                    "endDateTime": end_time,
+                    "dateTimeTarget": date_time_target,
+                    "orderBy": "createdDateTime desc",
+                }
+            ),
+            headers=utils.tmv1_filter(op, fields),
+        )
+
+    async def sync(
+        self,
+        consumer: Callable[
+            [Union[SaeAlert, TiAlert]], Optional[Awaitable[None]]
+        ],
+        state: IncrementalSync,
+        start_time: Optional[str] = None,
+        op: QueryOp = QueryOp.AND,
+        prefetch: int = 0,
+        **fields: str,
+    ) -> Result[ConsumeLinkableResp]:
+        """Consumes the workbench alerts created or updated since the
+        previous sync, an updated alert is consumed again.
+
+        :param consumer: Function which will consume every new record.
+        :type consumer: Callable[[Union[SaeAlert, TiAlert]],
+         Optional[Awaitable[None]]]
+        :param state: Watermark and already consumed alerts, to reuse
+         across syncs.
+        :type state: IncrementalSync
+        :param start_time: Date that indicates the start of the first sync
+        (yyyy-MM-ddThh:mm:ssZ), ignored once a watermark is saved.
+        Defaults to 24 hours before the request is made.
+        :type start_time: Optional[str]
+        :param op: Operator to apply between fields (ie: ... OR ...).
+        :type op: QueryOp
+        :param prefetch: (optional) Number of pages fetched ahead in the
+         background while the consumer processes the current one.
+        :type prefetch: int
+        :param fields: Field/value used to filter result (i.e:fileName="1.sh"),
+        check Vision One API documentation for full list of supported fields.
+        :type fields: Dict[str, str]
+        :rtype: Result[ConsumeLinkableResp]:
+        """
+        result: Result[ConsumeLinkableResp] = await self._core.send_linkable(
+            ListAlertsResp,
+            Api.GET_ALERT_LIST,
+            state.track(
+                consumer,
+                lambda alert: alert.id,
+                lambda alert: alert.updated_date_time,
+                versioned=True,
+            ),
+            prefetch=prefetch,
+            params=utils.filter_none(
+                {
+                    "startDateTime": state.start_time(start_time),
+                    "dateTimeTarget": "updatedDateTime",
+                    "orderBy": "createdDateTime desc",
+                }
+            ),
+            headers=utils.tmv1_filter(op, fields),
+        )
+        if result.result_code == ResultCode.SUCCESS:
+            state.commit()
+        return result
+
+    def iter(
+        self,
+        start_time: Optional[str] = None,
+        end_time: Optional[str] = None,
+        date_time_target: Optional[str] = "createdDateTime",
+        op: QueryOp = QueryOp.AND,
+        **fields: str,
+    ) -> AsyncIterator[Union[SaeAlert, TiAlert]]:
+        """Lazily iterates over workbench alerts.
+
+        :param start_time: Date that indicates the start of the data retrieval
+        time range (yyyy-MM-ddThh:mm:ssZ).
+        Defaults to 24 hours before the request is made.
+        :type start_time: Optional[str]
+        :param end_time: Date that indicates the end of the data retrieval
+        time range (yyyy-MM-ddThh:mm:ssZ).
+        Defaults to the time the request is made.
+        :type end_time: Optional[str]
+        :param op: Operator to apply between fields (ie: ... OR ...).
+        :type op: QueryOp
+        :param fields: Field/value used to filter result (i.e:fileName="1.sh"),
+        check Vision One API documentation for full list of supported fields.
+        :type fields: Dict[str, str]
+        :rtype: AsyncIterator[Union[SaeAlert, TiAlert]]
+        """
+        return self._core.iter_linkable(
+            ListAlertsResp,
+            Api.GET_ALERT_LIST,
+            params=utils.filter_none(
+                {
+                    "startDateTime": start_time,
+                    "endDateTime": end_time,
+                    "dateTimeTarget": date_time_target,
+                    "orderBy": "createdDateTime desc",
+                }
+            ),
+            headers=utils.tmv1_filter(op, fields),
+        )
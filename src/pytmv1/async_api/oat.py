@@ -0,0 +1,552 @@
+from typing import Any, AsyncIterator, Awaitable, Callable, List, Optional
+
+from .. import utils
+from ..async_core import AsyncCore
+from ..checkpoint import CheckpointStore
+from ..model.common import OatEvent, OatPackage
+from ..model.enum import Api, HttpMethod, OatRiskLevel, QueryOp
+from ..model.response import (
+    ConsumeLinkableResp,
+    GetOatPackageResp,
+    GetPipelineResp,
+    ListOatPackagesResp,
+    ListOatPipelinesResp,
+    ListOatsResp,
+    MultiResp,
+    NoContentResp,
+    OatPipelineResp,
+)
+from ..result import MultiResult, Result, ResultCode
+from ..sync import IncrementalSync
+
+
+class Oat:
+    _core: AsyncCore
+
+    def __init__(self, core: AsyncCore):
+        self._core = core
+
+    async def list(
+        self,
+        detected_start_date_time: Optional[str] = None,
+        detected_end_date_time: Optional[str] = None,
+        ingested_start_date_time: Optional[str] = None,
+        ingested_end_date_time: Optional[str] = None,
+        top: int = 50,
+        op: QueryOp = QueryOp.AND,
+        **fields: str,
+    ) -> Result[ListOatsResp]:
+        """Retrieves Observed Attack Techniques events in a paginated list.
+
+        :param detected_start_date_time: Date that indicates the start of
+        the event detection data retrieval time range (yyyy-MM-ddThh:mm:ssZ).
+        Defaults to 24 hours before the request is made.
+        :type detected_start_date_time: Optional[str]
+        :param detected_end_date_time: Date that indicates the end of
+        the event detection data retrieval time range (yyyy-MM-ddThh:mm:ssZ).
+        Defaults to the time the request is made.
+        :type detected_end_date_time: Optional[str]
+        :param ingested_start_date_time: Date that indicates the start of
+        the data ingestion time range (yyyy-MM-ddThh:mm:ssZ).
+        :type ingested_start_date_time: Optional[str]
+        :param ingested_end_date_time: Date that indicates the end of
+        the data ingestion time range (yyyy-MM-ddThh:mm:ssZ).
+        :type ingested_end_date_time: Optional[str]
+        :param top: Number of records displayed on a page.
+        :type top: int
+        :param op: Operator to apply between fields (ie: ... OR ...).
+        :type op: QueryOp
+        :param fields: Field/value used to filter result (i.e:uuid="123"),
+        check Vision One API documentation for full list of supported fields.
+        :type fields: Dict[str, str]
+        :rtype: Result[ListOatsResp]
+        """
+        return await self._core.send(
+            ListOatsResp,
+            Api.GET_OAT_LIST,
+            params=utils.filter_none(
+                {
+                    "detectedStartDateTime": detected_start_date_time,
+                    "detectedEndDateTime": detected_end_date_time,
+                    "ingestedStartDateTime": ingested_start_date_time,
+                    "ingestedEndDateTime": ingested_end_date_time,
+                    "top": top,
+                }
+            ),
+            headers=utils.tmv1_filter(op, fields),
+        )
+
+    async def consume(
+        self,
+        consumer: Callable[[OatEvent], Optional[Awaitable[None]]],
+        detected_start_date_time: Optional[str] = None,
+        detected_end_date_time: Optional[str] = None,
+        ingested_start_date_time: Optional[str] = None,
+        ingested_end_date_time: Optional[str] = None,
+        top: int = 50,
+        op: QueryOp = QueryOp.AND,
+        prefetch: int = 0,
+        stream: bool = False,
+        checkpoint: Optional[CheckpointStore] = None,
+        **fields: str,
+    ) -> Result[ConsumeLinkableResp]:
+        """Retrieves and consume OAT events.
+
+        :param consumer: Function which will consume every record in result.
+        :type consumer: Callable[[Oat], Optional[Awaitable[None]]]
+        :param detected_start_date_time: Date that indicates the start of
+        the event detection data retrieval time range (yyyy-MM-ddThh:mm:ssZ).
+        Defaults to 24 hours before the request is made.
+        :type detected_start_date_time: Optional[str]
+        :param detected_end_date_time: Date that indicates the end of
+        the event detection data retrieval time range (yyyy-MM-ddThh:mm:ssZ).
+        Defaults to the time the request is made.
+        :type detected_end_date_time: Optional[str]
+        :param ingested_start_date_time: Date that indicates the start of
+        the data ingestion time range (yyyy-MM-ddThh:mm:ssZ).
+        :type ingested_start_date_time: Optional[str]
+        :param ingested_end_date_time: Date that indicates the end of
+        the data ingestion time range (yyyy-MM-ddThh:mm:ssZ).
+        :type ingested_end_date_time: Optional[str]
+        :param top: Number of records displayed on a page.
+        :type top: int
+        :param op: Operator to apply between fields (ie: ... OR ...).
+        :type op: QueryOp
+        :param prefetch: (optional) Number of pages fetched ahead in the
+         background while the consumer processes the current one.
+        :type prefetch: int
+        :param stream: (optional) Parse each page incrementally and hand
+         records to the consumer as they are read, instead of loading
+         the whole page in memory (prefetch does not apply).
+        :type stream: bool
+        :param checkpoint: (optional) Store of the consumption progress,
+         a consumption interrupted by an error resumes after the last
+         consumed record, after a crash records of the page being
+         consumed may be consumed again (at-least-once), and a
+         completed one makes the next consumption start
+         where its time range ended (stream does not apply).
+        :type checkpoint: Optional[CheckpointStore]
+        :param fields: Field/value used to filter result (i.e:uuid="123"),
+        check Vision One API documentation for full list of supported fields.
+        :type fields: Dict[str, str]
+        :rtype: Result[ConsumeLinkableResp]
+        """
+        return await self._core.send_linkable(
+            ListOatsResp,
+            Api.GET_OAT_LIST,
+            consumer,
+            prefetch=prefetch,
+            checkpoint=checkpoint,
+            time_range=("detectedStartDateTime", "detectedEndDateTime"),
+            stream=stream,
+            params=utils.filter_none(
+                {
+                    "detectedStartDateTime": detected_start_date_time,
+                    "detectedEndDateTime": detected_end_date_time,
+                    "ingestedStartDateTime": ingested_start_date_time,
+                    "ingestedEndDateTime": ingested_end_date_time,
+                    "top": top,
+                }
+            ),
+            headers=utils.tmv1_filter(op, fields),
+        )
+
+    async def sync(
+        self,
+        consumer: Callable[[OatEvent], Optional[Awaitable[None]]],
+        state: IncrementalSync,
+        ingested_start_date_time: Optional[str] = None,
+        top: int = 50,
+        op: QueryOp = QueryOp.AND,
+        prefetch: int = 0,
+        **fields: str,
+    ) -> Result[ConsumeLinkableResp]:
+        """Consumes the OAT events ingested since the previous sync.
+
+        :param consumer: Function which will consume every new record.
+        :type consumer: Callable[[OatEvent], Optional[Awaitable[None]]]
+        :param state: Watermark and already consumed events, to reuse
+         across syncs.
+        :type state: IncrementalSync
+        :param ingested_start_date_time: Date that indicates the start of
+        the data ingestion time range of the first sync
+        (yyyy-MM-ddThh:mm:ssZ), ignored once a watermark is saved.
+        :type ingested_start_date_time: Optional[str]
+        :param top: Number of records displayed on a page.
+        :type top: int
+        :param op: Operator to apply between fields (ie: ... OR ...).
+        :type op: QueryOp
+        :param prefetch: (optional) Number of pages fetched ahead in the
+         background while the consumer processes the current one.
+        :type prefetch: int
+        :param fields: Field/value used to filter result (i.e:uuid="123"),
+        check Vision One API documentation for full list of supported fields.
+        :type fields: Dict[str, str]
+        :rtype: Result[ConsumeLinkableResp]
+        """
+        result: Result[ConsumeLinkableResp] = await self._core.send_linkable(
+            ListOatsResp,
+            Api.GET_OAT_LIST,
+            state.track(
+                consumer,
+                lambda oat: oat.uuid,
+                lambda oat: oat.ingested_date_time,
+            ),
+            prefetch=prefetch,
+            params=utils.filter_none(
+                {
+                    "ingestedStartDateTime": state.start_time(
+                        ingested_start_date_time
+                    ),
+                    "top": top,
+                }
+            ),
+            headers=utils.tmv1_filter(op, fields),
+        )
+        if result.result_code == ResultCode.SUCCESS:
+            state.commit()
+        return result
+
+    async def consume_batches(
+        self,
+        consumer: Callable[[Any], Optional[Awaitable[None]]],
+        detected_start_date_time: Optional[str] = None,
+        detected_end_date_time: Optional[str] = None,
+        ingested_start_date_time: Optional[str] = None,
+        ingested_end_date_time: Optional[str] = None,
+        top: int = 50,
+        op: QueryOp = QueryOp.AND,
+        arrow: bool = False,
+        **fields: str,
+    ) -> Result[ConsumeLinkableResp]:
+        """Retrieves OAT events page by page as column oriented batches.
+
+        Each page is handed to the consumer as a dict of column name to
+        values (nested fields are flattened, ie: endpoint.ips) without
+        building a model per record, or as a pyarrow RecordBatch.
+
+        :param consumer: Function which will consume every batch in result.
+        :type consumer: Callable[[Dict[str, List[Any]]], None]
+        :param detected_start_date_time: Date that indicates the start of
+        the event detection data retrieval time range (yyyy-MM-ddThh:mm:ssZ).
+        Defaults to 24 hours before the request is made.
+        :type detected_start_date_time: Optional[str]
+        :param detected_end_date_time: Date that indicates the end of
+        the event detection data retrieval time range (yyyy-MM-ddThh:mm:ssZ).
+        Defaults to the time the request is made.
+        :type detected_end_date_time: Optional[str]
+        :param ingested_start_date_time: Date that indicates the start of
+        the data ingestion time range (yyyy-MM-ddThh:mm:ssZ).
+        :type ingested_start_date_time: Optional[str]
+        :param ingested_end_date_time: Date that indicates the end of
+        the data ingestion time range (yyyy-MM-ddThh:mm:ssZ).
+        :type ingested_end_date_time: Optional[str]
+        :param top: Number of records displayed on a page.
+        :type top: int
+        :param op: Operator to apply between fields (ie: ... OR ...).
+        :type op: QueryOp
+        :param arrow: (optional) Hand pyarrow RecordBatch to the consumer
+         instead of dicts (requires pytmv1[arrow]).
+        :type arrow: bool
+        :param fields: Field/value used to filter result (i.e:uuid="123"),
+        check Vision One API documentation for full list of supported fields.
+        :type fields: Dict[str, str]
+        :rtype: Result[ConsumeLinkableResp]
+        """
+        return await self._core.send_batches(
+            ListOatsResp,
+            Api.GET_OAT_LIST,
+            consumer,
+            arrow=arrow,
+            params=utils.filter_none(
+                {
+                    "detectedStartDateTime": detected_start_date_time,
+                    "detectedEndDateTime": detected_end_date_time,
+                    "ingestedStartDateTime": ingested_start_date_time,
+                    "ingestedEndDateTime": ingested_end_date_time,
+                    "top": top,
+                }
+            ),
+            headers=utils.tmv1_filter(op, fields),
+        )
+
+    def iter(
+        self,
+        detected_start_date_time: Optional[str] = None,
+        detected_end_date_time: Optional[str] = None,
+        ingested_start_date_time: Optional[str] = None,
+        ingested_end_date_time: Optional[str] = None,
+        top: int = 50,
+        op: QueryOp = QueryOp.AND,
+        **fields: str,
+    ) -> AsyncIterator[OatEvent]:
+        """Lazily iterates over OAT events.
+
+        :param detected_start_date_time: Date that indicates the start of
+        the event detection data retrieval time range (yyyy-MM-ddThh:mm:ssZ).
+        Defaults to 24 hours before the request is made.
+        :type detected_start_date_time: Optional[str]
+        :param detected_end_date_time: Date that indicates the end of
+        the event detection data retrieval time range (yyyy-MM-ddThh:mm:ssZ).
+        Defaults to the time the request is made.
+        :type detected_end_date_time: Optional[str]
+        :param ingested_start_date_time: Date that indicates the start of
+        the data ingestion time range (yyyy-MM-ddThh:mm:ssZ).
+        :type ingested_start_date_time: Optional[str]
+        :param ingested_end_date_time: Date that indicates the end of
+        the data ingestion time range (yyyy-MM-ddThh:mm:ssZ).
+        :type ingested_end_date_time: Optional[str]
+        :param top: Number of records displayed on a page.
+        :type top: int
+        :param op: Operator to apply between fields (ie: ... OR ...).
+        :type op: QueryOp
+        :param fields: Field/value used to filter result (i.e:uuid="123"),
+        check Vision One API documentation for full list of supported fields.
+        :type fields: Dict[str, str]
+        :rtype: AsyncIterator[OatEvent]
+        """
+        return self._core.iter_linkable(
+            ListOatsResp,
+            Api.GET_OAT_LIST,
+            params=utils.filter_none(
+                {
+                    "detectedStartDateTime": detected_start_date_time,
+                    "detectedEndDateTime": detected_end_date_time,
+                    "ingestedStartDateTime": ingested_start_date_time,
+                    "ingestedEndDateTime": ingested_end_date_time,
+                    "top": top,
+                }
+            ),
+            headers=utils.tmv1_filter(op, fields),
+        )
+
+    async def create_pipeline(
+        self,
+        has_detail: bool,
+        risk_levels: List[OatRiskLevel],
+        description: Optional[str] = None,
+    ) -> Result[OatPipelineResp]:
+        """Registers a customer
+        to the Observed Attack Techniques data pipeline.
+
+        :param has_detail: Retrieve detailed logs from the OAT data pipeline.
+        :type has_detail: bool
+        :param risk_levels: Risk levels to include in the results,
+        requests must include at least one risk level.
+        :type risk_levels: List[OatRiskLevel]
+        :param description: Notes or comments about the pipeline.
+        :type description: Optional[str]
+        :return: Result[PipelineResp]
+        """
+        return await self._core.send(
+            OatPipelineResp,
+            Api.CREATE_OAT_PIPELINE,
+            HttpMethod.POST,
+            json=utils.filter_none(
+                {
+                    "hasDetail": has_detail,
+                    "riskLevels": risk_levels,
+                    "description": description,
+                }
+            ),
+        )
+
+    async def get_pipeline(self, pipeline_id: str) -> Result[GetPipelineResp]:
+        """Displays the settings of the specified data pipeline.
+
+        :param pipeline_id: Pipeline ID.
+        :type pipeline_id: str
+        :return: Result[GetPipelineResp]
+        """
+        return await self._core.send(
+            GetPipelineResp, Api.GET_OAT_PIPELINE.value.format(pipeline_id)
+        )
+
+    async def update_pipeline(
+        self,
+        pipeline_id: str,
+        etag: str,
+        has_detail: Optional[bool] = None,
+        risk_levels: Optional[List[OatRiskLevel]] = None,
+        description: Optional[str] = None,
+    ) -> Result[NoContentResp]:
+        """Modifies the settings of the specified data pipeline.
+
+        :param pipeline_id: Pipeline ID.
+        :type pipeline_id: str
+        :param etag: ETag of the resource you want to update.
+        :type etag: str
+        :param has_detail: Retrieve detailed logs from the OAT data pipeline.
+        :type has_detail: Optional[bool]
+        :param risk_levels: Risk levels to include in the results,
+        requests must include at least one risk level.
+        :type risk_levels: Optional[List[OatRiskLevel]]
+        :param description: Notes or comments about the pipeline.
+        :type description: Optional[str]
+        :return: Result[NoContentResp]
+        """
+        return await self._core.send(
+            NoContentResp,
+            Api.UPDATE_OAT_PIPELINE.value.format(pipeline_id),
+            HttpMethod.PATCH,
+            json=utils.filter_none(
+                {
+                    "hasDetail": has_detail,
+                    "riskLevels": risk_levels,
+                    "description": description,
+                }
+            ),
+            headers={"If-Match": etag[1:-1] if etag.startswith('"') else etag},
+        )
+
+    async def delete_pipelines(
+        self, *pipeline_ids: str
+    ) -> MultiResult[MultiResp]:
+        """Unregisters a customer
+        from the Observed Attack Techniques data pipeline(s).
+
+        :param pipeline_ids: Pipeline IDs.
+        :type pipeline_ids: List[str]
+        :return: MultiResult[MultiResp]
+        """
+        return await self._core.send_multi(
+            MultiResp,
+            Api.DELETE_OAT_PIPELINE,
+            json=[{"id": pipeline_id} for pipeline_id in pipeline_ids],
+        )
+
+    async def list_pipelines(self) -> Result[ListOatPipelinesResp]:
+        """Displays all data pipelines that have registered users.
+
+        :return: Result[ListOatPipelineResp]
+        """
+        return await self._core.send(
+            ListOatPipelinesResp, Api.LIST_OAT_PIPELINE
+        )
+
+    async def get_package(
+        self, pipeline_id: str, package_id: str
+    ) -> Result[GetOatPackageResp]:
+        """Retrieves the specified Observed Attack Techniques package.
+
+        :param pipeline_id: Pipeline ID.
+        :type pipeline_id: str
+        :param package_id: Package ID.
+        :type package_id: str
+        :return: Result[GetOatPackageResp]
+        """
+        return await self._core.send(
+            GetOatPackageResp,
+            Api.DOWNLOAD_OAT_PACKAGE.value.format(pipeline_id, package_id),
+        )
+
+    async def list_packages(
+        self,
+        pipeline_id: str,
+        start_date_time: Optional[str] = None,
+        end_date_time: Optional[str] = None,
+        top: int = 500,
+    ) -> Result[ListOatPackagesResp]:
+        """Displays all the available packages from a data pipeline
+         in a paginated list.
+
+        :param pipeline_id: Pipeline ID.
+        :type pipeline_id: str
+        :param start_date_time: Date that indicates the start of
+        the data retrieval time range. (yyyy-MM-ddThh:mm:ssZ).
+        :type start_date_time: Optional[str]
+        :param end_date_time: Date that indicates the end of
+        the data retrieval time range. (yyyy-MM-ddThh:mm:ssZ).
+        :type end_date_time: Optional[str]
+        :param top: Number of records displayed on a page.
+        :type top: int
+        :return: Result[ListOatPackagesResp]
+        """
+        return await self._core.send(
+            ListOatPackagesResp,
+            Api.LIST_OAT_PACKAGE.value.format(pipeline_id),
+            params=utils.filter_none(
+                {
+                    "startDateTime": start_date_time,
+                    "endDateTime": end_date_time,
+                    "top": top,
+                }
+            ),
+        )
+
+    async def consume_packages(
+        self,
+        pipeline_id: str,
+        consumer: Callable[[OatPackage], Optional[Awaitable[None]]],
+        start_date_time: Optional[str] = None,
+        end_date_time: Optional[str] = None,
+        top: int = 500,
+        prefetch: int = 0,
+    ) -> Result[ConsumeLinkableResp]:
+        """Displays and consume all the available packages from a data pipeline
+         in a paginated list.
+
+        :param pipeline_id: Pipeline ID.
+        :type pipeline_id: str
+        :param consumer: Function which will consume every record in result.
+        :type consumer: Callable[[OatPackage], Optional[Awaitable[None]]]
+        :param start_date_time: Date that indicates the start of
+        the data retrieval time range. (yyyy-MM-ddThh:mm:ssZ).
+        :type start_date_time: Optional[str]
+        :param end_date_time: Date that indicates the end of
+        the data retrieval time range. (yyyy-MM-ddThh:mm:ssZ).
+        :type end_date_time: Optional[str]
+        :param top: Number of records displayed on a page.
+        :type top: int
+        :param prefetch: (optional) Number of pages fetched ahead in the
+         background while the consumer processes the current one.
+        :type prefetch: int
+        :return: Result[ConsumeLinkableResp]
+        """
+        return await self._core.send_linkable(
+            ListOatPackagesResp,
+            Api.LIST_OAT_PACKAGE.value.format(pipeline_id),
+            consumer,
+            prefetch=prefetch,
+            params=utils.filter_none(
+                {
+                    "startDateTime": start_date_time,
+                    "endDateTime": end_date_time,
+                    "top": top,
+                }
+            ),
+        )
+
+    def iter_packages(
+        self,
+        pipeline_id: str,
+        start_date_time: Optional[str] = None,
+        end_date_time: Optional[str] = None,
+        top: int = 500,
+    ) -> AsyncIterator[OatPackage]:
+        """Lazily iterates over all the available packages
+        from a data pipeline.
+
+        :param pipeline_id: Pipeline ID.
+        :type pipeline_id: str
+        :param start_date_time: Date that indicates the start of
+        the data retrieval time range. (yyyy-MM-ddThh:mm:ssZ).
+        :type start_date_time: Optional[str]
+        :param end_date_time: Date that indicates the end of
+        the data retrieval time range. (yyyy-MM-ddThh:mm:ssZ).
+        :type end_date_time: Optional[str]
+        :param top: Number of records displayed on a page.
+        :type top: int
+        :return: AsyncIterator[OatPackage]
+        """
+        return self._core.iter_linkable(
+            ListOatPackagesResp,
+            Api.LIST_OAT_PACKAGE.value.format(pipeline_id),
+            params=utils.filter_none(
+                {
+                    "startDateTime": start_date_time,
+                    "endDateTime": end_date_time,
+                    "top": top,
+                }
+            ),
+        )
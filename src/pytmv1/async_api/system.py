@@ -0,0 +1,19 @@
+from ..async_core import AsyncCore
+from ..model.enum import Api
+from ..model.response import ConnectivityResp
+from ..result import Result
+
+
+class System:
+    _core: AsyncCore
+
+    def __init__(self, core: AsyncCore):
+        self._core = core
+
+    async def check_connectivity(self) -> Result[ConnectivityResp]:
+        """Checks the connection to the API service
+        and verifies if your authentication token is valid.
+
+        :rtype: Result[ConnectivityResp]
+        """
+        return await self._core.send(ConnectivityResp, Api.CONNECTIVITY)
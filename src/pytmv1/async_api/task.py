@@ -0,0 +1,96 @@
+from typing import AsyncIterator, Optional, Tuple, Type
+
+from ..async_core import AsyncCore
+from ..model.response import BaseTaskResp, T
+from ..poll import PollStrategy
+from ..result import Result
+
+
+class Task:
+    _core: AsyncCore
+
+    def __init__(self, core: AsyncCore):
+        self._core = core
+
+    async def get_result(
+        self,
+        task_id: str,
+        poll: bool = True,
+        poll_time_sec: float = 1800,
+        poll_strategy: Optional[PollStrategy] = None,
+    ) -> Result[BaseTaskResp]:
+        """Retrieves the result of a response task.
+
+        :param task_id: Task id.
+        :type task_id: str
+        :param poll: If we should wait until the task is finished before
+         to return the result.
+        :type poll: bool
+        :param poll_time_sec: Maximum time to wait for the result
+        to be available.
+        :type poll_time_sec: float
+        :param poll_strategy: (optional) Delays between status checks,
+         defaults to the strategy of the client.
+        :type poll_strategy: Optional[PollStrategy]
+        :rtype: Result[T]:
+        """
+        return await self.get_result_class(
+            task_id, BaseTaskResp, poll, poll_time_sec, poll_strategy
+        )
+
+    async def get_result_class(
+        self,
+        task_id: str,
+        class_: Type[T],
+        poll: bool = True,
+        poll_time_sec: float = 1800,
+        poll_strategy: Optional[PollStrategy] = None,
+    ) -> Result[T]:
+        """Retrieves the result of a response task.
+
+        :param task_id: Task id.
+        :type task_id: str
+        :param class_: Expected task result class.
+        :type class_: Type[T]
+        :param poll: If we should wait until the task is finished before
+         to return the result.
+        :type poll: bool
+        :param poll_time_sec: Maximum time to wait for the result
+        to be available.
+        :type poll_time_sec: float
+        :param poll_strategy: (optional) Delays between status checks,
+         defaults to the strategy of the client.
+        :type poll_strategy: Optional[PollStrategy]
+        :rtype: Result[T]:
+        """
+        return await self._core.send_task_result(
+            class_, task_id, poll, poll_time_sec, poll_strategy
+        )
+
+    def wait_all(
+        self,
+        *task_ids: str,
+        poll_time_sec: float = 1800,
+        poll_strategy: Optional[PollStrategy] = None,
+    ) -> AsyncIterator[Tuple[str, Result[BaseTaskResp]]]:
+        """Polls the results of many response tasks together and yields
+        every result as soon as its task is finished.
+
+        All pending tasks are checked at once following a single poll
+        strategy, results are yielded in completion order along with their
+        task id. Tasks still running after poll_time_sec are yielded with
+        their last status.
+
+        :param task_ids: Task id(s).
+        :type task_ids: Tuple[str, ...]
+        :param poll_time_sec: Maximum time to wait for all the results
+        to be available.
+        :type poll_time_sec: float
+        :param poll_strategy: (optional) Delays between status checks,
+         defaults to the strategy of the client.
+        :type poll_strategy: Optional[PollStrategy]
+        :rtype: AsyncIterator[Tuple[str, Result[BaseTaskResp]]]
+        """
+        return self._core.iter_task_results(
+            BaseTaskResp, list(task_ids), poll_time_sec, poll_strategy
+        )
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import logging
+from logging import Logger
+from types import TracebackType
+from typing import Optional, Type
+
+from . import async_api
+from .adapter import default_pool_maxsize
+from .async_core import AsyncCore
+from .cache import EndpointCache, ResponseCache
+from .instrument import Instrumentation
+from .poll import PollStrategy
+from .retry import RetryPolicy
+from .throttle import RateLimiter
+
+log: Logger = logging.getLogger(__name__)
+
+
+def init_async(
+    name: str,
+    token: str,
+    url: str,
+    pool_maxsize: Optional[int] = None,
+    connect_timeout: int = 10,
+    read_timeout: int = 30,
+    lazy_validation: bool = False,
+    poll_strategy: Optional[PollStrategy] = None,
+    rate_limiter: Optional[RateLimiter] = None,
+    retry_policy: Optional[RetryPolicy] = None,
+    http2: bool = False,
+    response_cache: Optional[ResponseCache] = None,
+    endpoint_cache: Optional[EndpointCache] = None,
+    instrumentation: Optional[Instrumentation] = None,
+) -> AsyncClient:
+    """Helper function to initialize an :class:`AsyncClient`.
+
+    :param name: Identify the application using this library.
+    :type name: str
+    :param token: Authentication token created for your account.
+    :type token: str
+    :param url: Vision One API url this client connects to.
+    :type url: str
+    :param pool_maxsize: (optional) Maximum number of concurrent connections
+     and requests, defaults to the default worker count of a thread pool
+     (CPU count + 4, up to 32) like the sync client.
+    :type pool_maxsize: Optional[int]
+    :param connect_timeout: (optional) Seconds before connection timeout.
+    :type connect_timeout: int
+    :param read_timeout: (optional) Seconds before read timeout.
+    :type connect_timeout: int
+    :param lazy_validation: (optional) Validate fields of listed and consumed
+     records on first access instead of upfront.
+    :type lazy_validation: bool
+    :param poll_strategy: (optional) Default delays between the status
+     checks of polled task results and sandbox submissions.
+    :type poll_strategy: PollStrategy
+    :param rate_limiter: (optional) Paces requests per API family and
+     retries throttled requests, can be shared between clients.
+    :type rate_limiter: RateLimiter
+    :param retry_policy: (optional) Retries of requests failing on
+     connection errors, timeouts or transient server errors.
+    :type retry_policy: RetryPolicy
+    :param http2: (optional) Send requests over HTTP/2, concurrent requests
+     share one connection (requires pip install pytmv1[http2]).
+    :type http2: bool
+    :param response_cache: (optional) Cache of alert, note, API key and
+     pipeline reads, revalidated with their ETag.
+    :type response_cache: ResponseCache
+    :param endpoint_cache: (optional) Cache of endpoint details and
+     inventory records, indexed by endpoint name, IP and MAC address.
+    :type endpoint_cache: EndpointCache
+    :param instrumentation: (optional) Callbacks reporting the latency,
+     size, records, retries and errors of the requests.
+    :type instrumentation: Instrumentation
+    :rtype: AsyncClient
+    """
+    log.debug(
+        "Initializing new async client with [Appname=%s, Token=*****, URL=%s]",
+        name,
+        url,
+    )
+    return AsyncClient(
+        AsyncCore(
+            appname=name,
+            token=token,
+            url=url,
+            pool_maxsize=pool_maxsize or default_pool_maxsize(),
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout,
+            lazy_validation=lazy_validation,
+            poll_strategy=poll_strategy,
+            rate_limiter=rate_limiter,
+            retry_policy=retry_policy,
+            http2=http2,
+            response_cache=response_cache,
+            endpoint_cache=endpoint_cache,
+            instrumentation=instrumentation,
+        )
+    )
+
+
+class AsyncClient:
+    def __init__(self, core: AsyncCore):
+        self._core = core
+        self.account = async_api.Account(self._core)
+        self.alert = async_api.Alert(self._core)
+        self.api_key = async_api.ApiKey(self._core)
+        self.email = async_api.Email(self._core)
+        self.endpoint = async_api.Endpoint(self._core)
+        self.note = async_api.Note(self._core)
+        self.oat = async_api.Oat(self._core)
+        self.object = async_api.Object(self._core)
+        self.sandbox = async_api.Sandbox(self._core)
+        self.script = async_api.CustomScript(self._core)
+        self.system = async_api.System(self._core)
+        self.task = async_api.Task(self._core)
+
+    async def __aenter__(self) -> AsyncClient:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Closes the underlying connection pool."""
+        await self._core.close()
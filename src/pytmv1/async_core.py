@@ -0,0 +1,787 @@
+from __future__ import annotations
+
+import asyncio
+import inspect
+import logging
+import time
+from logging import Logger
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+)
+from urllib.parse import SplitResult, urlsplit
+
+from pydantic import BaseModel
+from requests import PreparedRequest, Response
+
+from . import columnar, logs
+from .adapter import http_errors, requests_response
+from .cache import EndpointCache, ResponseCache
+from .checkpoint import Checkpoint, CheckpointStore
+from .core import (
+    NOT_MODIFIED,
+    POLLED_STATUSES,
+    STREAM_CHUNK_SIZE,
+    BaseCore,
+    _BoundaryFilter,
+    _chunks,
+    _is_running,
+    _is_streamable,
+    _item_parser,
+    _item_type,
+    _json,
+    _log_request,
+    _log_response,
+    _merge_multi,
+    _parse_data,
+    _records,
+    _size,
+    _uri,
+    _validate,
+)
+from .instrument import Instrumentation, api_path
+from .model.enum import Api, HttpMethod
+from .model.request import EndpointRequest
+from .model.response import (
+    MR,
+    BaseLinkableResp,
+    C,
+    ConsumeLinkableResp,
+    GetEndpointDetailsResp,
+    MultiResp,
+    R,
+    S,
+    SandboxSubmissionStatusResp,
+    T,
+)
+from .poll import PollStrategy
+from .result import MultiResult, Result, async_multi_result, async_result
+from .retry import RetryPolicy
+from .stream import ItemStreamParser
+from .throttle import RateLimiter
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None  # type: ignore[assignment]
+
+log: Logger = logging.getLogger(__name__)
+
+
+class AsyncCore(BaseCore):
+    def __init__(
+        self,
+        appname: str,
+        token: str,
+        url: str,
+        pool_maxsize: int,
+        connect_timeout: int,
+        read_timeout: int,
+        lazy_validation: bool = False,
+        poll_strategy: Optional[PollStrategy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        http2: bool = False,
+        response_cache: Optional[ResponseCache] = None,
+        endpoint_cache: Optional[EndpointCache] = None,
+        instrumentation: Optional[Instrumentation] = None,
+    ):
+        super().__init__(
+            appname,
+            token,
+            url,
+            connect_timeout,
+            read_timeout,
+            lazy_validation,
+            poll_strategy,
+            rate_limiter,
+            retry_policy,
+            response_cache,
+            endpoint_cache,
+            instrumentation,
+        )
+        if httpx is None:
+            raise ImportError(
+                "httpx is required by the async client,"
+                " install it with: pip install pytmv1[async]"
+            )
+        self._pool_maxsize = max(1, pool_maxsize)
+        limits = httpx.Limits(
+            max_connections=pool_maxsize,
+            max_keepalive_connections=pool_maxsize,
+        )
+        self._client = httpx.AsyncClient(
+            timeout=httpx.Timeout(
+                None, connect=connect_timeout, read=read_timeout
+            ),
+            transport=httpx.AsyncHTTPTransport(limits=limits, http2=http2),
+            mounts={
+                f"{scheme}://": httpx.AsyncHTTPTransport(
+                    limits=limits, http2=http2, proxy=proxy
+                )
+                for scheme, proxy in (self._proxies or {}).items()
+            },
+            trust_env=False,
+        )
+
+    async def close(self) -> None:
+        await self._client.aclose()
+
+    @async_result
+    async def send(
+        self,
+        class_: Type[R],
+        api: str,
+        method: HttpMethod = HttpMethod.GET,
+        **kwargs: Any,
+    ) -> R:
+        return await self._process(
+            class_,
+            api,
+            method,
+            **kwargs,
+        )
+
+    @async_result
+    async def send_endpoint_details(
+        self, endpoint_id: str
+    ) -> GetEndpointDetailsResp:
+        cached: Optional[GetEndpointDetailsResp] = self._cached_endpoint(
+            endpoint_id
+        )
+        if cached is not None:
+            return cached
+        return await self._process(
+            GetEndpointDetailsResp,
+            Api.GET_ENDPOINT_DETAILS.value.format(endpoint_id),
+        )
+
+    async def send_endpoint(
+        self,
+        api: Api,
+        *tasks: EndpointRequest,
+    ) -> MultiResult[MultiResp]:
+        return await self.send_multi(
+            MultiResp,
+            api,
+            json=[
+                task.model_dump(by_alias=True, exclude_none=True)
+                for task in tasks
+            ],
+        )
+
+    @async_result
+    async def send_linkable(
+        self,
+        class_: Type[BaseLinkableResp[C]],
+        api: str,
+        consumer: Callable[[C], Optional[Awaitable[None]]],
+        prefetch: int = 0,
+        stream: bool = False,
+        checkpoint: Optional[CheckpointStore] = None,
+        time_range: Tuple[str, str] = ("startDateTime", "endDateTime"),
+        **kwargs: Any,
+    ) -> ConsumeLinkableResp:
+        if checkpoint and stream:
+            raise ValueError("checkpoint does not support stream")
+        if checkpoint:
+            return ConsumeLinkableResp(
+                total_consumed=await self._consume_checkpointed(
+                    class_,
+                    api,
+                    consumer,
+                    checkpoint,
+                    time_range,
+                    prefetch,
+                    **kwargs,
+                )
+            )
+        if stream:
+            return ConsumeLinkableResp(
+                total_consumed=await self._consume_stream(
+                    class_, api, consumer, **kwargs
+                )
+            )
+        return ConsumeLinkableResp(
+            total_consumed=await self._consume_linkable(
+                class_,
+                api,
+                consumer,
+                prefetch,
+                **kwargs,
+            )
+        )
+
+    @async_result
+    async def send_linkable_parallel(
+        self,
+        class_: Type[BaseLinkableResp[C]],
+        api: str,
+        consumer: Callable[[C], Optional[Awaitable[None]]],
+        params: List[Dict[str, Any]],
+        prefetch: int = 0,
+        stream: bool = False,
+        boundaries: Sequence[int] = (),
+        **kwargs: Any,
+    ) -> ConsumeLinkableResp:
+        boundary_filter: _BoundaryFilter = _BoundaryFilter(boundaries)
+        duplicates: int = 0
+        # Windows searched at once, like the threads of the sync client
+        semaphore: asyncio.Semaphore = asyncio.Semaphore(self._pool_maxsize)
+
+        def filtered_consumer(item: C) -> Optional[Awaitable[None]]:
+            nonlocal duplicates
+            if not boundary_filter.is_new(item):
+                duplicates += 1
+                return None
+            return consumer(item)
+
+        async def consume(window: int) -> int:
+            async with semaphore:
+                try:
+                    if stream:
+                        return await self._consume_stream(
+                            class_,
+                            api,
+                            filtered_consumer,
+                            params=params[window],
+                            **kwargs,
+                        )
+                    return await self._consume_linkable(
+                        class_,
+                        api,
+                        filtered_consumer,
+                        prefetch,
+                        params=params[window],
+                        **kwargs,
+                    )
+                finally:
+                    boundary_filter.done(window)
+
+        return ConsumeLinkableResp(
+            total_consumed=sum(
+                await asyncio.gather(
+                    *[consume(window) for window in range(len(params))]
+                )
+            )
+            - duplicates
+        )
+
+    @async_result
+    async def send_batches(
+        self,
+        class_: Type[BaseLinkableResp[C]],
+        api: str,
+        consumer: Callable[[Any], Optional[Awaitable[None]]],
+        arrow: bool = False,
+        **kwargs: Any,
+    ) -> ConsumeLinkableResp:
+        item_type: Type[BaseModel] = _item_type(class_)
+        total_count: int = 0
+        async for items in self._iter_raw_pages(api, **kwargs):
+            if not items:
+                continue
+            batch: columnar.ColumnBatch = columnar.to_columns(item_type, items)
+            output: Any = (
+                columnar.to_record_batch(item_type, batch) if arrow else batch
+            )
+            await _call(consumer, output)
+            total_count += len(items)
+        log.debug(
+            "Records consumed: [Total=%s, Type=%s]",
+            total_count,
+            item_type.__name__,
+        )
+        return ConsumeLinkableResp(total_consumed=total_count)
+
+    async def send_multi(
+        self,
+        class_: Type[MR],
+        api: str,
+        **kwargs: Any,
+    ) -> MultiResult[MR]:
+        chunks: List[List[Any]] = _chunks(api, kwargs.get("json"))
+        if len(chunks) <= 1:
+            return await self._send_multi(class_, api, **kwargs)
+        # Chunks sent at once, like the threads of the sync client
+        semaphore: asyncio.Semaphore = asyncio.Semaphore(self._pool_maxsize)
+
+        async def send_chunk(chunk: List[Any]) -> MultiResult[MR]:
+            async with semaphore:
+                return await self._send_multi(
+                    class_, api, **{**kwargs, "json": chunk}
+                )
+
+        return _merge_multi(
+            class_,
+            chunks,
+            list(await asyncio.gather(*[send_chunk(c) for c in chunks])),
+        )
+
+    @async_result
+    async def send_sandbox_result(
+        self,
+        class_: Type[R],
+        api: Api,
+        submit_id: str,
+        poll: bool,
+        poll_time_sec: float,
+        poll_strategy: Optional[PollStrategy] = None,
+    ) -> R:
+        if poll:
+            await _poll_status(
+                lambda: self._process(
+                    SandboxSubmissionStatusResp,
+                    Api.GET_SANDBOX_SUBMISSION_STATUS.value.format(submit_id),
+                ),
+                poll_time_sec,
+                poll_strategy or self._poll_strategy,
+                self._instrumentation,
+            )
+        return await self._process(class_, api.value.format(submit_id))
+
+    @async_result
+    async def send_task_result(
+        self,
+        class_: Type[T],
+        task_id: str,
+        poll: bool,
+        poll_time_sec: float,
+        poll_strategy: Optional[PollStrategy] = None,
+    ) -> T:
+        status_call: Callable[[], Awaitable[T]] = lambda: self._process(
+            class_,
+            Api.GET_TASK_RESULT.value.format(task_id),
+        )
+        if poll:
+            return await _poll_status(
+                status_call,
+                poll_time_sec,
+                poll_strategy or self._poll_strategy,
+                self._instrumentation,
+            )
+        return await status_call()
+
+    async def iter_task_results(
+        self,
+        class_: Type[T],
+        task_ids: List[str],
+        poll_time_sec: float,
+        poll_strategy: Optional[PollStrategy] = None,
+    ) -> AsyncIterator[Tuple[str, Result[T]]]:
+        loop = asyncio.get_running_loop()
+        strategy: PollStrategy = poll_strategy or self._poll_strategy
+        deadline: float = loop.time() + poll_time_sec
+        pending: List[str] = list(dict.fromkeys(task_ids))
+        delays: Iterator[float] = strategy.delays()
+        delay: float = strategy.first()
+        while pending:
+            await asyncio.sleep(min(delay, max(deadline - loop.time(), 0)))
+            running: Dict[str, Result[T]] = {}
+            for task in asyncio.as_completed(
+                [self._task_result(class_, task_id) for task_id in pending]
+            ):
+                task_id, task_result = await task
+                if _is_running(task_result):
+                    running[task_id] = task_result
+                else:
+                    yield task_id, task_result
+            if loop.time() >= deadline:
+                for task_id, task_result in running.items():
+                    yield task_id, task_result
+                return
+            pending = [t for t in pending if t in running]
+            delay = next(delays)
+
+    async def iter_linkable(
+        self,
+        class_: Type[BaseLinkableResp[C]],
+        api: str,
+        **kwargs: Any,
+    ) -> AsyncIterator[C]:
+        async for response in self._iter_pages(class_, api, **kwargs):
+            for item in response.items:
+                yield item
+
+    async def _consume_linkable(
+        self,
+        class_: Type[BaseLinkableResp[C]],
+        api: str,
+        consumer: Callable[[C], Optional[Awaitable[None]]],
+        prefetch: int = 0,
+        **kwargs: Any,
+    ) -> int:
+        total_count: int = 0
+        pages: AsyncIterator[BaseLinkableResp[C]] = self._iter_pages(
+            class_, api, **kwargs
+        )
+        if prefetch > 0:
+            pages = _prefetch(pages, prefetch)
+        path: str = api_path(self._url + api)
+        async for response in pages:
+            start: float = time.perf_counter()
+            for item in response.items:
+                await _call(consumer, item)
+                total_count += 1
+            self._instrumentation.consumed(
+                path, len(response.items), time.perf_counter() - start
+            )
+        log.debug(
+            "Records consumed: [Total=%s, Type=%s]",
+            total_count,
+            class_.__name__,
+        )
+        return total_count
+
+    async def _consume_checkpointed(
+        self,
+        class_: Type[BaseLinkableResp[C]],
+        api: str,
+        consumer: Callable[[C], Optional[Awaitable[None]]],
+        store: CheckpointStore,
+        time_range: Tuple[str, str],
+        prefetch: int = 0,
+        **kwargs: Any,
+    ) -> int:
+        # At-least-once: progress is saved once a page is consumed and on
+        # errors, after a crash the records of the page being consumed
+        # are consumed again
+        state: Checkpoint = self._load_checkpoint(
+            store, api, time_range, kwargs.get("params", {})
+        )
+        link: Optional[str] = state.link
+        offset: int = state.offset
+        total_count: int = 0
+        pages: AsyncIterator[BaseLinkableResp[C]] = self._iter_pages(
+            class_, _uri(state.link or ""), headers=kwargs.get("headers", {})
+        )
+        if prefetch > 0:
+            pages = _prefetch(pages, prefetch)
+        try:
+            async for response in pages:
+                for item in response.items[offset:]:
+                    await _call(consumer, item)
+                    offset += 1
+                    total_count += 1
+                link, offset = response.next_link, 0
+                store.save(Checkpoint(link, 0, state.watermark))
+        finally:
+            if link:
+                store.save(Checkpoint(link, offset, state.watermark))
+        log.debug(
+            "Records consumed: [Total=%s, Type=%s]",
+            total_count,
+            class_.__name__,
+        )
+        return total_count
+
+    async def _consume_stream(
+        self,
+        class_: Type[BaseLinkableResp[C]],
+        api: str,
+        consumer: Callable[[C], Optional[Awaitable[None]]],
+        **kwargs: Any,
+    ) -> int:
+        total_count, response = await self._stream(
+            class_, api, consumer, **kwargs
+        )
+        while response.next_link:
+            sr: SplitResult = urlsplit(response.next_link)
+            log.debug("Found nextLink")
+            count, response = await self._stream(
+                class_,
+                f"{sr.path[5:]}?{sr.query}",
+                consumer,
+                headers=kwargs.get("headers", {}),
+            )
+            total_count += count
+        log.debug(
+            "Records consumed: [Total=%s, Type=%s]",
+            total_count,
+            class_.__name__,
+        )
+        return total_count
+
+    async def _iter_pages(
+        self,
+        class_: Type[BaseLinkableResp[C]],
+        api: str,
+        **kwargs: Any,
+    ) -> AsyncIterator[BaseLinkableResp[C]]:
+        response: BaseLinkableResp[C] = await self._process(
+            class_, api, **kwargs
+        )
+        yield response
+        while response.next_link:
+            sr: SplitResult = urlsplit(response.next_link)
+            log.debug("Found nextLink")
+            response = await self._process(
+                class_,
+                f"{sr.path[5:]}?{sr.query}",
+                headers=kwargs.get("headers", {}),
+            )
+            yield response
+
+    async def _iter_raw_pages(
+        self, api: str, **kwargs: Any
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        uri: str = api
+        while True:
+            log.debug(
+                "Processing raw request [URI=%s, Options=%s]",
+                uri,
+                logs.Lazy(logs.redact, kwargs),
+            )
+            raw_response: Response = await self._send_internal(
+                self._prepare(uri, HttpMethod.GET, **kwargs)
+            )
+            _validate(raw_response)
+            data: Dict[str, Any] = _json(raw_response)
+            yield data.get("items") or []
+            if not data.get("nextLink"):
+                return
+            sr: SplitResult = urlsplit(data["nextLink"])
+            log.debug("Found nextLink")
+            uri = f"{sr.path[5:]}?{sr.query}"
+            kwargs = {"headers": kwargs.get("headers", {})}
+
+    @async_multi_result
+    async def _send_multi(
+        self,
+        class_: Type[MR],
+        api: str,
+        **kwargs: Any,
+    ) -> MR:
+        return await self._process(
+            class_,
+            api,
+            HttpMethod.POST,
+            **kwargs,
+        )
+
+    async def _task_result(
+        self, class_: Type[T], task_id: str
+    ) -> Tuple[str, Result[T]]:
+        return task_id, await self.send_task_result(class_, task_id, False, 0)
+
+    async def _process(
+        self,
+        class_: Type[R],
+        uri: str,
+        method: HttpMethod = HttpMethod.GET,
+        **kwargs: Any,
+    ) -> R:
+        log.debug(
+            "Processing request [Method=%s, Class=%s, URI=%s, Options=%s]",
+            method.value,
+            class_.__name__,
+            uri,
+            logs.Lazy(logs.redact, kwargs),
+        )
+        request: PreparedRequest = self._prepare(uri, method, **kwargs)
+        cached: Optional[R] = self._conditional(class_, request)
+        raw_response: Response = await self._send_internal(request)
+        if cached is not None and raw_response.status_code == NOT_MODIFIED:
+            log.debug("Response not modified [URL=%s]", request.url)
+            return cached
+        _validate(raw_response)
+        start: float = time.perf_counter()
+        response: R = _parse_data(raw_response, class_, self._lazy_validation)
+        self._instrumentation.parsed(
+            api_path(request.url),
+            _records(response),
+            time.perf_counter() - start,
+        )
+        return self._cache(class_, request, response)
+
+    async def _stream(
+        self,
+        class_: Type[BaseLinkableResp[C]],
+        uri: str,
+        consumer: Callable[[C], Optional[Awaitable[None]]],
+        **kwargs: Any,
+    ) -> Tuple[int, BaseLinkableResp[C]]:
+        log.debug(
+            "Streaming request [Class=%s, URI=%s, Options=%s]",
+            class_.__name__,
+            uri,
+            logs.Lazy(logs.redact, kwargs),
+        )
+        consumer = self._caching(class_, consumer)
+        request: PreparedRequest = self._prepare(uri, HttpMethod.GET, **kwargs)
+        with http_errors():
+            raw_response: httpx.Response = await self._send_raw(request, True)
+            try:
+                response: Response = requests_response(raw_response)
+                if not _is_streamable(response):
+                    await raw_response.aread()
+                    response = requests_response(raw_response)
+                    _log_response(response)
+                    _validate(response)
+                    page: BaseLinkableResp[C] = _parse_data(
+                        response, class_, self._lazy_validation
+                    )
+                    for item in page.items:
+                        await _call(consumer, item)
+                    return len(page.items), page
+                _log_response(response, True)
+                parser: ItemStreamParser = ItemStreamParser()
+                count: int = 0
+                async for chunk in raw_response.aiter_bytes(STREAM_CHUNK_SIZE):
+                    count += await _consume_items(
+                        _item_parser(class_, self._lazy_validation),
+                        parser.feed(chunk),
+                        consumer,
+                    )
+                count += await _consume_items(
+                    _item_parser(class_, self._lazy_validation),
+                    parser.close(),
+                    consumer,
+                )
+            finally:
+                await raw_response.aclose()
+        return count, class_(**{**parser.envelope, "items": []})
+
+    async def _send_internal(self, request: PreparedRequest) -> Response:
+        with http_errors():
+            raw_response: httpx.Response = await self._send_raw(request)
+        response: Response = requests_response(raw_response)
+        _log_response(response)
+        return response
+
+    async def _send_raw(
+        self, request: PreparedRequest, stream: bool = False
+    ) -> httpx.Response:
+        attempt: int = 0
+        retry: int = 0
+        path: str = api_path(request.url)
+        while True:
+            wait: float = self._rate_limiter.reserve(str(request.url))
+            if wait > 0:
+                await asyncio.sleep(wait)
+            _log_request(request)
+            self._instrumentation.request(path, str(request.method))
+            start: float = time.perf_counter()
+            try:
+                raw_response: httpx.Response = await self._client.send(
+                    self._build(request), stream=stream
+                )
+            except httpx.TransportError as exc:
+                delay: Optional[float] = self._retry_delay(request, retry, exc)
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+                retry += 1
+                continue
+            self._instrumentation.response(
+                path,
+                str(request.method),
+                raw_response.status_code,
+                time.perf_counter() - start,
+                0,
+                _size(
+                    raw_response.headers,
+                    None if stream else raw_response.content,
+                ),
+            )
+            if self._throttled(
+                request,
+                raw_response.status_code,
+                raw_response.headers,
+                attempt,
+            ):
+                await raw_response.aclose()
+                attempt += 1
+                continue
+            delay = self._retry_delay(request, retry, raw_response.status_code)
+            if delay is None:
+                return raw_response
+            await raw_response.aclose()
+            await asyncio.sleep(delay)
+            retry += 1
+
+    def _build(self, request: PreparedRequest) -> httpx.Request:
+        return self._client.build_request(
+            str(request.method),
+            str(request.url),
+            headers=dict(request.headers),
+            content=request.body,
+        )
+
+
+async def _call(
+    consumer: Callable[[C], Optional[Awaitable[None]]], item: C
+) -> None:
+    consumed: Optional[Awaitable[None]] = consumer(item)
+    if inspect.isawaitable(consumed):
+        await consumed
+
+
+async def _consume_items(
+    parse: Callable[[Any], C],
+    items: List[Any],
+    consumer: Callable[[C], Optional[Awaitable[None]]],
+) -> int:
+    for item in items:
+        await _call(consumer, parse(item))
+    return len(items)
+
+
+async def _prefetch(
+    pages: AsyncIterator[BaseLinkableResp[C]], size: int
+) -> AsyncIterator[BaseLinkableResp[C]]:
+    buffer: asyncio.Queue[
+        Tuple[Optional[BaseLinkableResp[C]], Optional[Exception]]
+    ] = asyncio.Queue(size)
+
+    async def produce() -> None:
+        try:
+            async for page in pages:
+                await buffer.put((page, None))
+            await buffer.put((None, None))
+        except Exception as exc:
+            await buffer.put((None, exc))
+
+    producer: asyncio.Task[None] = asyncio.ensure_future(produce())
+    try:
+        while True:
+            page, error = await buffer.get()
+            if error:
+                raise error
+            if page is None:
+                return
+            yield page
+    finally:
+        producer.cancel()
+
+
+async def _poll_status(
+    status_call: Callable[[], Awaitable[S]],
+    poll_time_sec: float,
+    strategy: PollStrategy = PollStrategy(),
+    instrumentation: Instrumentation = Instrumentation(),
+) -> S:
+    loop = asyncio.get_running_loop()
+    start: float = loop.time()
+    deadline: float = start + poll_time_sec
+    await asyncio.sleep(min(strategy.first(), max(poll_time_sec, 0)))
+    response: S = await status_call()
+    polls: int = 1
+    for delay in strategy.delays():
+        remaining: float = deadline - loop.time()
+        if remaining <= 0 or response.status not in POLLED_STATUSES:
+            break
+        await asyncio.sleep(min(delay, remaining))
+        response = await status_call()
+        polls += 1
+    instrumentation.polled(response.status.value, polls, loop.time() - start)
+    return response
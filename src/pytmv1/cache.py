@@ -0,0 +1,297 @@
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Dict, List, Optional, Set, Tuple, Union
+
+from .model.common import EndpointDetail, EndpointSecurityEndpoint
+from .model.response import BaseResponse
+
+
+class ResponseCache:
+    """Parsed responses of ETag tagged reads (alerts, notes, API keys and
+    pipelines) by token and url.
+
+    A cached read is sent with If-None-Match and a 304 Not Modified answer
+    returns the cached response as is, without downloading nor validating
+    it again. The returned response is shared between the reads and should
+    not be modified. Entries expire ttl seconds after being stored and the
+    least recently used ones are evicted beyond maxsize.
+
+    :param maxsize: Maximum number of responses kept.
+    :type maxsize: int
+    :param ttl: Seconds a response is kept after being stored.
+    :type ttl: float
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 300):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[
+            Tuple[str, str], Tuple[str, BaseResponse, float]
+        ] = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, token: str, url: str) -> Optional[Tuple[str, BaseResponse]]:
+        """ETag and response stored for the url, if not expired.
+
+        :param token: Token of the client.
+        :type token: str
+        :param url: Url of the read.
+        :type url: str
+        :rtype: Optional[Tuple[str, BaseResponse]]
+        """
+        with self._lock:
+            entry = self._entries.get((token, url))
+            if entry is None:
+                return None
+            etag, response, expires = entry
+            if expires <= time.monotonic():
+                del self._entries[(token, url)]
+                return None
+            self._entries.move_to_end((token, url))
+            return etag, response
+
+    def put(
+        self, token: str, url: str, etag: str, response: BaseResponse
+    ) -> None:
+        """Stores the response of the url.
+
+        :param token: Token of the client.
+        :type token: str
+        :param url: Url of the read.
+        :type url: str
+        :param etag: ETag of the response.
+        :type etag: str
+        :param response: Parsed response.
+        :type response: BaseResponse
+        """
+        with self._lock:
+            self._entries[(token, url)] = (
+                etag,
+                response,
+                time.monotonic() + self.ttl,
+            )
+            self._entries.move_to_end((token, url))
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Removes every response."""
+        with self._lock:
+            self._entries.clear()
+
+
+@dataclass
+class _EndpointEntry:
+    detail: Optional[EndpointDetail] = None
+    endpoint: Optional[EndpointSecurityEndpoint] = None
+    detail_expires: float = 0
+    endpoint_expires: float = 0
+    names: Set[str] = field(default_factory=set)
+    ips: Set[str] = field(default_factory=set)
+    macs: Set[str] = field(default_factory=set)
+
+
+class EndpointCache:
+    """Endpoint details and endpoint inventory records by agent GUID,
+    indexed by endpoint name, IP and MAC address.
+
+    Endpoint details read with get_endpoint are served from the cache
+    until they expire, consumed or listed endpoints are stored as they are
+    received, so consuming the inventory warms the cache up. Names and MAC
+    addresses are matched case insensitively. Endpoint details and
+    inventory records expire ttl seconds after being stored, each on its
+    own, and the least recently used endpoints are evicted beyond maxsize.
+
+    :param maxsize: Maximum number of endpoints kept.
+    :type maxsize: int
+    :param ttl: Seconds endpoint details or an inventory record are kept
+     after being stored.
+    :type ttl: float
+    """
+
+    def __init__(self, maxsize: int = 10000, ttl: float = 3600):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[str, _EndpointEntry] = OrderedDict()
+        self._by_name: Dict[str, Set[str]] = {}
+        self._by_ip: Dict[str, Set[str]] = {}
+        self._by_mac: Dict[str, Set[str]] = {}
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_detail(self, agent_guid: str) -> Optional[EndpointDetail]:
+        """Endpoint details of the agent, if stored and not expired.
+
+        :param agent_guid: GUID of the agent.
+        :type agent_guid: str
+        :rtype: Optional[EndpointDetail]
+        """
+        with self._lock:
+            entry: Optional[_EndpointEntry] = self._entry(agent_guid)
+            return entry.detail if entry else None
+
+    def get_endpoint(
+        self, agent_guid: str
+    ) -> Optional[EndpointSecurityEndpoint]:
+        """Inventory record of the agent, if stored and not expired.
+
+        :param agent_guid: GUID of the agent.
+        :type agent_guid: str
+        :rtype: Optional[EndpointSecurityEndpoint]
+        """
+        with self._lock:
+            entry: Optional[_EndpointEntry] = self._entry(agent_guid)
+            return entry.endpoint if entry else None
+
+    def find_by_name(self, name: str) -> List[str]:
+        """GUIDs of the agents with this endpoint name.
+
+        :param name: Endpoint name.
+        :type name: str
+        :rtype: List[str]
+        """
+        return self._find(self._by_name, name.lower())
+
+    def find_by_ip(self, ip: str) -> List[str]:
+        """GUIDs of the agents with this IP address.
+
+        :param ip: IP address.
+        :type ip: str
+        :rtype: List[str]
+        """
+        return self._find(self._by_ip, ip)
+
+    def find_by_mac(self, mac: str) -> List[str]:
+        """GUIDs of the agents with this MAC address.
+
+        :param mac: MAC address, colon or dash separated.
+        :type mac: str
+        :rtype: List[str]
+        """
+        return self._find(self._by_mac, _mac(mac))
+
+    def put(
+        self, endpoint: Union[EndpointDetail, EndpointSecurityEndpoint]
+    ) -> None:
+        """Stores endpoint details or an inventory record, records without
+        agent GUID are ignored.
+
+        :param endpoint: Endpoint details or inventory record.
+        :type endpoint: Union[EndpointDetail, EndpointSecurityEndpoint]
+        """
+        if not endpoint.agent_guid:
+            return
+        with self._lock:
+            entry: _EndpointEntry = self._entries.pop(
+                endpoint.agent_guid, _EndpointEntry()
+            )
+            self._unindex(endpoint.agent_guid, entry)
+            if isinstance(endpoint, EndpointDetail):
+                entry.detail = endpoint
+                entry.detail_expires = time.monotonic() + self.ttl
+            else:
+                entry.endpoint = endpoint
+                entry.endpoint_expires = time.monotonic() + self.ttl
+            self._entries[endpoint.agent_guid] = entry
+            self._index(endpoint.agent_guid, entry)
+            while len(self._entries) > self.maxsize:
+                self._remove(next(iter(self._entries)))
+
+    def invalidate(self, agent_guid: str) -> None:
+        """Removes the endpoint of the agent.
+
+        :param agent_guid: GUID of the agent.
+        :type agent_guid: str
+        """
+        with self._lock:
+            if agent_guid in self._entries:
+                self._remove(agent_guid)
+
+    def clear(self) -> None:
+        """Removes every endpoint."""
+        with self._lock:
+            self._entries.clear()
+            self._by_name.clear()
+            self._by_ip.clear()
+            self._by_mac.clear()
+
+    def _entry(self, agent_guid: str) -> Optional[_EndpointEntry]:
+        entry: Optional[_EndpointEntry] = self._entries.get(agent_guid)
+        if entry is None:
+            return None
+        now: float = time.monotonic()
+        if (entry.detail is not None and entry.detail_expires <= now) or (
+            entry.endpoint is not None and entry.endpoint_expires <= now
+        ):
+            # Only the expired record is dropped, the other one is kept
+            self._unindex(agent_guid, entry)
+            if entry.detail_expires <= now:
+                entry.detail = None
+            if entry.endpoint_expires <= now:
+                entry.endpoint = None
+            if entry.detail is None and entry.endpoint is None:
+                del self._entries[agent_guid]
+                return None
+            self._index(agent_guid, entry)
+        self._entries.move_to_end(agent_guid)
+        return entry
+
+    def _find(self, index: Dict[str, Set[str]], value: str) -> List[str]:
+        with self._lock:
+            return [
+                agent_guid
+                for agent_guid in sorted(index.get(value, ()))
+                if self._entry(agent_guid)
+            ]
+
+    def _index(self, agent_guid: str, entry: _EndpointEntry) -> None:
+        for record in (entry.detail, entry.endpoint):
+            if record is None:
+                continue
+            if record.endpoint_name:
+                entry.names.add(record.endpoint_name.lower())
+            if record.last_used_ip:
+                entry.ips.add(record.last_used_ip)
+            if isinstance(record, EndpointSecurityEndpoint):
+                entry.ips.update(record.ip_addresses)
+                continue
+            for interface in record.interfaces:
+                entry.ips.update(interface.ip_addresses)
+                if interface.mac_address:
+                    entry.macs.add(_mac(interface.mac_address))
+        for index, values in (
+            (self._by_name, entry.names),
+            (self._by_ip, entry.ips),
+            (self._by_mac, entry.macs),
+        ):
+            for value in values:
+                index.setdefault(value, set()).add(agent_guid)
+
+    def _unindex(self, agent_guid: str, entry: _EndpointEntry) -> None:
+        for index, values in (
+            (self._by_name, entry.names),
+            (self._by_ip, entry.ips),
+            (self._by_mac, entry.macs),
+        ):
+            for value in values:
+                agents: Set[str] = index.get(value, set())
+                agents.discard(agent_guid)
+                if not agents:
+                    index.pop(value, None)
+            values.clear()
+
+    def _remove(self, agent_guid: str) -> None:
+        self._unindex(agent_guid, self._entries.pop(agent_guid))
+
+
+def _mac(mac: str) -> str:
+    return mac.replace("-", ":").lower()
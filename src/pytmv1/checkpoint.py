@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+from abc import ABC, abstractmethod
+from contextlib import closing
+from dataclasses import asdict, dataclass
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class Checkpoint:
+    """Progress of a long-running consumption.
+
+    :param link: Url of the page being consumed, None when the time range
+     has been fully consumed.
+    :type link: Optional[str]
+    :param offset: Number of records of the page already consumed.
+    :type offset: int
+    :param watermark: End of the time range being (or last) consumed, the
+     next consumption starts from it (yyyy-MM-ddThh:mm:ssZ).
+    :type watermark: Optional[str]
+    """
+
+    link: Optional[str] = None
+    offset: int = 0
+    watermark: Optional[str] = None
+
+
+class CheckpointStore(ABC):
+    """Persists the checkpoint of a consumption so a restarted process
+    resumes where the previous one stopped.
+    """
+
+    @abstractmethod
+    def load(self) -> Optional[Checkpoint]:
+        """Last saved checkpoint, None if nothing was saved yet.
+
+        :rtype: Optional[Checkpoint]
+        """
+
+    @abstractmethod
+    def save(self, checkpoint: Checkpoint) -> None:
+        """Saves the checkpoint, replacing the previous one.
+
+        :param checkpoint: Checkpoint to save.
+        :type checkpoint: Checkpoint
+        """
+
+
+class FileCheckpointStore(CheckpointStore):
+    """Stores the checkpoint as a JSON file, replaced atomically so a crash
+    while saving leaves the previous checkpoint intact.
+
+    :param path: Path of the checkpoint file.
+    :type path: str
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def load(self) -> Optional[Checkpoint]:
+        if not os.path.exists(self.path):
+            return None
+        with open(self.path, encoding="utf-8") as file:
+            return Checkpoint(**json.load(file))
+
+    def save(self, checkpoint: Checkpoint) -> None:
+        tmp_path: str = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as file:
+            json.dump(asdict(checkpoint), file)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(tmp_path, self.path)
+
+
+class SQLiteCheckpointStore(CheckpointStore):
+    """Stores checkpoints in a SQLite database, several consumptions can
+    share the same database under different keys.
+
+    :param path: Path of the database file.
+    :type path: str
+    :param key: Name of the consumption (ie: "oat").
+    :type key: str
+    """
+
+    def __init__(self, path: str, key: str):
+        self.path = path
+        self.key = key
+        with closing(sqlite3.connect(self.path)) as conn, conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS checkpoint (key TEXT PRIMARY"
+                " KEY, link TEXT, offset INTEGER, watermark TEXT)"
+            )
+
+    def load(self) -> Optional[Checkpoint]:
+        with closing(sqlite3.connect(self.path)) as conn:
+            row = conn.execute(
+                "SELECT link, offset, watermark FROM checkpoint"
+                " WHERE key = ?",
+                (self.key,),
+            ).fetchone()
+        return Checkpoint(*row) if row else None
+
+    def save(self, checkpoint: Checkpoint) -> None:
+        with closing(sqlite3.connect(self.path)) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO checkpoint VALUES (?, ?, ?, ?)",
+                (
+                    self.key,
+                    checkpoint.link,
+                    checkpoint.offset,
+                    checkpoint.watermark,
+                ),
+            )
@@ -2,15 +2,30 @@ from __future__ import annotations
 
 import logging
 import threading
-from functools import lru_cache
+import time
+from collections import OrderedDict
 from logging import Logger
-from typing import Any
+from typing import Any, Dict, Optional, Tuple
+
+from requests.adapters import BaseAdapter
 
 from . import api
+from .adapter import POOL_TIMEOUT, PoolStats, default_pool_maxsize
+from .cache import EndpointCache, ResponseCache
 from .core import Core
+from .instrument import Instrumentation
+from .poll import PollStrategy
+from .retry import RetryPolicy
+from .throttle import RateLimiter
 
 log: Logger = logging.getLogger(__name__)
-lock = threading.Lock()
+
+TRANSPORT_OPTIONS: Tuple[str, ...] = (
+    "pool_connections",
+    "pool_maxsize",
+    "http2",
+    "pool_timeout",
+)
 
 
 def init(
@@ -18,9 +33,18 @@ def init(
     token: str,
     url: str,
     pool_connections: int = 1,
-    pool_maxsize: int = 1,
+    pool_maxsize: Optional[int] = None,
     connect_timeout: int = 10,
     read_timeout: int = 30,
+    lazy_validation: bool = False,
+    poll_strategy: Optional[PollStrategy] = None,
+    rate_limiter: Optional[RateLimiter] = None,
+    retry_policy: Optional[RetryPolicy] = None,
+    http2: bool = False,
+    pool_timeout: float = POOL_TIMEOUT,
+    response_cache: Optional[ResponseCache] = None,
+    endpoint_cache: Optional[EndpointCache] = None,
+    instrumentation: Optional[Instrumentation] = None,
 ) -> Client:
     """Synchronized Helper function to initialize a :class:`Client`.
 
@@ -32,36 +56,203 @@ def init(
     :type url: str
     :param pool_connections: (optional) Number of connection to cache.
     :type pool_connections: int
-    :param pool_maxsize: (optional) Maximum size of the pool.
-    :type pool_maxsize: int
+    :param pool_maxsize: (optional) Maximum size of the pool, defaults to
+     the default worker count of a thread pool (CPU count + 4, up to 32).
+    :type pool_maxsize: Optional[int]
     :param connect_timeout: (optional) Seconds before connection timeout.
     :type connect_timeout: int
     :param read_timeout: (optional) Seconds before read timeout.
     :type connect_timeout: int
+    :param lazy_validation: (optional) Validate fields of listed and consumed
+     records on first access instead of upfront.
+    :type lazy_validation: bool
+    :param poll_strategy: (optional) Default delays between the status
+     checks of polled task results and sandbox submissions.
+    :type poll_strategy: PollStrategy
+    :param rate_limiter: (optional) Paces requests per API family and
+     retries throttled requests, can be shared between clients.
+    :type rate_limiter: RateLimiter
+    :param retry_policy: (optional) Retries of requests failing on
+     connection errors, timeouts or transient server errors.
+    :type retry_policy: RetryPolicy
+    :param http2: (optional) Send requests over HTTP/2, concurrent requests
+     share one connection (requires pip install pytmv1[http2]).
+    :type http2: bool
+    :param pool_timeout: (optional) Seconds to wait for a free connection
+     before failing when all connections of the pool are in use.
+    :type pool_timeout: float
+    :param response_cache: (optional) Cache of alert, note, API key and
+     pipeline reads, revalidated with their ETag.
+    :type response_cache: ResponseCache
+    :param endpoint_cache: (optional) Cache of endpoint details and
+     inventory records, indexed by endpoint name, IP and MAC address.
+    :type endpoint_cache: EndpointCache
+    :param instrumentation: (optional) Callbacks reporting the latency,
+     size, records, retries and errors of the requests.
+    :type instrumentation: Instrumentation
     :rtype: Client
     """
-    lock.acquire()
-    _cl = _client(
-        appname=name,
-        token=token,
-        url=url,
+    return _registry.get(
+        name,
+        token,
+        url,
         pool_connections=pool_connections,
         pool_maxsize=pool_maxsize,
         connect_timeout=connect_timeout,
         read_timeout=read_timeout,
+        lazy_validation=lazy_validation,
+        poll_strategy=poll_strategy,
+        rate_limiter=rate_limiter,
+        retry_policy=retry_policy,
+        http2=http2,
+        pool_timeout=pool_timeout,
+        response_cache=response_cache,
+        endpoint_cache=endpoint_cache,
+        instrumentation=instrumentation,
     )
-    lock.release()
-    return _cl
 
 
-@lru_cache(maxsize=1)
-def _client(**kwargs: Any) -> Client:
-    log.debug(
-        "Initializing new client with [Appname=%s, Token=*****, URL=%s]",
-        kwargs["appname"],
-        kwargs["url"],
-    )
-    return Client(Core(**kwargs))
+class ClientRegistry:
+    """Clients by tenant (application name, token, url and options), so a
+    process switching between many tenants reuses their clients.
+
+    Tenants of the same region url and transport options share one
+    connection pool, the least recently used clients are evicted when
+    the registry is full or idle for too long, and the pool is closed
+    once none of its clients remain. An evicted client must not be used
+    anymore.
+
+    :param maxsize: Maximum number of clients kept.
+    :type maxsize: int
+    :param idle_timeout: Seconds after which an unused client is evicted,
+     never when None.
+    :type idle_timeout: Optional[float]
+    """
+
+    def __init__(
+        self, maxsize: int = 128, idle_timeout: Optional[float] = None
+    ):
+        self.maxsize = maxsize
+        self.idle_timeout = idle_timeout
+        # Client, key of its connection pool and last use by tenant
+        self._clients: OrderedDict[
+            Tuple[Any, ...], Tuple[Client, Tuple[Any, ...], float]
+        ] = OrderedDict()
+        self._pools: Dict[Tuple[Any, ...], Tuple[BaseAdapter, int]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    def get(
+        self,
+        name: str,
+        token: str,
+        url: str,
+        pool_connections: int = 1,
+        pool_maxsize: Optional[int] = None,
+        connect_timeout: int = 10,
+        read_timeout: int = 30,
+        lazy_validation: bool = False,
+        poll_strategy: Optional[PollStrategy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        http2: bool = False,
+        pool_timeout: float = POOL_TIMEOUT,
+        response_cache: Optional[ResponseCache] = None,
+        endpoint_cache: Optional[EndpointCache] = None,
+        instrumentation: Optional[Instrumentation] = None,
+    ) -> Client:
+        """Client of the tenant, created on first use (see :func:`init` for
+        the parameters).
+
+        :rtype: Client
+        """
+        options: Dict[str, Any] = {
+            "pool_connections": pool_connections,
+            "pool_maxsize": pool_maxsize or default_pool_maxsize(),
+            "connect_timeout": connect_timeout,
+            "read_timeout": read_timeout,
+            "lazy_validation": lazy_validation,
+            "poll_strategy": poll_strategy,
+            "rate_limiter": rate_limiter,
+            "retry_policy": retry_policy,
+            "http2": http2,
+            "pool_timeout": pool_timeout,
+            "response_cache": response_cache,
+            "endpoint_cache": endpoint_cache,
+            "instrumentation": instrumentation,
+        }
+        key: Tuple[Any, ...] = (name, token, url, *options.values())
+        pool_key: Tuple[Any, ...] = (
+            url,
+            *(options[option] for option in TRANSPORT_OPTIONS),
+        )
+        with self._lock:
+            now: float = time.monotonic()
+            entry = self._clients.pop(key, None)
+            self._evict(now)
+            client: Client = (
+                entry[0]
+                if entry
+                else self._create(name, token, url, pool_key, options)
+            )
+            self._clients[key] = (client, pool_key, now)
+            while len(self._clients) > self.maxsize:
+                self._release(self._clients.popitem(last=False)[1][1])
+            return client
+
+    def close(self) -> None:
+        """Evicts every client and closes their connection pools."""
+        with self._lock:
+            while self._clients:
+                self._release(self._clients.popitem()[1][1])
+
+    def _create(
+        self,
+        name: str,
+        token: str,
+        url: str,
+        pool_key: Tuple[Any, ...],
+        options: Dict[str, Any],
+    ) -> Client:
+        log.debug(
+            "Initializing new client with [Appname=%s, Token=*****, URL=%s]",
+            name,
+            url,
+        )
+        pool: Optional[Tuple[BaseAdapter, int]] = self._pools.get(pool_key)
+        core: Core = Core(
+            appname=name,
+            token=token,
+            url=url,
+            adapter=pool[0] if pool else None,
+            **options,
+        )
+        self._pools[pool_key] = (core._adapter, pool[1] + 1 if pool else 1)
+        return Client(core)
+
+    def _evict(self, now: float) -> None:
+        if self.idle_timeout is None:
+            return
+        while self._clients:
+            _, pool_key, last_used = next(iter(self._clients.values()))
+            if now - last_used < self.idle_timeout:
+                return
+            self._clients.popitem(last=False)
+            self._release(pool_key)
+
+    def _release(self, pool_key: Tuple[Any, ...]) -> None:
+        adapter, count = self._pools[pool_key]
+        if count > 1:
+            self._pools[pool_key] = (adapter, count - 1)
+            return
+        del self._pools[pool_key]
+        log.debug("Closing connection pool [URL=%s]", pool_key[0])
+        adapter.close()
+
+
+_registry: ClientRegistry = ClientRegistry()
 
 
 class Client:
@@ -79,3 +270,11 @@ class Client:
         self.script = api.CustomScript(self._core)
         self.system = api.System(self._core)
         self.task = api.Task(self._core)
+
+    def pool_stats(self) -> Optional[PoolStats]:
+        """Usage of the connection pool, to size it from actual traffic
+        (None with the HTTP/2 transport).
+
+        :rtype: Optional[PoolStats]
+        """
+        return self._core.pool_stats()
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+import json
+from typing import Any, Union
+
+from requests.exceptions import JSONDecodeError
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment, unused-ignore]
+
+
+def loads(document: Union[bytes, str]) -> Any:
+    """JSON document decoded with orjson when it is installed (requires
+    pip install pytmv1[orjson]), with json otherwise.
+
+    Decoding errors are raised as requests JSONDecodeError, like
+    Response.json(), whichever decoder is used.
+
+    :param document: JSON document, utf-8 encoded when bytes.
+    :type document: Union[bytes, str]
+    :rtype: Any
+    """
+    try:
+        if orjson is not None:
+            return orjson.loads(document)
+        return json.loads(document)
+    except json.JSONDecodeError as exc:
+        raise JSONDecodeError(exc.msg, exc.doc, exc.pos) from exc
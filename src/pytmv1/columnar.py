@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from enum import Enum
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+    get_args,
+    get_origin,
+)
+
+from pydantic import BaseModel, TypeAdapter
+
+try:
+    import pyarrow
+except ImportError:  # pragma: no cover
+    pyarrow = None
+
+ColumnBatch = Dict[str, List[Any]]
+
+_ARROW_TYPES: Dict[Optional[type], Any] = (
+    {
+        bool: pyarrow.bool_(),
+        int: pyarrow.int64(),
+        float: pyarrow.float64(),
+        str: pyarrow.string(),
+    }
+    if pyarrow is not None
+    else {}
+)
+
+
+@dataclass(frozen=True)
+class Column:
+    path: Tuple[str, ...]
+    kind: Optional[type]
+    many: bool
+    default: Any
+    validators: Tuple[Callable[[Any], Any], ...] = ()
+
+    def values(self, records: List[Dict[str, Any]]) -> List[Any]:
+        convert: Callable[[Any], Any] = self._convert
+        if len(self.path) == 1:
+            key: str = self.path[0]
+            return [convert(record.get(key)) for record in records]
+        return [convert(_get(record, self.path)) for record in records]
+
+    def _convert(self, value: Any) -> Any:
+        for validator in self.validators:
+            value = validator(value)
+        if value is None:
+            return self.default
+        if self.kind is None:
+            return value
+        if self.many:
+            return [_cast(self.kind, v) for v in value]
+        return _cast(self.kind, value)
+
+
+def to_columns(
+    class_: Type[BaseModel], records: List[Dict[str, Any]]
+) -> ColumnBatch:
+    """Converts raw records to a column oriented batch.
+
+    Nested models are flattened (ie: endpoint.ips), scalar and list of
+    scalar fields are typed after the model annotations, other fields are
+    kept as returned by the API. Records are not validated, only the
+    "before" field validators of the model are applied to their column.
+
+    :param class_: Model describing the records.
+    :type class_: Type[BaseModel]
+    :param records: Records as returned by the API.
+    :type records: List[Dict[str, Any]]
+    :rtype: Dict[str, List[Any]]
+    """
+    return {
+        name: column.values(records)
+        for name, column in columns(class_).items()
+    }
+
+
+def to_record_batch(class_: Type[BaseModel], batch: ColumnBatch) -> Any:
+    """Converts a column oriented batch to a pyarrow RecordBatch.
+
+    Fields kept as returned by the API are serialized to JSON strings.
+
+    :param class_: Model describing the records.
+    :type class_: Type[BaseModel]
+    :param batch: Batch built with :func:`to_columns`.
+    :type batch: Dict[str, List[Any]]
+    :rtype: pyarrow.RecordBatch
+    """
+    if pyarrow is None:
+        raise ImportError(
+            "pyarrow is required to build record batches,"
+            " install it with: pip install pytmv1[arrow]"
+        )
+    fields: List[Any] = []
+    arrays: List[Any] = []
+    for name, column in columns(class_).items():
+        arrow_type: Any = _ARROW_TYPES.get(column.kind, pyarrow.string())
+        values: List[Any] = batch[name]
+        if column.kind not in _ARROW_TYPES:
+            values = [None if v is None else json.dumps(v) for v in values]
+        elif column.many:
+            arrow_type = pyarrow.list_(arrow_type)
+        fields.append(pyarrow.field(name, arrow_type))
+        arrays.append(pyarrow.array(values, type=arrow_type))
+    return pyarrow.RecordBatch.from_arrays(
+        arrays, schema=pyarrow.schema(fields)
+    )
+
+
+@lru_cache(maxsize=None)
+def columns(class_: Type[BaseModel]) -> Dict[str, Column]:
+    result: Dict[str, Column] = {}
+    for name, field in class_.model_fields.items():
+        key: str = field.alias or name
+        annotation: Any = _unwrap_optional(field.annotation)
+        if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+            for sub_name, column in columns(annotation).items():
+                result[f"{name}.{sub_name}"] = Column(
+                    (key, *column.path),
+                    column.kind,
+                    column.many,
+                    column.default,
+                    column.validators,
+                )
+            continue
+        many: bool = get_origin(annotation) in (list, List)
+        kind: Any = get_args(annotation)[0] if many else annotation
+        default: Any = (
+            None
+            if field.is_required()
+            else field.get_default(call_default_factory=True)
+        )
+        result[name] = Column(
+            (key,),
+            _scalar(kind),
+            many,
+            [] if many and default is None else default,
+            _before_validators(class_, name),
+        )
+    return result
+
+
+def _before_validators(
+    class_: Type[BaseModel], name: str
+) -> Tuple[Callable[[Any], Any], ...]:
+    decorators = class_.__pydantic_decorators__.field_validators
+    return tuple(
+        decorator.func
+        for decorator in decorators.values()
+        if decorator.info.mode == "before"
+        and (name in decorator.info.fields or "*" in decorator.info.fields)
+    )
+
+
+def _cast(kind: type, value: Any) -> Any:
+    return value if type(value) is kind else _validator(kind)(value)
+
+
+@lru_cache(maxsize=None)
+def _validator(kind: type) -> Callable[[Any], Any]:
+    # Coerces like the models do (ie: "false" to False), malformed values
+    # raise a ValidationError
+    return TypeAdapter(kind).validate_python
+
+
+def _get(record: Dict[str, Any], path: Tuple[str, ...]) -> Any:
+    value: Any = record
+    for key in path:
+        if not isinstance(value, dict):
+            return None
+        value = value.get(key)
+    return value
+
+
+def _scalar(kind: Any) -> Optional[type]:
+    if isinstance(kind, type) and issubclass(kind, Enum):
+        for base in (int, str):
+            if issubclass(kind, base):
+                return base
+        return None
+    return kind if kind in (bool, int, float, str) else None
+
+
+def _unwrap_optional(annotation: Any) -> Any:
+    if get_origin(annotation) is Union:
+        args: Tuple[Any, ...] = tuple(
+            arg for arg in get_args(annotation) if arg is not type(None)
+        )
+        if len(args) == 1:
+            return args[0]
+    return annotation
@@ -1,18 +1,41 @@
 import logging
 import os
-import re
 import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
+from functools import lru_cache, partial
 from logging import Logger
-from typing import Any, Callable, Dict, List, Optional, Type, Union
+from queue import Full, Queue
+from threading import Event, Lock, Thread
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    Union,
+    cast,
+    get_args,
+)
 from urllib.parse import SplitResult, urlsplit
 
 from bs4 import BeautifulSoup
-from pydantic import AnyHttpUrl, TypeAdapter
-from requests import PreparedRequest, Request, Response
+from pydantic import AnyHttpUrl, BaseModel, TypeAdapter
+from requests import ConnectionError as RequestsConnectionError
+from requests import PreparedRequest, Request, Response, Timeout
+from requests.adapters import BaseAdapter
 
-from . import utils
+from . import codec, columnar, logs, utils
 from .__about__ import __version__
-from .adapter import HTTPAdapter
+from .adapter import POOL_TIMEOUT, HTTPAdapter, HttpxAdapter, PoolStats
+from .cache import EndpointCache, ResponseCache
+from .checkpoint import Checkpoint, CheckpointStore
 from .exception import (
     ParseModelError,
     ServerHtmlError,
@@ -20,12 +43,21 @@ from .exception import (
     ServerMultiJsonError,
     ServerTextError,
 )
-from .model.common import Error, MsError, MsStatus
+from .instrument import Instrumentation, api_path
+from .model import lazy
+from .model.common import (
+    EndpointDetail,
+    EndpointSecurityEndpoint,
+    Error,
+    MsError,
+    MsStatus,
+)
 from .model.enum import Api, HttpMethod, Status, TaskAction
 from .model.request import EndpointRequest
 from .model.response import (
     MR,
     BaseLinkableResp,
+    BaseResponse,
     BaseTaskResp,
     BytesResp,
     C,
@@ -36,6 +68,7 @@ from .model.response import (
     GetEndpointDetailsResp,
     GetOatPackageResp,
     GetPipelineResp,
+    ListEndpointSecurityResp,
     MultiApiKeyResp,
     MultiResp,
     MultiUrlResp,
@@ -46,29 +79,62 @@ from .model.response import (
     T,
     TextResp,
 )
-from .result import multi_result, result
+from .poll import PollStrategy
+from .result import (
+    MultiResult,
+    Result,
+    ResultCode,
+    multi_result,
+    result,
+)
+from .retry import RetryPolicy
+from .stream import ItemStreamParser
+from .throttle import TOO_MANY_REQUESTS, RateLimiter
 
 USERAGENT_SUFFIX: str = "PyTMV1"
 API_VERSION: str = "v3.0"
+STREAM_CHUNK_SIZE: int = 64 * 1024
+MULTI_CHUNK_SIZE: int = 100
+MULTI_CHUNK_SIZES: Dict[str, int] = {Api.SUBMIT_URLS_TO_SANDBOX: 10}
+POLLED_STATUSES: Tuple[Status, ...] = (Status.QUEUED, Status.RUNNING)
+ETAG_CLASSES: Tuple[Type[BaseResponse], ...] = (
+    GetAlertResp,
+    GetAlertNoteResp,
+    GetApiKeyResp,
+    GetPipelineResp,
+)
+NOT_MODIFIED: int = 304
+JSON_BODY: str = "_pytmv1_json"
 
 log: Logger = logging.getLogger(__name__)
 
 
-class Core:
+class BaseCore:
     def __init__(
         self,
         appname: str,
         token: str,
         url: str,
-        pool_connections: int,
-        pool_maxsize: int,
         connect_timeout: int,
         read_timeout: int,
+        lazy_validation: bool = False,
+        poll_strategy: Optional[PollStrategy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        response_cache: Optional[ResponseCache] = None,
+        endpoint_cache: Optional[EndpointCache] = None,
+        instrumentation: Optional[Instrumentation] = None,
     ):
-        self._adapter = HTTPAdapter(pool_connections, pool_maxsize, 0, True)
         self._c_timeout = connect_timeout
         self._r_timeout = read_timeout
         self._appname = appname
+        self._lazy_validation = lazy_validation
+        self._poll_strategy = poll_strategy or PollStrategy()
+        self._rate_limiter = rate_limiter or RateLimiter()
+        self._retry_policy = retry_policy or RetryPolicy()
+        self._response_cache = response_cache
+        self._endpoint_cache = endpoint_cache
+        self._instrumentation = instrumentation or Instrumentation()
         self._token = token
         self._url = str(TypeAdapter(AnyHttpUrl).validate_python(_format(url)))
         self._headers: Dict[str, str] = {
@@ -80,6 +146,202 @@ class Core:
             os.getenv("HTTPS_PROXY") or os.getenv("https_proxy"),
         )
 
+    def _prepare(
+        self, uri: str, method: HttpMethod, **kwargs: Any
+    ) -> PreparedRequest:
+        return Request(
+            method.value,
+            self._url + uri,
+            headers={**self._headers, **kwargs.pop("headers", {})},
+            **kwargs,
+        ).prepare()
+
+    def _load_checkpoint(
+        self,
+        store: CheckpointStore,
+        api: str,
+        time_range: Tuple[str, str],
+        params: Dict[str, Any],
+    ) -> Checkpoint:
+        state: Checkpoint = store.load() or Checkpoint()
+        if state.link:
+            log.debug("Resuming from checkpoint [Checkpoint=%s]", state)
+            return state
+        # Fixed end time, so resumed pages and the next range agree with it
+        start_key, end_key = time_range
+        params = {
+            **params,
+            start_key: params.get(start_key) or state.watermark,
+            end_key: params.get(end_key)
+            or datetime.now(timezone.utc).strftime(utils.DATE_TIME_FORMAT),
+        }
+        state = Checkpoint(
+            self._prepare(
+                api, HttpMethod.GET, params=utils.filter_none(params)
+            ).url,
+            0,
+            params[end_key],
+        )
+        store.save(state)
+        return state
+
+    def _conditional(
+        self, class_: Type[R], request: PreparedRequest
+    ) -> Optional[R]:
+        if self._response_cache is None or not _is_cacheable(class_, request):
+            return None
+        entry: Optional[Tuple[str, BaseResponse]] = self._response_cache.get(
+            self._token, str(request.url)
+        )
+        if entry is None:
+            return None
+        request.headers["If-None-Match"] = entry[0]
+        return cast(R, entry[1])
+
+    def _cache(
+        self, class_: Type[R], request: PreparedRequest, response: R
+    ) -> R:
+        etag: str = getattr(response, "etag", "")
+        if (
+            etag
+            and self._response_cache is not None
+            and _is_cacheable(class_, request)
+        ):
+            self._response_cache.put(
+                self._token, str(request.url), etag, response
+            )
+        if self._endpoint_cache is not None:
+            _cache_endpoints(self._endpoint_cache, response)
+        return response
+
+    def _cached_endpoint(
+        self, endpoint_id: str
+    ) -> Optional[GetEndpointDetailsResp]:
+        if self._endpoint_cache is None:
+            return None
+        detail: Optional[EndpointDetail] = self._endpoint_cache.get_detail(
+            endpoint_id
+        )
+        if detail is None:
+            return None
+        log.debug("Endpoint details cached [Endpoint=%s]", endpoint_id)
+        return GetEndpointDetailsResp(data=detail)
+
+    def _caching(
+        self,
+        class_: Type[BaseLinkableResp[C]],
+        consumer: Callable[[C], Any],
+    ) -> Callable[[C], Any]:
+        cache: Optional[EndpointCache] = self._endpoint_cache
+        if cache is None or class_ is not ListEndpointSecurityResp:
+            return consumer
+
+        def cached(item: C) -> Any:
+            cache.put(cast(EndpointSecurityEndpoint, item))
+            return consumer(item)
+
+        return cached
+
+    def _throttled(
+        self,
+        request: PreparedRequest,
+        status_code: int,
+        headers: Mapping[str, str],
+        attempt: int,
+    ) -> bool:
+        if status_code != TOO_MANY_REQUESTS:
+            return False
+        delay: Optional[float] = self._rate_limiter.throttled(
+            str(request.url), headers.get("Retry-After"), attempt
+        )
+        if delay is None:
+            return False
+        log.info(
+            "Request throttled, retrying [Delay=%s, Attempt=%s, URL=%s]",
+            delay,
+            attempt + 1,
+            request.url,
+        )
+        self._instrumentation.retried(api_path(request.url), "throttled")
+        return True
+
+    def _retry_delay(
+        self,
+        request: PreparedRequest,
+        retry: int,
+        reason: Union[int, Exception],
+    ) -> Optional[float]:
+        policy: RetryPolicy = self._retry_policy
+        if retry >= policy.retries or not policy.allows(str(request.method)):
+            return None
+        if isinstance(reason, int) and reason not in policy.statuses:
+            return None
+        delay: float = policy.backoff(retry)
+        log.info(
+            "Retrying request [Reason=%s, Retry=%s, Delay=%s, URL=%s]",
+            reason,
+            retry + 1,
+            delay,
+            request.url,
+        )
+        self._instrumentation.retried(
+            api_path(request.url),
+            str(reason) if isinstance(reason, int) else type(reason).__name__,
+        )
+        return delay
+
+
+class Core(BaseCore):
+    def __init__(
+        self,
+        appname: str,
+        token: str,
+        url: str,
+        pool_connections: int,
+        pool_maxsize: int,
+        connect_timeout: int,
+        read_timeout: int,
+        lazy_validation: bool = False,
+        poll_strategy: Optional[PollStrategy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        http2: bool = False,
+        pool_timeout: float = POOL_TIMEOUT,
+        adapter: Optional[BaseAdapter] = None,
+        response_cache: Optional[ResponseCache] = None,
+        endpoint_cache: Optional[EndpointCache] = None,
+        instrumentation: Optional[Instrumentation] = None,
+    ):
+        super().__init__(
+            appname,
+            token,
+            url,
+            connect_timeout,
+            read_timeout,
+            lazy_validation,
+            poll_strategy,
+            rate_limiter,
+            retry_policy,
+            response_cache,
+            endpoint_cache,
+            instrumentation,
+        )
+        self._pool_maxsize = pool_maxsize
+        self._adapter: BaseAdapter = adapter or (
+            HttpxAdapter(pool_maxsize, self._proxies)
+            if http2
+            else HTTPAdapter(
+                pool_connections, pool_maxsize, 0, True, pool_timeout
+            )
+        )
+
+    def pool_stats(self) -> Optional[PoolStats]:
+        return (
+            self._adapter.stats()
+            if isinstance(self._adapter, HTTPAdapter)
+            else None
+        )
+
     @result
     def send(
         self,
@@ -95,16 +357,28 @@ class Core:
             **kwargs,
         )
 
-    @multi_result
+    @result
+    def send_endpoint_details(
+        self, endpoint_id: str
+    ) -> GetEndpointDetailsResp:
+        cached: Optional[GetEndpointDetailsResp] = self._cached_endpoint(
+            endpoint_id
+        )
+        if cached is not None:
+            return cached
+        return self._process(
+            GetEndpointDetailsResp,
+            Api.GET_ENDPOINT_DETAILS.value.format(endpoint_id),
+        )
+
     def send_endpoint(
         self,
         api: Api,
         *tasks: EndpointRequest,
-    ) -> MultiResp:
-        return self._process(
+    ) -> MultiResult[MultiResp]:
+        return self.send_multi(
             MultiResp,
             api,
-            HttpMethod.POST,
             json=[
                 task.model_dump(by_alias=True, exclude_none=True)
                 for task in tasks
@@ -117,8 +391,32 @@ class Core:
         class_: Type[BaseLinkableResp[C]],
         api: str,
         consumer: Callable[[C], None],
+        prefetch: int = 0,
+        stream: bool = False,
+        checkpoint: Optional[CheckpointStore] = None,
+        time_range: Tuple[str, str] = ("startDateTime", "endDateTime"),
         **kwargs: Any,
     ) -> ConsumeLinkableResp:
+        if checkpoint and stream:
+            raise ValueError("checkpoint does not support stream")
+        if checkpoint:
+            return ConsumeLinkableResp(
+                total_consumed=self._consume_checkpointed(
+                    class_,
+                    api,
+                    consumer,
+                    checkpoint,
+                    time_range,
+                    prefetch,
+                    **kwargs,
+                )
+            )
+        if stream:
+            return ConsumeLinkableResp(
+                total_consumed=self._consume_stream(
+                    class_, api, consumer, **kwargs
+                )
+            )
         return ConsumeLinkableResp(
             total_consumed=self._consume_linkable(
                 lambda: self._process(
@@ -128,22 +426,124 @@ class Core:
                 ),
                 consumer,
                 kwargs.get("headers", {}),
+                prefetch,
+                api,
             )
         )
 
-    @multi_result
+    @result
+    def send_linkable_parallel(
+        self,
+        class_: Type[BaseLinkableResp[C]],
+        api: str,
+        consumer: Callable[[C], None],
+        params: List[Dict[str, Any]],
+        prefetch: int = 0,
+        stream: bool = False,
+        boundaries: Sequence[int] = (),
+        **kwargs: Any,
+    ) -> ConsumeLinkableResp:
+        lock: Lock = Lock()
+        boundary_filter: _BoundaryFilter = _BoundaryFilter(boundaries)
+        duplicates: int = 0
+
+        def locked_consumer(item: C) -> None:
+            nonlocal duplicates
+            with lock:
+                if not boundary_filter.is_new(item):
+                    duplicates += 1
+                    return
+                consumer(item)
+
+        def consume(window: int) -> int:
+            try:
+                if stream:
+                    return self._consume_stream(
+                        class_,
+                        api,
+                        locked_consumer,
+                        params=params[window],
+                        **kwargs,
+                    )
+                return self._consume_linkable(
+                    partial(
+                        self._process,
+                        class_,
+                        api,
+                        params=params[window],
+                        **kwargs,
+                    ),
+                    locked_consumer,
+                    kwargs.get("headers", {}),
+                    prefetch,
+                    api,
+                )
+            finally:
+                with lock:
+                    boundary_filter.done(window)
+
+        with ThreadPoolExecutor(
+            max(1, min(len(params), self._pool_maxsize)), "pytmv1-window"
+        ) as executor:
+            futures: List[Future[int]] = [
+                executor.submit(consume, window)
+                for window in range(len(params))
+            ]
+            return ConsumeLinkableResp(
+                total_consumed=sum(future.result() for future in futures)
+                - duplicates
+            )
+
+    @result
+    def send_batches(
+        self,
+        class_: Type[BaseLinkableResp[C]],
+        api: str,
+        consumer: Callable[[Any], None],
+        arrow: bool = False,
+        **kwargs: Any,
+    ) -> ConsumeLinkableResp:
+        item_type: Type[BaseModel] = _item_type(class_)
+        total_count: int = 0
+        for items in self._iter_raw_pages(api, **kwargs):
+            if not items:
+                continue
+            batch: columnar.ColumnBatch = columnar.to_columns(item_type, items)
+            consumer(
+                columnar.to_record_batch(item_type, batch) if arrow else batch
+            )
+            total_count += len(items)
+        log.debug(
+            "Records consumed: [Total=%s, Type=%s]",
+            total_count,
+            item_type.__name__,
+        )
+        return ConsumeLinkableResp(total_consumed=total_count)
+
     def send_multi(
         self,
         class_: Type[MR],
         api: str,
         **kwargs: Any,
-    ) -> MR:
-        return self._process(
-            class_,
-            api,
-            HttpMethod.POST,
-            **kwargs,
-        )
+    ) -> MultiResult[MR]:
+        chunks: List[List[Any]] = _chunks(api, kwargs.get("json"))
+        if len(chunks) <= 1:
+            return self._send_multi(class_, api, **kwargs)
+        with ThreadPoolExecutor(
+            min(len(chunks), max(1, self._pool_maxsize)), "pytmv1-chunk"
+        ) as executor:
+            return _merge_multi(
+                class_,
+                chunks,
+                list(
+                    executor.map(
+                        lambda chunk: self._send_multi(
+                            class_, api, **{**kwargs, "json": chunk}
+                        ),
+                        chunks,
+                    )
+                ),
+            )
 
     @result
     def send_sandbox_result(
@@ -153,6 +553,7 @@ class Core:
         submit_id: str,
         poll: bool,
         poll_time_sec: float,
+        poll_strategy: Optional[PollStrategy] = None,
     ) -> R:
         if poll:
             _poll_status(
@@ -161,12 +562,19 @@ class Core:
                     Api.GET_SANDBOX_SUBMISSION_STATUS.value.format(submit_id),
                 ),
                 poll_time_sec,
+                poll_strategy or self._poll_strategy,
+                self._instrumentation,
             )
         return self._process(class_, api.value.format(submit_id))
 
     @result
     def send_task_result(
-        self, class_: Type[T], task_id: str, poll: bool, poll_time_sec: float
+        self,
+        class_: Type[T],
+        task_id: str,
+        poll: bool,
+        poll_time_sec: float,
+        poll_strategy: Optional[PollStrategy] = None,
     ) -> T:
         status_call: Callable[[], T] = lambda: self._process(
             class_,
@@ -176,43 +584,223 @@ class Core:
             return _poll_status(
                 status_call,
                 poll_time_sec,
+                poll_strategy or self._poll_strategy,
+                self._instrumentation,
             )
         return status_call()
 
+    def iter_task_results(
+        self,
+        class_: Type[T],
+        task_ids: List[str],
+        poll_time_sec: float,
+        poll_strategy: Optional[PollStrategy] = None,
+    ) -> Iterator[Tuple[str, Result[T]]]:
+        strategy: PollStrategy = poll_strategy or self._poll_strategy
+        deadline: float = time.monotonic() + poll_time_sec
+        pending: List[str] = list(dict.fromkeys(task_ids))
+        delays: Iterator[float] = strategy.delays()
+        delay: float = strategy.first()
+        with ThreadPoolExecutor(
+            max(1, min(len(pending), self._pool_maxsize)), "pytmv1-task"
+        ) as executor:
+            while pending:
+                time.sleep(min(delay, max(deadline - time.monotonic(), 0)))
+                futures: Dict[Future[Result[T]], str] = {
+                    executor.submit(
+                        self.send_task_result, class_, task_id, False, 0
+                    ): task_id
+                    for task_id in pending
+                }
+                running: Dict[str, Result[T]] = {}
+                for future in as_completed(futures):
+                    task_result: Result[T] = future.result()
+                    if _is_running(task_result):
+                        running[futures[future]] = task_result
+                    else:
+                        yield futures[future], task_result
+                if time.monotonic() >= deadline:
+                    yield from running.items()
+                    return
+                pending = [t for t in pending if t in running]
+                delay = next(delays)
+
+    def iter_linkable(
+        self,
+        class_: Type[BaseLinkableResp[C]],
+        api: str,
+        **kwargs: Any,
+    ) -> Iterator[C]:
+        for response in self._iter_pages(
+            lambda: self._process(
+                class_,
+                api,
+                **kwargs,
+            ),
+            kwargs.get("headers", {}),
+        ):
+            yield from response.items
+
     def _consume_linkable(
         self,
         api_call: Callable[[], BaseLinkableResp[C]],
         consumer: Callable[[C], None],
         headers: Dict[str, str],
-        count: int = 0,
+        prefetch: int = 0,
+        api: str = "",
     ) -> int:
-        total_count: int = count
-        response: BaseLinkableResp[C] = api_call()
-        for item in response.items:
-            consumer(item)
-            total_count += 1
-        if response.next_link:
+        total_count: int = 0
+        response: Optional[BaseLinkableResp[C]] = None
+        pages: Iterator[BaseLinkableResp[C]] = self._iter_pages(
+            api_call, headers
+        )
+        if prefetch > 0:
+            pages = _prefetch(pages, prefetch)
+        path: str = api_path(self._url + api)
+        for response in pages:
+            start: float = time.perf_counter()
+            for item in response.items:
+                consumer(item)
+                total_count += 1
+            self._instrumentation.consumed(
+                path, len(response.items), time.perf_counter() - start
+            )
+        log.debug(
+            "Records consumed: [Total=%s, Type=%s]",
+            total_count,
+            type(
+                response.items[0]
+                if response and len(response.items) > 0
+                else response
+            ).__name__,
+        )
+        return total_count
+
+    def _consume_checkpointed(
+        self,
+        class_: Type[BaseLinkableResp[C]],
+        api: str,
+        consumer: Callable[[C], None],
+        store: CheckpointStore,
+        time_range: Tuple[str, str],
+        prefetch: int = 0,
+        **kwargs: Any,
+    ) -> int:
+        # At-least-once: progress is saved once a page is consumed and on
+        # errors, after a crash the records of the page being consumed
+        # are consumed again
+        headers: Dict[str, str] = kwargs.get("headers", {})
+        state: Checkpoint = self._load_checkpoint(
+            store, api, time_range, kwargs.get("params", {})
+        )
+        link: Optional[str] = state.link
+        offset: int = state.offset
+        total_count: int = 0
+        pages: Iterator[BaseLinkableResp[C]] = self._iter_pages(
+            lambda: self._process(
+                class_, _uri(state.link or ""), headers=headers
+            ),
+            headers,
+        )
+        if prefetch > 0:
+            pages = _prefetch(pages, prefetch)
+        try:
+            for response in pages:
+                for item in response.items[offset:]:
+                    consumer(item)
+                    offset += 1
+                    total_count += 1
+                link, offset = response.next_link, 0
+                store.save(Checkpoint(link, 0, state.watermark))
+        finally:
+            if link:
+                store.save(Checkpoint(link, offset, state.watermark))
+        log.debug(
+            "Records consumed: [Total=%s, Type=%s]",
+            total_count,
+            class_.__name__,
+        )
+        return total_count
+
+    def _consume_stream(
+        self,
+        class_: Type[BaseLinkableResp[C]],
+        api: str,
+        consumer: Callable[[C], None],
+        **kwargs: Any,
+    ) -> int:
+        total_count, response = self._stream(class_, api, consumer, **kwargs)
+        while response.next_link:
             sr: SplitResult = urlsplit(response.next_link)
             log.debug("Found nextLink")
-            return self._consume_linkable(
-                lambda: self._process(
-                    type(response),
-                    f"{sr.path[5:]}?{sr.query}",
-                    headers=headers,
-                ),
+            count, response = self._stream(
+                class_,
+                f"{sr.path[5:]}?{sr.query}",
                 consumer,
-                headers,
-                total_count,
+                headers=kwargs.get("headers", {}),
             )
+            total_count += count
         log.debug(
             "Records consumed: [Total=%s, Type=%s]",
             total_count,
-            type(
-                response.items[0] if len(response.items) > 0 else response
-            ).__name__,
+            class_.__name__,
         )
         return total_count
 
+    def _iter_pages(
+        self,
+        api_call: Callable[[], BaseLinkableResp[C]],
+        headers: Dict[str, str],
+    ) -> Iterator[BaseLinkableResp[C]]:
+        response: BaseLinkableResp[C] = api_call()
+        yield response
+        while response.next_link:
+            sr: SplitResult = urlsplit(response.next_link)
+            log.debug("Found nextLink")
+            response = self._process(
+                type(response),
+                f"{sr.path[5:]}?{sr.query}",
+                headers=headers,
+            )
+            yield response
+
+    def _iter_raw_pages(
+        self, api: str, **kwargs: Any
+    ) -> Iterator[List[Dict[str, Any]]]:
+        uri: str = api
+        while True:
+            log.debug(
+                "Processing raw request [URI=%s, Options=%s]",
+                uri,
+                logs.Lazy(logs.redact, kwargs),
+            )
+            raw_response: Response = self._send_internal(
+                self._prepare(uri, HttpMethod.GET, **kwargs)
+            )
+            _validate(raw_response)
+            data: Dict[str, Any] = _json(raw_response)
+            yield data.get("items") or []
+            if not data.get("nextLink"):
+                return
+            sr: SplitResult = urlsplit(data["nextLink"])
+            log.debug("Found nextLink")
+            uri = f"{sr.path[5:]}?{sr.query}"
+            kwargs = {"headers": kwargs.get("headers", {})}
+
+    @multi_result
+    def _send_multi(
+        self,
+        class_: Type[MR],
+        api: str,
+        **kwargs: Any,
+    ) -> MR:
+        return self._process(
+            class_,
+            api,
+            HttpMethod.POST,
+            **kwargs,
+        )
+
     def _process(
         self,
         class_: Type[R],
@@ -225,44 +813,153 @@ class Core:
             method.value,
             class_.__name__,
             uri,
-            kwargs,
-        )
-        raw_response: Response = self._send_internal(
-            self._prepare(uri, method, **kwargs)
+            logs.Lazy(logs.redact, kwargs),
         )
+        request: PreparedRequest = self._prepare(uri, method, **kwargs)
+        cached: Optional[R] = self._conditional(class_, request)
+        raw_response: Response = self._send_internal(request)
+        if cached is not None and raw_response.status_code == NOT_MODIFIED:
+            log.debug("Response not modified [URL=%s]", request.url)
+            return cached
         _validate(raw_response)
-        return _parse_data(raw_response, class_)
-
-    def _prepare(
-        self, uri: str, method: HttpMethod, **kwargs: Any
-    ) -> PreparedRequest:
-        return Request(
-            method.value,
-            self._url + uri,
-            headers={**self._headers, **kwargs.pop("headers", {})},
-            **kwargs,
-        ).prepare()
-
-    def _send_internal(self, request: PreparedRequest) -> Response:
-        log.info(
-            "Sending request [Method=%s, URL=%s, Headers=%s, Body=%s]",
-            request.method,
-            request.url,
-            re.sub("Bearer \\S+", "*****", str(request.headers)),
-            _hide_binary(request),
-        )
-        response: Response = self._adapter.send(
-            request,
-            timeout=(self._c_timeout, self._r_timeout),
-            proxies=self._proxies,
+        start: float = time.perf_counter()
+        response: R = _parse_data(raw_response, class_, self._lazy_validation)
+        self._instrumentation.parsed(
+            api_path(request.url),
+            _records(response),
+            time.perf_counter() - start,
         )
-        log.info(
-            "Received response [Status=%s, Headers=%s, Body=%s]",
-            response.status_code,
-            response.headers,
-            _hide_binary(response),
+        return self._cache(class_, request, response)
+
+    def _stream(
+        self,
+        class_: Type[BaseLinkableResp[C]],
+        uri: str,
+        consumer: Callable[[C], None],
+        **kwargs: Any,
+    ) -> Tuple[int, BaseLinkableResp[C]]:
+        log.debug(
+            "Streaming request [Class=%s, URI=%s, Options=%s]",
+            class_.__name__,
+            uri,
+            logs.Lazy(logs.redact, kwargs),
         )
-        return response
+        consumer = self._caching(class_, consumer)
+        with self._send_internal(
+            self._prepare(uri, HttpMethod.GET, **kwargs), True
+        ) as raw_response:
+            if not _is_streamable(raw_response):
+                _validate(raw_response)
+                response: BaseLinkableResp[C] = _parse_data(
+                    raw_response, class_, self._lazy_validation
+                )
+                for item in response.items:
+                    consumer(item)
+                return len(response.items), response
+            parser: ItemStreamParser = ItemStreamParser()
+            count: int = 0
+            for chunk in raw_response.iter_content(STREAM_CHUNK_SIZE):
+                count += _consume_items(
+                    _item_parser(class_, self._lazy_validation),
+                    parser.feed(chunk),
+                    consumer,
+                )
+            count += _consume_items(
+                _item_parser(class_, self._lazy_validation),
+                parser.close(),
+                consumer,
+            )
+        return count, class_(**{**parser.envelope, "items": []})
+
+    def _send_internal(
+        self, request: PreparedRequest, stream: bool = False
+    ) -> Response:
+        attempt: int = 0
+        retry: int = 0
+        path: str = api_path(request.url)
+        while True:
+            wait: float = self._rate_limiter.reserve(str(request.url))
+            if wait > 0:
+                time.sleep(wait)
+            _log_request(request)
+            self._instrumentation.request(path, str(request.method))
+            start: float = time.perf_counter()
+            try:
+                response: Response = self._adapter.send(
+                    request,
+                    stream=stream,
+                    timeout=(self._c_timeout, self._r_timeout),
+                    proxies=self._proxies,
+                )
+            except (RequestsConnectionError, Timeout) as exc:
+                delay: Optional[float] = self._retry_delay(request, retry, exc)
+                if delay is None:
+                    raise
+                time.sleep(delay)
+                retry += 1
+                continue
+            self._instrumentation.response(
+                path,
+                str(request.method),
+                response.status_code,
+                time.perf_counter() - start,
+                response.elapsed.total_seconds(),
+                _size(response.headers, None if stream else response.content),
+            )
+            _log_response(response, stream)
+            if self._throttled(
+                request, response.status_code, response.headers, attempt
+            ):
+                response.close()
+                attempt += 1
+                continue
+            delay = self._retry_delay(request, retry, response.status_code)
+            if delay is None:
+                return response
+            response.close()
+            time.sleep(delay)
+            retry += 1
+
+
+def _prefetch(
+    pages: Iterator[BaseLinkableResp[C]], size: int
+) -> Iterator[BaseLinkableResp[C]]:
+    buffer: Queue[
+        Tuple[Optional[BaseLinkableResp[C]], Optional[Exception]]
+    ] = Queue(size)
+    stop: Event = Event()
+
+    def put(
+        item: Tuple[Optional[BaseLinkableResp[C]], Optional[Exception]],
+    ) -> bool:
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except Full:
+                continue
+        return False
+
+    def produce() -> None:
+        try:
+            for page in pages:
+                if not put((page, None)):
+                    return
+            put((None, None))
+        except Exception as exc:
+            put((None, exc))
+
+    Thread(target=produce, name="pytmv1-prefetch", daemon=True).start()
+    try:
+        while True:
+            page, error = buffer.get()
+            if error:
+                raise error
+            if page is None:
+                return
+            yield page
+    finally:
+        stop.set()
 
 
 def _proxy(
@@ -277,6 +974,101 @@ def _proxy(
     return proxies if len(proxies.items()) > 0 else None
 
 
+def _log_request(request: PreparedRequest) -> None:
+    if not log.isEnabledFor(logging.INFO):
+        return
+    log.info(
+        "Sending request [Method=%s, URL=%s, Headers=%s, Body=%s]",
+        request.method,
+        request.url,
+        logs.Lazy(logs.redact, request.headers),
+        logs.Lazy(_hide_binary, request),
+    )
+
+
+def _log_response(response: Response, stream: bool = False) -> None:
+    if not log.isEnabledFor(logging.INFO):
+        return
+    log.info(
+        "Received response [Status=%s, Headers=%s, Body=%s]",
+        response.status_code,
+        response.headers,
+        (
+            "***streamed content***"
+            if stream
+            else logs.Lazy(_hide_binary, response)
+        ),
+    )
+
+
+class _BoundaryFilter:
+    # Adjacent windows may both return the records of their boundary second
+    # (epoch milliseconds), these are consumed once. Records without event
+    # time are all consumed, and the records seen at a boundary are
+    # forgotten once both of its windows are consumed
+
+    def __init__(self, boundaries: Sequence[int]):
+        self._boundaries: List[int] = list(boundaries)
+        self._seen: Dict[int, Set[str]] = {
+            boundary: set() for boundary in self._boundaries
+        }
+        self._done: Set[int] = set()
+
+    def is_new(self, item: Any) -> bool:
+        event_time: Optional[int] = getattr(item, "event_time", None)
+        if event_time is None:
+            return True
+        for boundary, seen in self._seen.items():
+            if boundary <= event_time < boundary + 1000:
+                key: str = item.model_dump_json()
+                if key in seen:
+                    return False
+                seen.add(key)
+                return True
+        return True
+
+    def done(self, window: int) -> None:
+        self._done.add(window)
+        for index, boundary in enumerate(self._boundaries):
+            if index in self._done and index + 1 in self._done:
+                self._seen.pop(boundary, None)
+
+
+def _consume_items(
+    parse: Callable[[Any], C],
+    items: List[Any],
+    consumer: Callable[[C], None],
+) -> int:
+    for item in items:
+        consumer(parse(item))
+    return len(items)
+
+
+@lru_cache(maxsize=None)
+def _item_parser(
+    class_: Type[BaseResponse], lazy_validation: bool
+) -> Callable[[Any], Any]:
+    item_type: Any = _item_type(class_)
+    if lazy_validation and isinstance(item_type, type):
+        return partial(lazy.construct, item_type)
+    return TypeAdapter(item_type).validate_python
+
+
+def _item_type(class_: Type[BaseResponse]) -> Any:
+    return get_args(class_.model_fields["items"].annotation)[0]
+
+
+def _is_streamable(raw_response: Response) -> bool:
+    return raw_response.status_code == 200 and "json" in (
+        raw_response.headers.get("Content-Type", "")
+    )
+
+
+def _uri(link: str) -> str:
+    sr: SplitResult = urlsplit(link)
+    return f"{sr.path[5:]}?{sr.query}"
+
+
 def _format(url: str) -> str:
     return (url if url.endswith("/") else url + "/") + API_VERSION
 
@@ -288,7 +1080,15 @@ def _hide_binary(http_object: Union[PreparedRequest, Response]) -> str:
     if "multipart/form-data" in content_type:
         return "***file content***"
     if isinstance(http_object, Response):
-        return http_object.text
+        # Only decodes the logged part of the body, as utf-8 when the
+        # charset is not set instead of detecting it from the whole body
+        content: bytes = http_object.content or b""
+        text: str = content[: logs.BODY_LIMIT].decode(
+            http_object.encoding or "utf-8", "replace"
+        )
+        if len(content) <= logs.BODY_LIMIT:
+            return text
+        return f"{text}...[{len(content) - logs.BODY_LIMIT} more bytes]"
     return str(http_object.body)
 
 
@@ -296,38 +1096,42 @@ def _is_http_success(status_codes: List[int]) -> bool:
     return len(list(filter(lambda s: not 200 <= s < 399, status_codes))) == 0
 
 
-def _parse_data(raw_response: Response, class_: Type[R]) -> R:
+def _parse_data(
+    raw_response: Response, class_: Type[R], lazy_validation: bool = False
+) -> R:
     content_type = raw_response.headers.get("Content-Type", "")
     if raw_response.status_code == 201:
-        return class_(**raw_response.headers)
+        return class_.model_validate(dict(raw_response.headers))
     if raw_response.status_code == 204 and class_ == NoContentResp:
         return class_()
     if "text" in content_type and class_ == TextResp:
         return class_.model_construct(text=raw_response.text)
     if "json" in content_type or "text" in content_type:
         log.debug("Parsing json response [Class=%s]", class_.__name__)
+        data: Any = _json(raw_response)
         if class_ in [MultiResp, MultiUrlResp, MultiApiKeyResp]:
-            return class_(items=raw_response.json())
+            return class_.model_validate({"items": data})
         if class_ == GetEndpointDetailsResp:
-            return class_(data=raw_response.json())
+            return class_.model_validate({"data": data})
         if class_ == GetOatPackageResp:
-            return class_(package=raw_response.json())
+            return class_.model_validate({"package": data})
         if class_ in [
             GetAlertResp,
             GetApiKeyResp,
             GetAlertNoteResp,
             GetPipelineResp,
         ]:
-            return class_(
-                data=raw_response.json(),
-                etag=raw_response.headers.get("ETag", ""),
+            return class_.model_validate(
+                {"data": data, "etag": raw_response.headers.get("ETag", "")}
             )
         if class_ == BaseTaskResp:
             resp_class: Type[BaseTaskResp] = utils.task_action_resp_class(
-                TaskAction(raw_response.json()["action"])
+                TaskAction(data["action"])
             )
             class_ = resp_class if issubclass(resp_class, class_) else class_
-        return class_(**raw_response.json())
+        if lazy_validation and BaseLinkableResp in class_.__mro__:
+            return _parse_lazy_page(class_, data)
+        return class_.model_validate(data)
     if (
         "application" in content_type
         or "gzip" == raw_response.headers.get("Content-Encoding")
@@ -337,28 +1141,130 @@ def _parse_data(raw_response: Response, class_: Type[R]) -> R:
     raise ParseModelError(class_.__name__, raw_response)
 
 
+def _json(raw_response: Response) -> Any:
+    # Decoded once per response, _validate and _parse_data share the body
+    if JSON_BODY not in raw_response.__dict__:
+        raw_response.__dict__[JSON_BODY] = codec.loads(
+            raw_response.content or b""
+        )
+    return raw_response.__dict__[JSON_BODY]
+
+
+def _parse_lazy_page(class_: Type[R], data: Dict[str, Any]) -> R:
+    parse: Callable[[Any], Any] = _item_parser(class_, True)
+    return class_.model_validate({**data, "items": []}).model_copy(
+        update={"items": [parse(item) for item in data["items"] or []]}
+    )
+
+
 def _parse_html(html: str) -> str:
-    log.info("Parsing html response [Html=%s]", html)
+    log.info("Parsing html response [Html=%s]", logs.Lazy(str, html))
     soup = BeautifulSoup(html, "html.parser")
     return "\n".join(
         line.strip() for line in soup.text.split("\n") if line.strip()
     )
 
 
+def _chunks(api: str, items: Any) -> List[List[Any]]:
+    if not isinstance(items, list):
+        return []
+    size: int = MULTI_CHUNK_SIZES.get(api, MULTI_CHUNK_SIZE)
+    chunks: List[List[Any]] = []
+    for start in range(0, len(items), size):
+        end: int = start + size
+        chunks.append(items[start:end])
+    return chunks
+
+
+def _merge_multi(
+    class_: Type[MR],
+    chunks: List[List[Any]],
+    results: List[MultiResult[MR]],
+) -> MultiResult[MR]:
+    # Items stay in the order of the inputs: those of the successful chunks
+    # are kept as returned (ie: created API keys), each input of a failed
+    # chunk gets an item with the status of its error, errors are reported
+    # for the failed chunks only
+    item_type: Any = _item_type(class_)
+    items: List[Any] = []
+    errors: List[MsError] = []
+    for chunk, chunk_result in zip(chunks, results):
+        if chunk_result.response and (
+            chunk_result.result_code == ResultCode.SUCCESS
+        ):
+            items.extend(chunk_result.response.items)
+            continue
+        chunk_errors: List[MsError] = (
+            chunk_result.errors
+            if len(chunk_result.errors) == len(chunk)
+            else chunk_result.errors[:1] * len(chunk)
+        )
+        errors.extend(chunk_errors)
+        items.extend(
+            item_type.model_construct(
+                status=error.status, task_id=error.task_id
+            )
+            for error in chunk_errors
+        )
+    response: MR = class_(items=items)
+    if not errors:
+        return MultiResult.success(response)
+    return MultiResult(ResultCode.ERROR, response, errors)
+
+
+def _is_cacheable(class_: Type[R], request: PreparedRequest) -> bool:
+    return request.method == HttpMethod.GET.value and class_ in ETAG_CLASSES
+
+
+def _cache_endpoints(cache: EndpointCache, response: BaseResponse) -> None:
+    # Streamed inventory records are stored by the consumer (_caching)
+    if isinstance(response, GetEndpointDetailsResp):
+        cache.put(response.data)
+    elif isinstance(response, ListEndpointSecurityResp):
+        for endpoint in response.items:
+            cache.put(endpoint)
+
+
+def _records(response: BaseResponse) -> int:
+    items: Any = getattr(response, "items", None)
+    return len(items) if isinstance(items, list) else 1
+
+
+def _size(headers: Mapping[str, str], content: Optional[bytes]) -> int:
+    if content is not None:
+        return len(content)
+    length: str = headers.get("Content-Length", "")
+    return int(length) if length.isdigit() else 0
+
+
+def _is_running(task_result: Result[T]) -> bool:
+    return (
+        task_result.response is not None
+        and task_result.response.status in POLLED_STATUSES
+    )
+
+
 def _poll_status(
     status_call: Callable[[], S],
     poll_time_sec: float,
+    strategy: PollStrategy = PollStrategy(),
+    instrumentation: Instrumentation = Instrumentation(),
 ) -> S:
-    start_time: float = time.time()
-    elapsed_time: float = 0
+    start: float = time.monotonic()
+    deadline: float = start + poll_time_sec
+    time.sleep(min(strategy.first(), max(poll_time_sec, 0)))
     response: S = status_call()
-    while elapsed_time < poll_time_sec:
-        if response.status in [Status.QUEUED, Status.RUNNING]:
-            time.sleep(2)
-            response = status_call()
-            elapsed_time = time.time() - start_time
-        else:
+    polls: int = 1
+    for delay in strategy.delays():
+        remaining: float = deadline - time.monotonic()
+        if remaining <= 0 or response.status not in POLLED_STATUSES:
             break
+        time.sleep(min(delay, remaining))
+        response = status_call()
+        polls += 1
+    instrumentation.polled(
+        response.status.value, polls, time.monotonic() - start
+    )
     return response
 
 
@@ -367,7 +1273,7 @@ def _validate(raw_response: Response) -> None:
     content_type: str = raw_response.headers.get("Content-Type", "")
     if not _is_http_success([raw_response.status_code]):
         if "application/json" in content_type:
-            error: Dict[str, Any] = raw_response.json().get("error")
+            error: Dict[str, Any] = _json(raw_response).get("error")
             error["status"] = raw_response.status_code
             raise ServerJsonError(
                 Error(**error),
@@ -378,14 +1284,12 @@ def _validate(raw_response: Response) -> None:
             )
         raise ServerTextError(raw_response.status_code, raw_response.text)
     if raw_response.status_code == 207:
+        statuses: List[Dict[str, Any]] = _json(raw_response)
         if not _is_http_success(
             MsStatus(
-                root=[int(d.get("status", 500)) for d in raw_response.json()]
+                root=[int(d.get("status", 500)) for d in statuses]
             ).values()
         ):
             raise ServerMultiJsonError(
-                [
-                    MsError.model_validate(error)
-                    for error in raw_response.json()
-                ]
+                [MsError.model_validate(error) for error in statuses]
             )
@@ -0,0 +1,352 @@
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Pattern
+from urllib.parse import urlsplit
+
+from .model.enum import Api
+
+try:
+    import prometheus_client
+except ImportError:  # pragma: no cover
+    prometheus_client = None  # type: ignore[assignment, unused-ignore]
+
+try:
+    from opentelemetry import metrics
+except ImportError:  # pragma: no cover
+    metrics = None  # type: ignore[assignment, unused-ignore]
+
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+RECORDS_BUCKETS = (0, 1, 10, 50, 100, 200, 500, 1000, 5000)
+
+
+class Instrumentation:
+    """Callbacks around the requests, pages and polls of a client, to
+    report metrics or traces.
+
+    Every callback does nothing by default, subclasses override the ones
+    they need. Callbacks are called on the request path, from the threads
+    of the client (or its event loop): they must be cheap, thread safe and
+    not raise. Requests are identified by their API path template (ie:
+    /workbench/alerts/{0}), see :func:`api_path`.
+    """
+
+    def request(self, api: str, method: str) -> None:
+        """Called before every attempt of a request.
+
+        :param api: API path template.
+        :type api: str
+        :param method: HTTP method.
+        :type method: str
+        """
+
+    def response(
+        self,
+        api: str,
+        method: str,
+        status: int,
+        elapsed: float,
+        server_time: float,
+        size: int,
+    ) -> None:
+        """Called when a response is received, before it is parsed.
+
+        :param api: API path template.
+        :type api: str
+        :param method: HTTP method.
+        :type method: str
+        :param status: HTTP status code.
+        :type status: int
+        :param elapsed: Seconds from sending the request to receiving the
+         response (connection, server time and download, but not the
+         download of streamed responses).
+        :type elapsed: float
+        :param server_time: Seconds until the response headers were
+         received, 0 when unknown.
+        :type server_time: float
+        :param size: Size of the response body in bytes, 0 when unknown
+         (ie: streamed response without Content-Length).
+        :type size: int
+        """
+
+    def retried(self, api: str, reason: str) -> None:
+        """Called when a request is retried.
+
+        :param api: API path template.
+        :type api: str
+        :param reason: Status code, exception name or "throttled".
+        :type reason: str
+        """
+
+    def parsed(self, api: str, records: int, elapsed: float) -> None:
+        """Called when a response is decoded and validated.
+
+        :param api: API path template.
+        :type api: str
+        :param records: Number of records of the response (1 for a response
+         which is not paginated).
+        :type records: int
+        :param elapsed: Seconds spent decoding and validating.
+        :type elapsed: float
+        """
+
+    def consumed(self, api: str, records: int, elapsed: float) -> None:
+        """Called when the records of a page are consumed.
+
+        :param api: API path template.
+        :type api: str
+        :param records: Number of records of the page.
+        :type records: int
+        :param elapsed: Seconds spent in the consumer.
+        :type elapsed: float
+        """
+
+    def polled(self, status: str, polls: int, elapsed: float) -> None:
+        """Called when the polling of a task or submission ends.
+
+        :param status: Last status polled.
+        :type status: str
+        :param polls: Number of status checks.
+        :type polls: int
+        :param elapsed: Seconds spent polling.
+        :type elapsed: float
+        """
+
+    def failed(self, operation: str, status: int, code: str) -> None:
+        """Called when an operation returns a failed result.
+
+        :param operation: Name of the operation (ie: send_linkable).
+        :type operation: str
+        :param status: Status of the error.
+        :type status: int
+        :param code: Code of the error.
+        :type code: str
+        """
+
+
+class PrometheusInstrumentation(Instrumentation):
+    """Reports the client metrics to Prometheus (requires
+    pip install pytmv1[prometheus]).
+
+    :param registry: (optional) Registry of the metrics, defaults to the
+     global registry.
+    :type registry: prometheus_client.CollectorRegistry
+    :param prefix: (optional) Prefix of the metric names.
+    :type prefix: str
+    """
+
+    def __init__(self, registry: Any = None, prefix: str = "pytmv1"):
+        if prometheus_client is None:
+            raise ImportError(
+                "prometheus_client is required to report metrics,"
+                " install it with: pip install pytmv1[prometheus]"
+            )
+        options: Dict[str, Any] = (
+            {"registry": registry} if registry is not None else {}
+        )
+        self._latency = prometheus_client.Histogram(
+            f"{prefix}_request_duration_seconds",
+            "Duration of the requests",
+            ["api", "method", "status"],
+            buckets=LATENCY_BUCKETS,
+            **options,
+        )
+        self._bytes = prometheus_client.Counter(
+            f"{prefix}_response_bytes",
+            "Size of the response bodies",
+            ["api"],
+            **options,
+        )
+        self._retries = prometheus_client.Counter(
+            f"{prefix}_retries",
+            "Retried requests",
+            ["api", "reason"],
+            **options,
+        )
+        self._parse = prometheus_client.Histogram(
+            f"{prefix}_parse_duration_seconds",
+            "Duration of the decoding and validation of the responses",
+            ["api"],
+            buckets=LATENCY_BUCKETS,
+            **options,
+        )
+        self._records = prometheus_client.Histogram(
+            f"{prefix}_page_records",
+            "Records per response",
+            ["api"],
+            buckets=RECORDS_BUCKETS,
+            **options,
+        )
+        self._consume = prometheus_client.Histogram(
+            f"{prefix}_consume_duration_seconds",
+            "Duration of the consumption of a page",
+            ["api"],
+            buckets=LATENCY_BUCKETS,
+            **options,
+        )
+        self._polls = prometheus_client.Histogram(
+            f"{prefix}_poll_duration_seconds",
+            "Duration of the polling of tasks and submissions",
+            ["status"],
+            buckets=LATENCY_BUCKETS,
+            **options,
+        )
+        self._errors = prometheus_client.Counter(
+            f"{prefix}_errors",
+            "Failed operations",
+            ["operation", "status", "code"],
+            **options,
+        )
+
+    def response(
+        self,
+        api: str,
+        method: str,
+        status: int,
+        elapsed: float,
+        server_time: float,
+        size: int,
+    ) -> None:
+        self._latency.labels(api, method, str(status)).observe(elapsed)
+        self._bytes.labels(api).inc(size)
+
+    def retried(self, api: str, reason: str) -> None:
+        self._retries.labels(api, reason).inc()
+
+    def parsed(self, api: str, records: int, elapsed: float) -> None:
+        self._parse.labels(api).observe(elapsed)
+        self._records.labels(api).observe(records)
+
+    def consumed(self, api: str, records: int, elapsed: float) -> None:
+        self._consume.labels(api).observe(elapsed)
+
+    def polled(self, status: str, polls: int, elapsed: float) -> None:
+        self._polls.labels(status).observe(elapsed)
+
+    def failed(self, operation: str, status: int, code: str) -> None:
+        self._errors.labels(operation, str(status), code).inc()
+
+
+class OpenTelemetryInstrumentation(Instrumentation):
+    """Reports the client metrics to OpenTelemetry (requires
+    pip install pytmv1[otel]).
+
+    :param meter_provider: (optional) Provider of the meter, defaults to
+     the global provider.
+    :type meter_provider: opentelemetry.metrics.MeterProvider
+    """
+
+    def __init__(self, meter_provider: Any = None):
+        if metrics is None:
+            raise ImportError(
+                "opentelemetry-api is required to report metrics,"
+                " install it with: pip install pytmv1[otel]"
+            )
+        meter: Any = metrics.get_meter("pytmv1", meter_provider=meter_provider)
+        self._latency = meter.create_histogram(
+            "pytmv1.request.duration", "s", "Duration of the requests"
+        )
+        self._bytes = meter.create_counter(
+            "pytmv1.response.size", "By", "Size of the response bodies"
+        )
+        self._retries = meter.create_counter(
+            "pytmv1.retries", "{retry}", "Retried requests"
+        )
+        self._parse = meter.create_histogram(
+            "pytmv1.parse.duration",
+            "s",
+            "Duration of the decoding and validation of the responses",
+        )
+        self._records = meter.create_histogram(
+            "pytmv1.page.records", "{record}", "Records per response"
+        )
+        self._consume = meter.create_histogram(
+            "pytmv1.consume.duration",
+            "s",
+            "Duration of the consumption of a page",
+        )
+        self._polls = meter.create_histogram(
+            "pytmv1.poll.duration",
+            "s",
+            "Duration of the polling of tasks and submissions",
+        )
+        self._errors = meter.create_counter(
+            "pytmv1.errors", "{error}", "Failed operations"
+        )
+
+    def response(
+        self,
+        api: str,
+        method: str,
+        status: int,
+        elapsed: float,
+        server_time: float,
+        size: int,
+    ) -> None:
+        self._latency.record(
+            elapsed, {"api": api, "method": method, "status": status}
+        )
+        self._bytes.add(size, {"api": api})
+
+    def retried(self, api: str, reason: str) -> None:
+        self._retries.add(1, {"api": api, "reason": reason})
+
+    def parsed(self, api: str, records: int, elapsed: float) -> None:
+        self._parse.record(elapsed, {"api": api})
+        self._records.record(records, {"api": api})
+
+    def consumed(self, api: str, records: int, elapsed: float) -> None:
+        self._consume.record(elapsed, {"api": api})
+
+    def polled(self, status: str, polls: int, elapsed: float) -> None:
+        self._polls.record(elapsed, {"status": status})
+
+    def failed(self, operation: str, status: int, code: str) -> None:
+        self._errors.add(
+            1, {"operation": operation, "status": status, "code": code}
+        )
+
+
+def api_path(url: Optional[str]) -> str:
+    """API path template of a request url (ie: /workbench/alerts/{0} for
+    https://api.xdr.trendmicro.com/v3.0/workbench/alerts/WB-1?top=10), the
+    path of the url when it matches no API.
+
+    :param url: Url of the request.
+    :type url: Optional[str]
+    :rtype: str
+    """
+    path: str = urlsplit(url or "").path
+    match: Optional[re.Match[str]] = _api_pattern().search(path)
+    if match is None or match.lastgroup is None:
+        return path
+    return _api_templates()[int(match.lastgroup[1:])]
+
+
+@lru_cache(maxsize=None)
+def _api_templates() -> List[str]:
+    # Templates with less parameters first, so "/notes/delete" is matched
+    # before "/notes/{1}"
+    return sorted(
+        {api.value for api in Api},
+        key=lambda value: (value.count("{"), value),
+    )
+
+
+@lru_cache(maxsize=None)
+def _api_pattern() -> Pattern[str]:
+    return re.compile(
+        "/v\\d+\\.\\d+(?:{})$".format(
+            "|".join(
+                "(?P<t{}>{})".format(
+                    index,
+                    "[^/]+".join(
+                        re.escape(part)
+                        for part in re.split("\\{\\d+\\}", template)
+                    ),
+                )
+                for index, template in enumerate(_api_templates())
+            )
+        )
+    )
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import re
+from typing import Any, Callable, Pattern
+
+BODY_LIMIT: int = 2048
+BEARER_PATTERN: Pattern[str] = re.compile("Bearer \\S+")
+
+
+class Lazy:
+    """Log argument rendered only when the record is emitted, capped to
+    limit characters so large bodies and models are never fully rendered
+    nor logged.
+
+    :param render: Function rendering the argument.
+    :type render: Callable[..., Any]
+    :param args: Arguments of the function.
+    :type args: Any
+    """
+
+    __slots__ = ("_render", "_args")
+
+    def __init__(self, render: Callable[..., Any], *args: Any):
+        self._render = render
+        self._args = args
+
+    def __str__(self) -> str:
+        return cap(str(self._render(*self._args)))
+
+    __repr__ = __str__
+
+
+def cap(text: str, limit: int = BODY_LIMIT) -> str:
+    """Text truncated to limit characters.
+
+    :param text: Text to truncate.
+    :type text: str
+    :param limit: Maximum number of characters kept.
+    :type limit: int
+    :rtype: str
+    """
+    if len(text) <= limit:
+        return text
+    return f"{text[:limit]}...[{len(text) - limit} more characters]"
+
+
+def redact(value: Any) -> str:
+    """Rendered value with bearer tokens hidden.
+
+    :param value: Value to render (ie: request headers).
+    :type value: Any
+    :rtype: str
+    """
+    return BEARER_PATTERN.sub("*****", str(value))
+
+
+def summary(value: Any) -> str:
+    """Count of the items of a paginated response instead of the items.
+
+    :param value: Value to render.
+    :type value: Any
+    :rtype: str
+    """
+    items: Any = getattr(value, "items", None)
+    if isinstance(items, list):
+        return f"{type(value).__name__}(items=[{len(items)} items])"
+    return str(value)
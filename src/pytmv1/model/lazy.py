@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+from copy import deepcopy
+from functools import lru_cache, wraps
+from typing import Any, Dict, Optional, Tuple, Type, TypeVar
+
+from pydantic import BaseModel, TypeAdapter
+from typing_extensions import Annotated
+
+M = TypeVar("M", bound=BaseModel)
+
+
+def construct(class_: Type[M], data: Dict[str, Any]) -> M:
+    """Builds an instance of class_ without validating data upfront.
+
+    Fields are validated the first time they are accessed, one at a time
+    unless a model validator or one of the field validators applies, in
+    which case the whole record is validated. Dumping or comparing the
+    record validates every remaining field.
+    """
+    lazy_class: Type[M] = _lazy_class(class_)
+    record: M = lazy_class.__new__(lazy_class)
+    object.__setattr__(record, "__dict__", {})
+    object.__setattr__(record, "__pydantic_fields_set__", set())
+    object.__setattr__(record, "__pydantic_extra__", None)
+    object.__setattr__(record, "__pydantic_private__", None)
+    object.__setattr__(record, "__lazy_data__", data)
+    return record
+
+
+@lru_cache(maxsize=None)
+def _lazy_class(class_: Type[M]) -> Type[M]:
+    return type(
+        class_.__name__,
+        (class_,),
+        {
+            "__module__": class_.__module__,
+            "__qualname__": class_.__qualname__,
+            "__slots__": ("__lazy_data__",),
+            "__getattr__": _getattr,
+            "__eq__": _eq,
+            "__reduce__": _reduce,
+            "__copy__": _copy,
+            "__deepcopy__": _deepcopy,
+            "__iter__": _validated(class_.__iter__),
+            "__repr_args__": _validated(class_.__repr_args__),
+            "model_dump": _validated(class_.model_dump),
+            "model_dump_json": _validated(class_.model_dump_json),
+        },
+    )
+
+
+@lru_cache(maxsize=None)
+def _field_adapter(class_: Type[BaseModel], name: str) -> TypeAdapter[Any]:
+    field = class_.model_fields[name]
+    return TypeAdapter(Annotated[field.annotation, field])
+
+
+def _model(self: BaseModel) -> Type[BaseModel]:
+    model: Type[BaseModel] = type(self).__mro__[1]
+    return model
+
+
+def _eq(self: BaseModel, other: Any) -> Any:
+    if not isinstance(other, _model(self)):
+        return NotImplemented
+    _validate_all(self)
+    if hasattr(other, "__lazy_data__"):
+        _validate_all(other)
+    return self.__dict__ == other.__dict__
+
+
+def _reduce(self: BaseModel) -> Tuple[Any, ...]:
+    return construct, (
+        _model(self),
+        object.__getattribute__(self, "__lazy_data__"),
+    )
+
+
+def _copy(self: BaseModel) -> BaseModel:
+    copied: BaseModel = construct(
+        _model(self), dict(object.__getattribute__(self, "__lazy_data__"))
+    )
+    copied.__dict__.update(self.__dict__)
+    copied.__pydantic_fields_set__.update(self.__pydantic_fields_set__)
+    return copied
+
+
+def _deepcopy(
+    self: BaseModel, memo: Optional[Dict[int, Any]] = None
+) -> BaseModel:
+    copied: BaseModel = construct(
+        _model(self),
+        deepcopy(object.__getattribute__(self, "__lazy_data__"), memo),
+    )
+    copied.__dict__.update(deepcopy(self.__dict__, memo))
+    copied.__pydantic_fields_set__.update(self.__pydantic_fields_set__)
+    return copied
+
+
+def _getattr(self: BaseModel, name: str) -> Any:
+    model: Type[BaseModel] = _model(self)
+    field = model.model_fields.get(name)
+    if field is None:
+        return getattr(BaseModel, "__getattr__")(self, name)
+    data: Dict[str, Any] = object.__getattribute__(self, "__lazy_data__")
+    key: str = field.alias if field.alias and field.alias in data else name
+    if _has_validators(model, name) or (
+        key not in data and field.is_required()
+    ):
+        _validate_all(self)
+        return self.__dict__[name]
+    value: Any = (
+        _field_adapter(model, name).validate_python(data[key])
+        if key in data
+        else field.get_default(call_default_factory=True)
+    )
+    self.__dict__[name] = value
+    if key in data:
+        self.__pydantic_fields_set__.add(name)
+    return value
+
+
+@lru_cache(maxsize=None)
+def _has_validators(model: Type[BaseModel], name: str) -> bool:
+    decorators = model.__pydantic_decorators__
+    fields = [
+        validator.info.fields
+        for validator in decorators.field_validators.values()
+    ] + [validator.info.fields for validator in decorators.validators.values()]
+    return bool(
+        decorators.root_validators
+        or decorators.model_validators
+        or any(name in names or "*" in names for names in fields)
+    )
+
+
+def _validate_all(self: BaseModel) -> None:
+    if len(self.__dict__) == len(type(self).model_fields):
+        return
+    validated: BaseModel = _model(self).model_validate(
+        object.__getattribute__(self, "__lazy_data__")
+    )
+    for name, value in validated.__dict__.items():
+        self.__dict__.setdefault(name, value)
+    self.__pydantic_fields_set__.update(validated.model_fields_set)
+
+
+def _validated(method: Any) -> Any:
+    @wraps(method)
+    def _wrapper(self: BaseModel, *args: Any, **kwargs: Any) -> Any:
+        _validate_all(self)
+        return method(self, *args, **kwargs)
+
+    return _wrapper
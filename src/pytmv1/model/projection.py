@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Set, Tuple, Type, get_args
+
+from pydantic import create_model, field_validator, model_validator
+
+from .common import BaseConsumable
+from .response import R
+
+
+def project(class_: Type[R], select: Optional[List[str]]) -> Type[R]:
+    """Narrows a list response to the fields requested with select.
+
+    Returns a subclass of class_ whose items are a record model named after
+    the original one (ie: EndpointActivityProjection) declaring only the
+    selected fields (matched on API name or attribute name), with their
+    validators. Projected records are BaseConsumable but not instances of
+    the original record model. Returns class_ when nothing is selected.
+    """
+    return _project(class_, tuple(sorted(select))) if select else class_
+
+
+@lru_cache(maxsize=None)
+def _project(class_: Type[R], select: Tuple[str, ...]) -> Type[R]:
+    item_type: Type[BaseConsumable] = get_args(
+        class_.model_fields["items"].annotation
+    )[0]
+    fields: Dict[str, Any] = {
+        name: (field.annotation, field)
+        for name, field in item_type.model_fields.items()
+        if name in select or field.alias in select
+    }
+    projected: Type[BaseConsumable] = create_model(
+        f"{item_type.__name__}Projection",
+        __base__=BaseConsumable,
+        __module__=item_type.__module__,
+        __validators__=_validators(item_type, set(fields)),
+        **fields,
+    )
+    return create_model(
+        class_.__name__,
+        __base__=class_,
+        __module__=class_.__module__,
+        items=(List[projected], ...),  # type: ignore[valid-type]
+    )
+
+
+def _validators(
+    item_type: Type[BaseConsumable], names: Set[str]
+) -> Dict[str, Any]:
+    # Validators of the record model, restricted to the projected fields
+    validators: Dict[str, Any] = {}
+    decorators: Any = item_type.__pydantic_decorators__
+    for name, decorator in decorators.field_validators.items():
+        selected: List[str] = [
+            field for field in decorator.info.fields if field in names
+        ]
+        if selected:
+            validate: Any = field_validator(
+                *selected, mode=decorator.info.mode
+            )
+            validators[name] = validate(decorator.func.__func__)
+    for name, decorator in decorators.model_validators.items():
+        validate = model_validator(mode=decorator.info.mode)
+        validators[name] = validate(decorator.func.__func__)
+    return validators
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass
+from typing import Iterator
+
+
+@dataclass(frozen=True)
+class PollStrategy:
+    """Delays between the status checks of a running task or submission.
+
+    The first check happens after first_delay seconds, the following ones
+    after interval seconds multiplied by multiplier after every check and
+    capped to max_interval. Every delay is randomly shifted by up to
+    jitter (ratio of the delay) so concurrent pollers do not synchronize.
+    The default strategy checks every 2 seconds.
+
+    :param first_delay: Seconds to wait before the first status check.
+    :type first_delay: float
+    :param interval: Seconds to wait between the first and second checks.
+    :type interval: float
+    :param multiplier: Factor applied to the interval after every check.
+    :type multiplier: float
+    :param max_interval: Maximum seconds to wait between two checks.
+    :type max_interval: float
+    :param jitter: Ratio (0 to 1) of every delay randomly added or removed.
+    :type jitter: float
+    """
+
+    first_delay: float = 0
+    interval: float = 2
+    multiplier: float = 1
+    max_interval: float = 60
+    jitter: float = 0
+
+    @classmethod
+    def exponential(
+        cls,
+        first_delay: float = 1,
+        interval: float = 1,
+        multiplier: float = 2,
+        max_interval: float = 30,
+        jitter: float = 0.1,
+    ) -> PollStrategy:
+        """Builds a strategy checking quickly first then backing off.
+
+        :rtype: PollStrategy
+        """
+        return cls(first_delay, interval, multiplier, max_interval, jitter)
+
+    def delays(self) -> Iterator[float]:
+        """Infinite sequence of delays to apply between status checks.
+
+        :rtype: Iterator[float]
+        """
+        interval: float = min(self.interval, self.max_interval)
+        while True:
+            yield self._jittered(interval)
+            interval = min(interval * self.multiplier, self.max_interval)
+
+    def first(self) -> float:
+        """Delay to apply before the first status check.
+
+        :rtype: float
+        """
+        return self._jittered(self.first_delay)
+
+    def _jittered(self, delay: float) -> float:
+        if not self.jitter:
+            return delay
+        return max(
+            0.0, delay * (1 + random.uniform(-self.jitter, self.jitter))
+        )
@@ -6,20 +6,41 @@ from dataclasses import dataclass, field
 from enum import Enum
 from functools import wraps
 from logging import Logger
-from typing import Any, Callable, Generic, List, Optional, TypeVar
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Generic,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+)
 
 from pydantic import ValidationError
 from requests import RequestException
 
+from . import logs
 from .exception import ServerCustError, ServerJsonError, ServerMultiJsonError
 from .model.common import Error, MsError
 from .model.response import MR, R
 
 E = TypeVar("E", bound=Error)
 F = TypeVar("F", bound=Callable[..., Any])
+AF = TypeVar("AF", bound=Callable[..., Awaitable[Any]])
 
 log: Logger = logging.getLogger(__name__)
 
+HANDLED_ERRORS: Tuple[Type[Exception], ...] = (
+    ServerCustError,
+    ServerJsonError,
+    ServerMultiJsonError,
+    ValidationError,
+    RequestException,
+    RuntimeError,
+)
+
 
 def multi_result(func: F) -> Callable[..., MultiResult[MR]]:
     @wraps(func)
@@ -47,33 +68,84 @@ def result(func: F) -> Callable[..., Result[R]]:
     return _result
 
 
+def async_multi_result(func: AF) -> Callable[..., Awaitable[MultiResult[MR]]]:
+    @wraps(func)
+    async def _multi_result(*args: Any, **kwargs: Any) -> MultiResult[MR]:
+        obj: MR | Exception = await _async_wrapper(func, *args, **kwargs)
+        return (
+            MultiResult.success(obj)
+            if not isinstance(obj, Exception)
+            else MultiResult.failed(obj)
+        )
+
+    return _multi_result
+
+
+def async_result(func: AF) -> Callable[..., Awaitable[Result[R]]]:
+    @wraps(func)
+    async def _result(*args: Any, **kwargs: Any) -> Result[R]:
+        obj: R | Exception = await _async_wrapper(func, *args, **kwargs)
+        return (
+            Result.success(obj)
+            if not isinstance(obj, Exception)
+            else Result.failed(obj)
+        )
+
+    return _result
+
+
+async def _async_wrapper(func: AF, *args: Any, **kwargs: Any) -> R | Exception:
+    try:
+        start_time: float = time.time()
+        log.debug(
+            "Execution started [%s, %s]",
+            logs.Lazy(logs.redact, args),
+            logs.Lazy(logs.redact, kwargs),
+        )
+        response: R = await func(*args, **kwargs)
+        log.debug(
+            "Execution finished [Elapsed=%s, %s]",
+            time.time() - start_time,
+            logs.Lazy(logs.summary, response),
+        )
+        return response
+    except HANDLED_ERRORS as exc:
+        log.exception("Unexpected issue occurred [%s]", exc)
+        _failed(func, args, exc)
+        return exc
+
+
 def _wrapper(func: F, *args: Any, **kwargs: Any) -> R | Exception:
     try:
         start_time: float = time.time()
         log.debug(
             "Execution started [%s, %s]",
-            args,
-            kwargs,
+            logs.Lazy(logs.redact, args),
+            logs.Lazy(logs.redact, kwargs),
         )
         response: R = func(*args, **kwargs)
         log.debug(
             "Execution finished [Elapsed=%s, %s]",
             time.time() - start_time,
-            response,
+            logs.Lazy(logs.summary, response),
         )
         return response
-    except (
-        ServerCustError,
-        ServerJsonError,
-        ServerMultiJsonError,
-        ValidationError,
-        RequestException,
-        RuntimeError,
-    ) as exc:
+    except HANDLED_ERRORS as exc:
         log.exception("Unexpected issue occurred [%s]", exc)
+        _failed(func, args, exc)
         return exc
 
 
+def _failed(func: Callable[..., Any], args: Any, exc: Exception) -> None:
+    # Operations are methods of a core, reported to its instrumentation
+    instrumentation: Any = (
+        getattr(args[0], "_instrumentation", None) if args else None
+    )
+    if instrumentation is not None:
+        error: Error = _error(exc)
+        instrumentation.failed(func.__name__, error.status, error.code)
+
+
 def _error(exc: Exception) -> Error:
     if isinstance(exc, ServerJsonError):
         return exc.error
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import FrozenSet, Tuple
+
+IDEMPOTENT_METHODS: FrozenSet[str] = frozenset(
+    ("GET", "HEAD", "OPTIONS", "PUT", "DELETE")
+)
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Retries of requests failing on connection errors, timeouts or
+    transient server errors.
+
+    Idempotent requests (ie: GET, including nextLink continuations) are
+    retried, POST and PATCH requests (ie: isolate, block) only when
+    retry_post is set as the action may have been applied already.
+
+    :param retries: Maximum number of retries of a request.
+    :type retries: int
+    :param backoff_factor: Seconds to wait before the first retry, doubled
+     at every retry.
+    :type backoff_factor: float
+    :param backoff_max: Maximum seconds to wait before a retry.
+    :type backoff_max: float
+    :param statuses: Response status codes to retry.
+    :type statuses: Tuple[int, ...]
+    :param retry_post: Also retry non idempotent requests.
+    :type retry_post: bool
+    """
+
+    retries: int = 3
+    backoff_factor: float = 0.5
+    backoff_max: float = 30
+    statuses: Tuple[int, ...] = (502, 503, 504)
+    retry_post: bool = False
+
+    def allows(self, method: str) -> bool:
+        """Whether requests with the given method can be retried.
+
+        :param method: HTTP method of the request.
+        :type method: str
+        :rtype: bool
+        """
+        return self.retry_post or method.upper() in IDEMPOTENT_METHODS
+
+    def backoff(self, retry: int) -> float:
+        """Seconds to wait before the given retry (starting at 0).
+
+        :param retry: Number of retries already done.
+        :type retry: int
+        :rtype: float
+        """
+        return float(min(self.backoff_factor * 2**retry, self.backoff_max))
@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+import codecs
+import json
+import re
+from typing import Any, Dict, List, Pattern
+
+from requests.exceptions import JSONDecodeError
+
+WHITESPACE: str = " \t\n\r"
+
+_STRING_SPECIAL: Pattern[str] = re.compile('["\\\\]')
+_STRUCTURAL: Pattern[str] = re.compile('["\\[\\]{}]')
+_SCALAR_END: Pattern[str] = re.compile("[,\\]}\\s]")
+
+_INCOMPLETE: Any = object()
+
+_OBJECT_START = 0
+_KEY = 1
+_COLON = 2
+_VALUE = 3
+_AFTER_VALUE = 4
+_ITEM = 5
+_AFTER_ITEM = 6
+_END = 7
+
+
+class ItemStreamParser:
+    """Incremental parser for list responses (ie: {"items": [...], ...}).
+
+    Chunks of the body are fed as they are received, every element of the
+    items array is returned as soon as it is complete so only one record is
+    held in memory at a time. Remaining top level fields (ie: nextLink) are
+    available in :attr:`envelope` once the parser is closed.
+    """
+
+    def __init__(self, key: str = "items"):
+        self.envelope: Dict[str, Any] = {}
+        self._key = key
+        self._buffer: str = ""
+        self._pos: int = 0
+        self._state: int = _OBJECT_START
+        self._current_key: str = ""
+        self._scanning: bool = False
+        self._scanned: int = 0
+        self._depth: int = 0
+        self._in_string: bool = False
+        self._decoder = json.JSONDecoder()
+        self._text_decoder = codecs.getincrementaldecoder("utf-8")()
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        self._append(self._text_decoder.decode(chunk))
+        return self._parse(False)
+
+    def close(self) -> List[Any]:
+        self._append(self._text_decoder.decode(b"", True))
+        items: List[Any] = self._parse(True)
+        if self._state != _END or self._skip():
+            raise JSONDecodeError(
+                "Incomplete or invalid list response",
+                self._buffer,
+                self._pos,
+            )
+        return items
+
+    def _parse(self, final: bool) -> List[Any]:
+        items: List[Any] = []
+        while self._state != _END and self._skip():
+            char: str = self._buffer[self._pos]
+            if self._state == _OBJECT_START:
+                self._expect(char, "{")
+                self._state = _KEY
+            elif self._state == _KEY:
+                if char == "}":
+                    self._pos += 1
+                    self._state = _END
+                    continue
+                key = self._decode(final)
+                if key is _INCOMPLETE:
+                    break
+                self._current_key = key
+                self._state = _COLON
+            elif self._state == _COLON:
+                self._expect(char, ":")
+                self._state = _VALUE
+            elif self._state == _VALUE:
+                if self._current_key == self._key and char == "[":
+                    self._pos += 1
+                    self._state = _ITEM
+                    continue
+                value = self._decode(final)
+                if value is _INCOMPLETE:
+                    break
+                self.envelope[self._current_key] = value
+                self._state = _AFTER_VALUE
+            elif self._state == _AFTER_VALUE:
+                self._expect(char, ",}")
+                self._state = _KEY if char == "," else _END
+            elif self._state == _ITEM:
+                if char == "]":
+                    self._pos += 1
+                    self._state = _AFTER_VALUE
+                    continue
+                item = self._decode(final)
+                if item is _INCOMPLETE:
+                    break
+                items.append(item)
+                self._state = _AFTER_ITEM
+            elif self._state == _AFTER_ITEM:
+                self._expect(char, ",]")
+                self._state = _ITEM if char == "," else _AFTER_VALUE
+        return items
+
+    def _append(self, text: str) -> None:
+        pos: int = self._pos
+        self._buffer = self._buffer[pos:] + text
+        self._pos = 0
+
+    def _decode(self, final: bool) -> Any:
+        if self._scanning and not final and not self._scan():
+            return _INCOMPLETE
+        try:
+            value, end = self._decoder.raw_decode(self._buffer, self._pos)
+        except json.JSONDecodeError as exc:
+            if final or self._scanning or self._start_scan():
+                raise JSONDecodeError(exc.msg, exc.doc, exc.pos) from exc
+            return _INCOMPLETE
+        # A number at the end of the buffer may continue in the next chunk
+        if (
+            end == len(self._buffer)
+            and not final
+            and not self._scanning
+            and not self._start_scan()
+        ):
+            return _INCOMPLETE
+        self._pos = end
+        self._scanning = False
+        return value
+
+    def _start_scan(self) -> bool:
+        first: str = self._buffer[self._pos]
+        self._scanning = True
+        self._scanned = 1
+        self._depth = 1 if first in "{[" else 0
+        self._in_string = first == '"'
+        return self._scan()
+
+    def _scan(self) -> bool:
+        # Whether the value at the parse position is complete. The scan
+        # resumes where the previous chunk ended, so a value split over many
+        # chunks is scanned once and decoded once, instead of decoded again
+        # from its start on every chunk
+        buffer: str = self._buffer
+        index: int = self._pos + self._scanned
+        while True:
+            if self._in_string:
+                match = _STRING_SPECIAL.search(buffer, index)
+                if match is None:
+                    index = len(buffer)
+                    break
+                index = match.end()
+                if match.group() == "\\":
+                    if index == len(buffer):
+                        # Escaped character in the next chunk
+                        index -= 1
+                        break
+                    index += 1
+                    continue
+                self._in_string = False
+                if self._depth == 0:
+                    return True
+            elif self._depth == 0:
+                if _SCALAR_END.search(buffer, index) is None:
+                    index = len(buffer)
+                    break
+                return True
+            else:
+                match = _STRUCTURAL.search(buffer, index)
+                if match is None:
+                    index = len(buffer)
+                    break
+                index = match.end()
+                char: str = match.group()
+                if char == '"':
+                    self._in_string = True
+                elif char in "{[":
+                    self._depth += 1
+                else:
+                    self._depth -= 1
+                    if self._depth == 0:
+                        return True
+        self._scanned = index - self._pos
+        return False
+
+    def _expect(self, char: str, expected: str) -> None:
+        if char not in expected:
+            raise JSONDecodeError(
+                f"Expecting one of '{expected}'", self._buffer, self._pos
+            )
+        self._pos += 1
+
+    def _skip(self) -> bool:
+        while (
+            self._pos < len(self._buffer)
+            and self._buffer[self._pos] in WHITESPACE
+        ):
+            self._pos += 1
+        return self._pos < len(self._buffer)
@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import inspect
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from threading import Lock
+from typing import Any, Awaitable, Callable, Optional
+
+from . import utils
+from .checkpoint import Checkpoint, CheckpointStore
+from .model.response import C
+
+
+class Deduplicator:
+    """Bounded set of the most recently seen records.
+
+    Records are identified by a key (ie: alert id) and an optional version
+    (ie: alert update time), a record seen again with a new version is not
+    a duplicate. Records without key are never duplicates. The least
+    recently seen keys are evicted first.
+
+    :param maxsize: Maximum number of keys remembered.
+    :type maxsize: int
+    """
+
+    def __init__(self, maxsize: int = 10000):
+        self.maxsize = maxsize
+        self._seen: OrderedDict[str, Optional[str]] = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._seen)
+
+    def seen(self, key: Optional[str], version: Optional[str] = None) -> bool:
+        """Whether the record was already seen with the same version.
+
+        :param key: Identifier of the record, if any.
+        :type key: Optional[str]
+        :param version: Version of the record, if any.
+        :type version: Optional[str]
+        :rtype: bool
+        """
+        if key is None:
+            return False
+        with self._lock:
+            if key not in self._seen or self._seen[key] != version:
+                return False
+            self._seen.move_to_end(key)
+            return True
+
+    def add(self, key: Optional[str], version: Optional[str] = None) -> None:
+        """Remembers the record, evicting the least recently seen one when
+        the set is full. Records without key are not remembered.
+
+        :param key: Identifier of the record, if any.
+        :type key: Optional[str]
+        :param version: Version of the record, if any.
+        :type version: Optional[str]
+        """
+        if key is None:
+            return
+        with self._lock:
+            self._seen[key] = version
+            self._seen.move_to_end(key)
+            while len(self._seen) > self.maxsize:
+                self._seen.popitem(last=False)
+
+
+class IncrementalSync:
+    """State of an incremental synchronization, to reuse across polls.
+
+    Every poll only queries the records created or modified since the
+    watermark (latest record time consumed by the previous polls) minus
+    the overlap, records of the overlap already consumed are skipped. The
+    watermark is saved in the store once a poll succeeds, a failed poll is
+    queried again from the same watermark by the next one.
+
+    :param store: Store of the watermark.
+    :type store: CheckpointStore
+    :param overlap: Seconds queried again before the watermark, to catch
+     records sharing its time or indexed late.
+    :type overlap: float
+    :param dedupe_size: Number of records remembered to skip duplicates.
+    :type dedupe_size: int
+    """
+
+    def __init__(
+        self,
+        store: CheckpointStore,
+        overlap: float = 60,
+        dedupe_size: int = 10000,
+    ):
+        self.store = store
+        self.overlap = overlap
+        self.dedupe = Deduplicator(dedupe_size)
+        self._watermark: Optional[str] = None
+        self._watermark_time: Optional[datetime] = None
+        self._lock = Lock()
+
+    def start_time(self, default: Optional[str] = None) -> Optional[str]:
+        """Start time of the next poll, loads the saved watermark.
+
+        :param default: Start time used when no watermark was saved yet.
+        :type default: Optional[str]
+        :rtype: Optional[str]
+        """
+        checkpoint: Optional[Checkpoint] = self.store.load()
+        self._watermark = checkpoint.watermark if checkpoint else None
+        if not self._watermark:
+            self._watermark_time = None
+            return default
+        self._watermark_time = utils.parse_time(self._watermark)
+        return (
+            self._watermark_time - timedelta(seconds=self.overlap)
+        ).strftime(utils.DATE_TIME_FORMAT)
+
+    def track(
+        self,
+        consumer: Callable[[C], Any],
+        key: Callable[[C], Optional[str]],
+        time: Callable[[C], Optional[str]],
+        versioned: bool = False,
+    ) -> Callable[[C], Any]:
+        """Wraps the consumer to skip duplicates and track the watermark.
+
+        :param consumer: Function consuming new records.
+        :type consumer: Callable[[C], Any]
+        :param key: Identifier of a record, records without identifier
+         are always consumed.
+        :type key: Callable[[C], Optional[str]]
+        :param time: Time of a record tracked by the watermark.
+        :type time: Callable[[C], Optional[str]]
+        :param versioned: Records seen with a different time are consumed
+         again (ie: updated alerts).
+        :type versioned: bool
+        :rtype: Callable[[C], Any]
+        """
+
+        def consumed(item: C) -> None:
+            record_time: Optional[str] = time(item)
+            self.dedupe.add(key(item), record_time if versioned else None)
+            if not record_time:
+                return
+            parsed: datetime = utils.parse_time(record_time)
+            with self._lock:
+                if (
+                    self._watermark_time is None
+                    or parsed > self._watermark_time
+                ):
+                    self._watermark = record_time
+                    self._watermark_time = parsed
+
+        async def consumed_async(item: C, output: Awaitable[Any]) -> None:
+            await output
+            consumed(item)
+
+        def tracked(item: C) -> Any:
+            record_time: Optional[str] = time(item)
+            if self.dedupe.seen(key(item), record_time if versioned else None):
+                return None
+            output: Any = consumer(item)
+            if inspect.isawaitable(output):
+                return consumed_async(item, output)
+            consumed(item)
+            return None
+
+        return tracked
+
+    def commit(self) -> None:
+        """Saves the watermark reached by the successful poll."""
+        if self._watermark:
+            self.store.save(Checkpoint(watermark=self._watermark))
@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from threading import Lock
+from typing import Dict, Mapping, Optional
+from urllib.parse import urlsplit
+
+TOO_MANY_REQUESTS: int = 429
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """Maximum request rate of an API family.
+
+    :param rate: Requests per second.
+    :type rate: float
+    :param burst: Requests that can be sent at once after a quiet period.
+    :type burst: int
+    """
+
+    rate: float
+    burst: int = 1
+
+
+class RateLimiter:
+    """Paces requests per API family (ie: search, response, threatintel).
+
+    Every client sharing the limiter draws from the same token buckets, so
+    requests sent from many threads or tasks are spread according to the
+    configured rates. When Vision One answers 429 Too Many Requests, the
+    whole family is paused for the Retry-After delay and the request is
+    sent again, up to max_retries times.
+
+    :param limits: Rate limit by API family, the family of a request is the
+     first segment of its path after the API version.
+    :type limits: Optional[Mapping[str, RateLimit]]
+    :param default: Rate limit of families absent from limits, not limited
+     when omitted.
+    :type default: Optional[RateLimit]
+    :param max_retries: Number of times a throttled request is sent again.
+    :type max_retries: int
+    :param max_retry_after: Maximum seconds to wait before a retry.
+    :type max_retry_after: float
+    """
+
+    def __init__(
+        self,
+        limits: Optional[Mapping[str, RateLimit]] = None,
+        default: Optional[RateLimit] = None,
+        max_retries: int = 3,
+        max_retry_after: float = 60,
+    ):
+        self._limits: Dict[str, RateLimit] = dict(limits or {})
+        self._default = default
+        self._buckets: Dict[str, _Bucket] = {}
+        self._lock = Lock()
+        self.max_retries = max_retries
+        self.max_retry_after = max_retry_after
+
+    def reserve(self, url: str) -> float:
+        """Reserves a slot for a request and returns the seconds to wait
+        before sending it.
+
+        :param url: Url of the request.
+        :type url: str
+        :rtype: float
+        """
+        return self._bucket(url).reserve()
+
+    def throttled(
+        self, url: str, retry_after: Optional[str], attempt: int
+    ) -> Optional[float]:
+        """Handles a 429 response, pauses the API family and returns the
+        seconds to wait before retrying or None when retries are exhausted.
+
+        :param url: Url of the throttled request.
+        :type url: str
+        :param retry_after: Value of the Retry-After header if any.
+        :type retry_after: Optional[str]
+        :param attempt: Number of retries already done for this request.
+        :type attempt: int
+        :rtype: Optional[float]
+        """
+        if attempt >= self.max_retries:
+            return None
+        delay: float = min(
+            _retry_after(retry_after, float(2**attempt)),
+            self.max_retry_after,
+        )
+        self._bucket(url).pause(delay)
+        return delay
+
+    def _bucket(self, url: str) -> _Bucket:
+        name: str = family(url)
+        bucket: Optional[_Bucket] = self._buckets.get(name)
+        if bucket is None:
+            with self._lock:
+                bucket = self._buckets.setdefault(
+                    name, _Bucket(self._limits.get(name, self._default))
+                )
+        return bucket
+
+
+class _Bucket:
+    def __init__(self, limit: Optional[RateLimit]):
+        self._limit = limit
+        self._tokens: float = limit.burst if limit else 0
+        self._updated: float = time.monotonic()
+        self._paused_until: float = 0
+        self._lock = Lock()
+
+    def reserve(self) -> float:
+        with self._lock:
+            now: float = time.monotonic()
+            wait: float = max(self._paused_until - now, 0)
+            if self._limit is None:
+                return wait
+            self._tokens = min(
+                self._tokens + (now - self._updated) * self._limit.rate,
+                self._limit.burst,
+            )
+            self._updated = now
+            # Tokens go negative to queue requests in reservation order
+            self._tokens -= 1
+            if self._tokens < 0:
+                wait = max(wait, -self._tokens / self._limit.rate)
+            return wait
+
+    def pause(self, seconds: float) -> None:
+        with self._lock:
+            self._paused_until = max(
+                self._paused_until, time.monotonic() + seconds
+            )
+
+
+def family(url: str) -> str:
+    """API family of a request url (ie: /v3.0/search/... -> search).
+
+    :param url: Url of the request.
+    :type url: str
+    :rtype: str
+    """
+    segments = urlsplit(url).path.strip("/").split("/")
+    return segments[1] if len(segments) > 1 else segments[0]
+
+
+def _retry_after(value: Optional[str], default: float) -> float:
+    if not value:
+        return default
+    try:
+        return max(float(value), 0)
+    except ValueError:
+        pass
+    try:
+        date: datetime = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return default
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+    return max((date - datetime.now(timezone.utc)).total_seconds(), 0)
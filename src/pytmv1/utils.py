@@ -1,6 +1,7 @@
 import base64
 import re
-from typing import Any, Dict, List, Optional, Pattern, Type
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Pattern, Tuple, Type
 
 from .model.enum import QueryOp, SearchMode, TaskAction
 from .model.request import ObjectRequest, SuspiciousObjectRequest
@@ -20,6 +21,8 @@ MAC_ADDRESS_PATTERN: Pattern[str] = re.compile(
     "^([0-9A-Fa-f]{2}[:-]){5}([0-9A-Fa-f]{2})$"
 )
 GUID_PATTERN: Pattern[str] = re.compile("^(\\w+-+){1,5}\\w+$")
+FRACTION_PATTERN: Pattern[str] = re.compile("\\.(\\d+)")
+DATE_TIME_FORMAT: str = "%Y-%m-%dT%H:%M:%SZ"
 
 TASK_ACTION_MAP: Dict[TaskAction, Type[BaseTaskResp]] = {
     TaskAction.COLLECT_FILE: CollectFileTaskResp,
@@ -72,6 +75,18 @@ def _b64_encode(value: Optional[str]) -> Optional[str]:
     return base64.b64encode(value.encode()).decode() if value else None
 
 
+def parse_time(value: str) -> datetime:
+    # Fractions padded to microseconds, older fromisoformat only reads 3 or
+    # 6 digits (ie: 2024-01-01T00:00:00.5Z)
+    return datetime.fromisoformat(
+        FRACTION_PATTERN.sub(
+            lambda match: f".{match.group(1)[:6]:0<6}",
+            value.replace("Z", "+00:00"),
+            count=1,
+        )
+    ).astimezone(timezone.utc)
+
+
 def build_activity_request(
     start_time: Optional[str],
     end_time: Optional[str],
@@ -157,6 +172,46 @@ def filter_query(op: QueryOp, fields: Dict[str, str]) -> Dict[str, str]:
     return _build_query(op, "filter", fields)
 
 
+def split_time_range(
+    start_time: Optional[str], end_time: Optional[str], windows: int
+) -> List[Tuple[str, str]]:
+    end: datetime = (
+        parse_time(end_time) if end_time else datetime.now(timezone.utc)
+    ).replace(microsecond=0)
+    start: datetime = (
+        parse_time(start_time) if start_time else end - timedelta(hours=24)
+    ).replace(microsecond=0)
+    seconds: int = int((end - start).total_seconds())
+    windows = max(1, min(windows, seconds))
+    # Contiguous windows, each ends where the next one starts: records of
+    # the boundary second may be returned by both (see window_boundaries)
+    bounds: List[datetime] = [
+        start + timedelta(seconds=seconds * i // windows)
+        for i in range(windows)
+    ] + [end]
+    return [
+        (
+            bounds[i].strftime(DATE_TIME_FORMAT),
+            bounds[i + 1].strftime(DATE_TIME_FORMAT),
+        )
+        for i in range(windows)
+    ]
+
+
+def window_boundaries(windows: List[Tuple[str, str]]) -> List[int]:
+    return [
+        int(parse_time(window_end).timestamp() * 1000)
+        for _, window_end in windows[:-1]
+    ]
+
+
+def window_select(select: Optional[List[str]]) -> Optional[List[str]]:
+    # Event time is needed to find the boundary records of adjacent windows
+    if not select or "eventTime" in select or "event_time" in select:
+        return select
+    return [*select, "eventTime"]
+
+
 def task_action_resp_class(
     task_action: TaskAction,
 ) -> Type[BaseTaskResp]:
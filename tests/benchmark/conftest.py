@@ -0,0 +1,22 @@
+import pytest
+
+import pytmv1
+
+from .server import MockServer
+
+
+@pytest.fixture(scope="package")
+def server(pytestconfig):
+    with MockServer(
+        pytestconfig.getoption("bench-page-size"),
+        pytestconfig.getoption("bench-pages"),
+        pytestconfig.getoption("bench-latency"),
+    ) as mock_server:
+        yield mock_server
+
+
+@pytest.fixture(scope="package")
+def bench_client(server):
+    return pytmv1.Client(
+        pytmv1.core.Core("benchmark", "dummyToken", server.url, 1, 10, 10, 30)
+    )
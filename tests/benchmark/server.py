@@ -0,0 +1,274 @@
+import http.server
+import json
+import threading
+import time
+from collections import Counter
+from itertools import count
+from urllib.parse import parse_qs, urlsplit
+
+API_VERSION = "/v3.0"
+
+
+def alert(index):
+    return {
+        "id": f"WB-{index}",
+        "schemaVersion": "1.12",
+        "status": "Open",
+        "investigationStatus": "New",
+        "investigationResult": "No Findings",
+        "workbenchLink": f"https://portal/workbench/WB-{index}",
+        "alertProvider": "SAE",
+        "model": "Possible Credential Dumping via Registry",
+        "modelType": "preset",
+        "modelId": "1",
+        "score": 64,
+        "severity": "high",
+        "createdDateTime": "2024-01-01T00:00:00Z",
+        "updatedDateTime": "2024-01-01T00:00:00Z",
+        "description": "description",
+        "impactScope": {
+            "desktopCount": 1,
+            "serverCount": 0,
+            "accountCount": 1,
+            "emailAddressCount": 0,
+            "containerCount": 0,
+            "cloudIdentityCount": 0,
+            "entities": [
+                {
+                    "entityId": "guid",
+                    "entityType": "host",
+                    "entityValue": {
+                        "name": "host",
+                        "ips": ["10.1.2.3"],
+                        "guid": "guid",
+                    },
+                    "relatedEntities": [],
+                    "relatedIndicatorIds": [1],
+                    "provenance": ["Alert"],
+                }
+            ],
+        },
+        "matchedRules": [
+            {
+                "id": "1",
+                "name": "rule",
+                "matchedFilters": [
+                    {
+                        "id": "1",
+                        "name": "filter",
+                        "matchedDateTime": "2024-01-01T00:00:00Z",
+                        "mitreTechniqueIds": ["T1003"],
+                        "matchedEvents": [
+                            {
+                                "uuid": "uuid",
+                                "matchedDateTime": "2024-01-01T00:00:00Z",
+                                "type": "TELEMETRY_REGISTRY",
+                            }
+                        ],
+                    }
+                ],
+            }
+        ],
+        "indicators": [
+            {
+                "id": 1,
+                "type": "command_line",
+                "field": "objectCmd",
+                "value": "reg save HKLM\\SAM sam.hiv",
+                "relatedEntities": ["guid"],
+                "filterIds": ["1"],
+                "provenance": ["Alert"],
+            }
+        ],
+    }
+
+
+def activity(index):
+    return {
+        "endpointGuid": f"guid-{index % 50}",
+        "endpointHostName": f"host-{index % 50}",
+        "endpointIp": ["10.1.2.3"],
+        "eventId": "1",
+        "eventSubId": "2",
+        "eventTime": 1704067200000 + index,
+        "eventTimeDT": "2024-01-01T00:00:00Z",
+        "dpt": 443,
+        "dst": "10.1.2.4",
+        "logonUser": ["user"],
+        "objectCmd": "C:\\Windows\\System32\\cmd.exe /c whoami",
+        "objectFilePath": "C:\\Windows\\System32\\cmd.exe",
+        "processCmd": "C:\\Windows\\explorer.exe",
+        "tags": ["XSAE.F1234"],
+        "uuid": f"uuid-{index}",
+    }
+
+
+def oat(index):
+    return {
+        "uuid": f"uuid-{index}",
+        "source": "endpointActivityData",
+        "filters": [
+            {
+                "id": "F1234",
+                "name": "filter",
+                "description": "description",
+                "highlightedObjects": [],
+                "mitreTacticIds": ["TA0006"],
+                "mitreTechniqueIds": ["T1003"],
+                "riskLevel": "high",
+                "type": "preset",
+            }
+        ],
+        "entityType": "endpoint",
+        "entityName": "host",
+        "detectedDateTime": "2024-01-01T00:00:00Z",
+        "ingestedDateTime": "2024-01-01T00:00:00Z",
+        "detail": activity(index),
+    }
+
+
+class MockServer:
+    """Loopback Vision One API serving synthetic records.
+
+    Paginated APIs (workbench alerts, OAT detections and endpoint
+    activities) return pages pages of page_size records, endpoint
+    isolation returns a multi status response of one task per endpoint
+    and a task result is running until it is polled polls times. Every
+    response is delayed by latency seconds. Pages are encoded once, so
+    the server adds little to the measured time.
+    """
+
+    def __init__(self, page_size=100, pages=10, latency=0.0, polls=2):
+        self.page_size = page_size
+        self.pages = pages
+        self.latency = latency
+        self.polls = polls
+        self._polled = Counter()
+        self._task_ids = count()
+        self._lock = threading.Lock()
+        self._server = http.server.ThreadingHTTPServer(
+            ("127.0.0.1", 0), self._handler()
+        )
+        self.url = f"http://127.0.0.1:{self._server.server_port}"
+        self._bodies = {
+            path: [self._page(path, page, records) for page in range(pages)]
+            for path, records in (
+                ("/workbench/alerts", alert),
+                ("/oat/detections", oat),
+                ("/search/endpointActivities", activity),
+            )
+        }
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *args):
+        self.stop()
+
+    def start(self):
+        threading.Thread(
+            target=self._server.serve_forever, daemon=True
+        ).start()
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _page(self, path, page, record):
+        items = [
+            record(page * self.page_size + index)
+            for index in range(self.page_size)
+        ]
+        body = {
+            "totalCount": self.page_size * self.pages,
+            "count": len(items),
+            "progressRate": 100,
+            "items": items,
+        }
+        if page + 1 < self.pages:
+            body["nextLink"] = (
+                f"{self.url}{API_VERSION}{path}?skipToken={page + 1}"
+            )
+        return json.dumps(body).encode()
+
+    def _task(self, task_id):
+        with self._lock:
+            self._polled[task_id] += 1
+            running = self._polled[task_id] < self.polls
+        return json.dumps(
+            {
+                "id": task_id,
+                "status": "running" if running else "succeeded",
+                "action": "isolate",
+                "createdDateTime": "2024-01-01T00:00:00Z",
+                "lastActionDateTime": "2024-01-01T00:00:00Z",
+                "agentGuid": "guid",
+                "endpointName": "host",
+            }
+        ).encode()
+
+    def _multi_status(self, body):
+        with self._lock:
+            task_ids = [
+                next(self._task_ids)
+                for _ in range(len(json.loads(body or b"[]")))
+            ]
+        return json.dumps(
+            [
+                {
+                    "status": 202,
+                    "headers": [
+                        {
+                            "name": "Operation-Location",
+                            "value": (
+                                f"{self.url}{API_VERSION}"
+                                f"/response/tasks/{task_id:08d}"
+                            ),
+                        }
+                    ],
+                }
+                for task_id in task_ids
+            ]
+        ).encode()
+
+    def _handler(self):
+        server = self
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def do_GET(self):
+                url = urlsplit(self.path)
+                path = url.path.replace(API_VERSION, "", 1)
+                if path in server._bodies:
+                    page = int(parse_qs(url.query).get("skipToken", ["0"])[0])
+                    self._reply(200, server._bodies[path][page])
+                elif path.startswith("/response/tasks/"):
+                    self._reply(200, server._task(path.split("/")[-1]))
+                else:
+                    self._reply(404, b'{"error": {"code": "NotFound"}}')
+
+            def do_POST(self):
+                body = self.rfile.read(
+                    int(self.headers.get("Content-Length", 0))
+                )
+                if self.path == f"{API_VERSION}/response/endpoints/isolate":
+                    self._reply(207, server._multi_status(body))
+                else:
+                    self._reply(404, b'{"error": {"code": "NotFound"}}')
+
+            def _reply(self, status, body):
+                if server.latency:
+                    time.sleep(server.latency)
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
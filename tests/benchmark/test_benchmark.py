@@ -0,0 +1,92 @@
+import pytest
+from requests import Response
+
+from pytmv1 import (
+    EndpointRequest,
+    ListAlertsResp,
+    ListEndpointActivityResp,
+    ListOatsResp,
+    PollStrategy,
+    ResultCode,
+)
+from pytmv1.core import _parse_data
+
+pytest.importorskip("pytest_benchmark")
+
+FAST_POLL = PollStrategy(first_delay=0, interval=0.001, jitter=0)
+
+
+def consumed(server, result):
+    assert result.result_code == ResultCode.SUCCESS
+    assert result.response.total_consumed == server.page_size * server.pages
+
+
+def test_consume_alerts(benchmark, server, bench_client):
+    consumed(server, benchmark(bench_client.alert.consume, lambda _: None))
+
+
+def test_consume_oat(benchmark, server, bench_client):
+    consumed(server, benchmark(bench_client.oat.consume, lambda _: None))
+
+
+@pytest.mark.parametrize("stream", [False, True])
+def test_consume_activity(benchmark, server, bench_client, stream):
+    consumed(
+        server,
+        benchmark(
+            bench_client.endpoint.consume_activity,
+            lambda _: None,
+            stream=stream,
+        ),
+    )
+
+
+def test_consume_activity_prefetch(benchmark, server, bench_client):
+    consumed(
+        server,
+        benchmark(
+            bench_client.endpoint.consume_activity, lambda _: None, prefetch=2
+        ),
+    )
+
+
+@pytest.mark.parametrize(
+    "class_, path",
+    [
+        (ListAlertsResp, "/workbench/alerts"),
+        (ListOatsResp, "/oat/detections"),
+        (ListEndpointActivityResp, "/search/endpointActivities"),
+    ],
+)
+def test_parse_page(benchmark, server, class_, path):
+    def parse():
+        response = Response()
+        response.status_code = 200
+        response.headers["Content-Type"] = "application/json"
+        response._content = server._bodies[path][0]
+        return _parse_data(response, class_)
+
+    assert len(benchmark(parse).items) == server.page_size
+
+
+def test_send_multi(benchmark, bench_client):
+    endpoints = [EndpointRequest(agent_guid=f"guid-{i}") for i in range(50)]
+    result = benchmark(bench_client.endpoint.isolate, *endpoints)
+    assert result.result_code == ResultCode.SUCCESS
+    assert len(result.response.items) == 50
+
+
+def test_task_polling(benchmark, bench_client):
+    def isolate_and_poll():
+        task_id = (
+            bench_client.endpoint.isolate(EndpointRequest(agent_guid="guid"))
+            .response.items[0]
+            .task_id
+        )
+        return bench_client.task.get_result(
+            task_id, poll_time_sec=10, poll_strategy=FAST_POLL
+        )
+
+    result = benchmark(isolate_and_poll)
+    assert result.result_code == ResultCode.SUCCESS
+    assert result.response.status == "succeeded"
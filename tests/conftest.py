@@ -19,6 +19,30 @@ def pytest_addoption(parser):
         dest="token",
         help="Token Vision One API",
     )
+    parser.addoption(
+        "--bench-page-size",
+        action="store",
+        default=200,
+        type=int,
+        dest="bench-page-size",
+        help="Records per page served by the benchmark server",
+    )
+    parser.addoption(
+        "--bench-pages",
+        action="store",
+        default=5,
+        type=int,
+        dest="bench-pages",
+        help="Pages per paginated API served by the benchmark server",
+    )
+    parser.addoption(
+        "--bench-latency",
+        action="store",
+        default=0.0,
+        type=float,
+        dest="bench-latency",
+        help="Seconds the benchmark server waits before every response",
+    )
 
 
 @pytest.fixture(scope="package")
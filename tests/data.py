@@ -1,3 +1,6 @@
+import io
+import json
+
 from requests import Response
 
 from pytmv1 import (
@@ -29,6 +32,55 @@ class TextResponse(Response):
         return self.value
 
 
+def json_response(body=None, status=200, charset=None, headers=None):
+    response = Response()
+    response.status_code = status
+    response.headers.update(headers or {})
+    if body is None:
+        response.raw = io.BytesIO(b"")
+        return response
+    response.headers["Content-Type"] = "application/json" + (
+        f"; charset={charset}" if charset else ""
+    )
+    response.raw = io.BytesIO(
+        body if isinstance(body, bytes) else json.dumps(body).encode()
+    )
+    return response
+
+
+def exception_page(next_link=None):
+    return {
+        "nextLink": next_link,
+        "items": [
+            {
+                "type": "ip",
+                "ip": "1.1.1.1",
+                "lastModifiedDateTime": "2023-01-12T14:05:37Z",
+            }
+        ],
+    }
+
+
+def oat_item(uuid, **fields):
+    return {
+        "uuid": uuid,
+        "filters": [],
+        "entityType": "endpoint",
+        "entityName": "host",
+        "detail": {"endpointGuid": "guid"},
+        **fields,
+    }
+
+
+def page(*items, next_link=None):
+    return {
+        "nextLink": next_link,
+        "totalCount": len(items),
+        "count": len(items),
+        "items": list(items),
+    }
+
+
 def sae_alert():
     return SaeAlert.model_construct(
         id="1",
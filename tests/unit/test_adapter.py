@@ -0,0 +1,197 @@
+import http.server
+import threading
+
+import httpx
+import pytest
+from requests import ConnectionError as RequestsConnectionError
+from requests import Request, Timeout
+
+from pytmv1 import ConnectivityResp, ListExceptionsResp, ResultCode
+from pytmv1.adapter import HTTPAdapter, HTTPConnectionPool, HttpxAdapter
+from pytmv1.core import Core
+from pytmv1.model.enum import Api
+from tests.data import exception_page
+
+
+class JsonHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = b'{"status": "available"}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def server_url():
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), JsonHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}/"
+    server.shutdown()
+    server.server_close()
+
+
+def mock_adapter(handler):
+    adapter = HttpxAdapter(1, http2=False)
+    adapter._client = httpx.Client(transport=httpx.MockTransport(handler))
+    return adapter
+
+
+def test_send():
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(
+            200, json={"status": "available"}, headers={"X-Test": "1"}
+        )
+
+    response = mock_adapter(handler).send(
+        Request(
+            "POST", "https://dummy.com/v3.0/path", json={"id": 1}
+        ).prepare(),
+        timeout=(10, 30),
+    )
+    assert response.status_code == 200
+    assert response.headers["x-test"] == "1"
+    assert response.json() == {"status": "available"}
+    assert requests[0].method == "POST"
+    assert requests[0].content == b'{"id": 1}'
+    assert requests[0].extensions["timeout"]["read"] == 30
+
+
+def test_send_with_stream():
+    response = mock_adapter(
+        lambda request: httpx.Response(200, content=b"0123456789")
+    ).send(Request("GET", "https://dummy.com").prepare(), stream=True)
+    assert list(response.iter_content(4)) == [b"0123", b"4567", b"89"]
+
+
+@pytest.mark.parametrize(
+    "error, expected",
+    [
+        (httpx.ConnectTimeout("timeout"), Timeout),
+        (httpx.ConnectError("refused"), RequestsConnectionError),
+    ],
+)
+def test_send_with_error_is_failed(error, expected):
+    def handler(request):
+        raise error
+
+    with pytest.raises(expected):
+        mock_adapter(handler).send(
+            Request("GET", "https://dummy.com").prepare()
+        )
+
+
+def test_core_with_httpx_adapter():
+    def handler(request):
+        if request.url.path.endswith("connectivity"):
+            return httpx.Response(200, json={"status": "available"})
+        if "skipToken" in str(request.url):
+            return httpx.Response(200, json=exception_page())
+        return httpx.Response(
+            200,
+            json=exception_page(
+                "https://dummy.com/v3.0/threatintel/"
+                "suspiciousObjectExceptions?skipToken=abc"
+            ),
+        )
+
+    core = Core("appname", "dummyToken", "https://dummy.com", 1, 1, 30, 30)
+    core._adapter = mock_adapter(handler)
+    assert (
+        core.send(ConnectivityResp, Api.CONNECTIVITY).result_code
+        == ResultCode.SUCCESS
+    )
+    consumed = []
+    result = core.send_linkable(
+        ListExceptionsResp,
+        Api.GET_EXCEPTION_OBJECTS,
+        consumed.append,
+        stream=True,
+    )
+    assert result.result_code == ResultCode.SUCCESS
+    assert len(consumed) == 2
+
+
+def test_core_with_http2():
+    pytest.importorskip("h2")
+    core = Core(
+        "appname", "dummyToken", "https://dummy.com", 1, 1, 30, 30, http2=True
+    )
+    assert isinstance(core._adapter, HttpxAdapter)
+
+
+def test_pool_stats(server_url):
+    adapter = HTTPAdapter(1, 1, 0, True)
+    for _ in range(3):
+        assert adapter.send(
+            Request("GET", server_url).prepare(), timeout=(1, 1)
+        ).json() == {"status": "available"}
+    stats = adapter.stats()
+    assert stats.created == 1
+    assert stats.reused == 2
+    assert stats.in_use == 0
+    assert stats.max_in_use == 1
+    assert stats.timeouts == 0
+
+
+def test_pool_timeout(server_url):
+    adapter = HTTPAdapter(1, 1, 0, True, 0.1)
+    response = adapter.send(
+        Request("GET", server_url).prepare(), stream=True, timeout=(1, 1)
+    )
+    with pytest.raises(RequestsConnectionError):
+        adapter.send(Request("GET", server_url).prepare(), timeout=(1, 1))
+    assert adapter.stats().in_use == 1
+    assert adapter.stats().timeouts == 1
+    assert adapter.stats().wait_time >= 0.1
+    response.close()
+    assert adapter.stats().in_use == 0
+
+
+def test_pool_stats_with_proxy(server_url):
+    adapter = HTTPAdapter(1, 1, 0, True, 0.1)
+    proxies = {"http": server_url}
+    response = adapter.send(
+        Request("GET", "http://vision.one/").prepare(),
+        stream=True,
+        timeout=(1, 1),
+        proxies=proxies,
+    )
+    assert adapter.stats().created == 1
+    assert adapter.stats().in_use == 1
+    with pytest.raises(RequestsConnectionError):
+        adapter.send(
+            Request("GET", "http://vision.one/").prepare(),
+            timeout=(1, 1),
+            proxies=proxies,
+        )
+    assert adapter.stats().timeouts == 1
+    assert response.json() == {"status": "available"}
+    assert adapter.stats().in_use == 0
+
+
+def test_pool_without_metrics(server_url):
+    pool = HTTPConnectionPool("127.0.0.1", int(server_url.split(":")[2][:-1]))
+    assert pool.request("GET", "/").json() == {"status": "available"}
+    assert pool.metrics is None
+
+
+def test_core_pool_stats(server_url):
+    core = Core("appname", "dummyToken", server_url, 1, 2, 1, 1)
+    assert core.send(ConnectivityResp, Api.CONNECTIVITY).response.status
+    assert core.pool_stats().created == 1
+    assert (
+        Core(
+            "appname", "dummyToken", server_url, 1, 2, 1, 1, pool_timeout=1
+        )._adapter.poolmanager.pool_timeout
+        == 1
+    )
@@ -0,0 +1,397 @@
+import asyncio
+import json
+
+import httpx
+
+import pytmv1
+from pytmv1 import (
+    AddAlertNoteResp,
+    CollectFileTaskResp,
+    ConnectivityResp,
+    ListExceptionsResp,
+    MultiResp,
+    PollStrategy,
+    ResultCode,
+    Status,
+)
+from pytmv1 import async_core as async_core_m
+from pytmv1 import core as core_m
+from pytmv1.adapter import default_pool_maxsize
+from pytmv1.async_core import AsyncCore
+from pytmv1.core import API_VERSION
+from pytmv1.model.enum import Api
+from pytmv1.model.response import BaseStatusResponse
+from tests.data import exception_page
+
+
+def async_core(handler):
+    core = AsyncCore("appname", "dummyToken", "https://dummy.com", 1, 30, 30)
+    core._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return core
+
+
+def test_init_async():
+    client = pytmv1.init_async(
+        "dummy_name", "dummy_token", "https://dummy.com"
+    )
+    assert isinstance(client, pytmv1.AsyncClient)
+    assert client._core._appname == "dummy_name"
+    assert client._core._url == "https://dummy.com/" + API_VERSION
+    assert client._core._pool_maxsize == default_pool_maxsize()
+    asyncio.run(client.close())
+
+
+def test_send():
+    def handler(request):
+        assert request.headers["Authorization"] == "Bearer dummyToken"
+        return httpx.Response(200, json={"status": "available"})
+
+    result = asyncio.run(
+        async_core(handler).send(ConnectivityResp, Api.CONNECTIVITY)
+    )
+    assert result.result_code == ResultCode.SUCCESS
+    assert result.response.status == "available"
+
+
+def test_send_with_throttling_is_retried(mocker):
+    mock_sleep = mocker.patch.object(
+        async_core_m.asyncio, "sleep", mocker.AsyncMock()
+    )
+    responses = [
+        httpx.Response(
+            429,
+            headers={"Retry-After": "2"},
+            json={"error": {"code": "TooManyRequests"}},
+        ),
+        httpx.Response(200, json={"status": "available"}),
+    ]
+    result = asyncio.run(
+        async_core(lambda request: responses.pop(0)).send(
+            ConnectivityResp, Api.CONNECTIVITY
+        )
+    )
+    assert result.result_code == ResultCode.SUCCESS
+    assert 1 < mock_sleep.call_args.args[0] <= 2
+
+
+def test_send_with_created_keeps_header_case():
+    def handler(request):
+        return httpx.Response(
+            201, headers={"Location": "https://dummy.com/notes/123"}
+        )
+
+    result = asyncio.run(
+        async_core(handler).send(
+            AddAlertNoteResp, Api.ADD_ALERT_NOTE.value.format("1")
+        )
+    )
+    assert result.result_code == ResultCode.SUCCESS
+    assert result.response.note_id == "123"
+
+
+def test_send_with_connection_error_is_failed(mocker):
+    mock_sleep = mocker.patch.object(
+        async_core_m.asyncio, "sleep", mocker.AsyncMock()
+    )
+    handler = mocker.Mock(side_effect=httpx.ConnectError("refused"))
+
+    result = asyncio.run(
+        async_core(handler).send(ConnectivityResp, Api.CONNECTIVITY)
+    )
+    assert result.result_code == ResultCode.ERROR
+    assert result.error.status == 500
+    assert result.error.code == "ConnectionError"
+    assert handler.call_count == 4
+    assert [c.args[0] for c in mock_sleep.call_args_list] == [0.5, 1, 2]
+
+
+def test_send_with_server_error_is_retried(mocker):
+    mocker.patch.object(async_core_m.asyncio, "sleep", mocker.AsyncMock())
+    responses = [
+        httpx.Response(503, text="unavailable"),
+        httpx.Response(200, json={"status": "available"}),
+    ]
+    result = asyncio.run(
+        async_core(lambda request: responses.pop(0)).send(
+            ConnectivityResp, Api.CONNECTIVITY
+        )
+    )
+    assert result.result_code == ResultCode.SUCCESS
+
+
+def test_send_multi_with_server_error_is_not_retried(mocker):
+    handler = mocker.Mock(return_value=httpx.Response(503, text="error"))
+    result = asyncio.run(
+        async_core(handler).send_multi(
+            MultiResp, Api.ADD_TO_BLOCK_LIST, json=[]
+        )
+    )
+    assert result.result_code == ResultCode.ERROR
+    assert handler.call_count == 1
+
+
+def test_send_linkable_with_next_link():
+    consumed = []
+
+    def handler(request):
+        if "skipToken" in str(request.url):
+            return httpx.Response(200, json=exception_page())
+        return httpx.Response(
+            200,
+            json=exception_page(
+                "https://dummy.com/v3.0/threatintel/"
+                "suspiciousObjectExceptions?skipToken=abc"
+            ),
+        )
+
+    async def consumer(item):
+        consumed.append(item)
+
+    result = asyncio.run(
+        async_core(handler).send_linkable(
+            ListExceptionsResp, Api.GET_EXCEPTION_OBJECTS, consumer
+        )
+    )
+    assert result.result_code == ResultCode.SUCCESS
+    assert result.response.total_consumed == 2
+    assert len(consumed) == 2
+
+
+def test_send_batches_with_next_link():
+    def handler(request):
+        if "skipToken" in str(request.url):
+            return httpx.Response(200, json=exception_page())
+        return httpx.Response(
+            200,
+            json=exception_page(
+                "https://dummy.com/v3.0/threatintel/"
+                "suspiciousObjectExceptions?skipToken=abc"
+            ),
+        )
+
+    batches = []
+
+    async def consumer(batch):
+        batches.append(batch)
+
+    result = asyncio.run(
+        async_core(handler).send_batches(
+            ListExceptionsResp, Api.GET_EXCEPTION_OBJECTS, consumer
+        )
+    )
+    assert result.result_code == ResultCode.SUCCESS
+    assert result.response.total_consumed == 2
+    assert [batch["type"] for batch in batches] == [["ip"], ["ip"]]
+
+
+def test_send_multi_with_chunks(mocker):
+    mocker.patch.dict(core_m.MULTI_CHUNK_SIZES, {Api.ADD_TO_BLOCK_LIST: 2})
+    bodies = []
+
+    def handler(request):
+        body = json.loads(request.content)
+        bodies.append(body)
+        return httpx.Response(
+            207, json=[{"status": 202 if v != "3" else 400} for v in body]
+        )
+
+    result = asyncio.run(
+        async_core(handler).send_multi(
+            MultiResp, Api.ADD_TO_BLOCK_LIST, json=["1", "2", "3"]
+        )
+    )
+    assert sorted(bodies) == [["1", "2"], ["3"]]
+    assert result.result_code == ResultCode.ERROR
+    assert [item.status for item in result.response.items] == [202, 202, 400]
+    assert [error.status for error in result.errors] == [400]
+
+
+def test_send_multi_with_chunks_is_bounded(mocker):
+    mocker.patch.dict(core_m.MULTI_CHUNK_SIZES, {Api.ADD_TO_BLOCK_LIST: 1})
+    running = []
+    peak = []
+
+    async def handler(request):
+        running.append(request)
+        peak.append(len(running))
+        await asyncio.sleep(0.01)
+        running.remove(request)
+        return httpx.Response(207, json=[{"status": 202}])
+
+    core = AsyncCore("appname", "dummyToken", "https://dummy.com", 2, 30, 30)
+    core._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    result = asyncio.run(
+        core.send_multi(
+            MultiResp, Api.ADD_TO_BLOCK_LIST, json=["1", "2", "3", "4", "5"]
+        )
+    )
+    assert result.result_code == ResultCode.SUCCESS
+    assert len(peak) == 5
+    assert max(peak) == 2
+
+
+def test_send_multi_with_multi_status_is_failed():
+    def handler(request):
+        return httpx.Response(
+            207,
+            json=[
+                {"status": 202},
+                {"status": 400, "body": {"error": {"code": "BadRequest"}}},
+            ],
+        )
+
+    result = asyncio.run(
+        async_core(handler).send_multi(MultiResp, Api.ADD_TO_BLOCK_LIST)
+    )
+    assert result.result_code == ResultCode.ERROR
+    assert result.errors[1].status == 400
+    assert result.errors[1].code == "BadRequest"
+
+
+def test_iter_linkable_with_next_link():
+    def handler(request):
+        if "skipToken" in str(request.url):
+            return httpx.Response(200, json=exception_page())
+        return httpx.Response(
+            200,
+            json=exception_page(
+                "https://dummy.com/v3.0/threatintel/"
+                "suspiciousObjectExceptions?skipToken=abc"
+            ),
+        )
+
+    async def collect():
+        return [
+            item
+            async for item in async_core(handler).iter_linkable(
+                ListExceptionsResp, Api.GET_EXCEPTION_OBJECTS
+            )
+        ]
+
+    items = asyncio.run(collect())
+    assert len(items) == 2
+    assert items[0].value == "1.1.1.1"
+
+
+def test_send_linkable_with_prefetch():
+    def handler(request):
+        if "skipToken" in str(request.url):
+            return httpx.Response(200, json=exception_page())
+        return httpx.Response(
+            200,
+            json=exception_page(
+                "https://dummy.com/v3.0/threatintel/"
+                "suspiciousObjectExceptions?skipToken=abc"
+            ),
+        )
+
+    consumed = []
+    result = asyncio.run(
+        async_core(handler).send_linkable(
+            ListExceptionsResp,
+            Api.GET_EXCEPTION_OBJECTS,
+            consumed.append,
+            prefetch=1,
+        )
+    )
+    assert result.result_code == ResultCode.SUCCESS
+    assert result.response.total_consumed == 2
+    assert len(consumed) == 2
+
+
+def test_send_linkable_with_stream():
+    def handler(request):
+        if "skipToken" in str(request.url):
+            return httpx.Response(200, json=exception_page())
+        return httpx.Response(
+            200,
+            json=exception_page(
+                "https://dummy.com/v3.0/threatintel/"
+                "suspiciousObjectExceptions?skipToken=abc"
+            ),
+        )
+
+    consumed = []
+    result = asyncio.run(
+        async_core(handler).send_linkable(
+            ListExceptionsResp,
+            Api.GET_EXCEPTION_OBJECTS,
+            consumed.append,
+            stream=True,
+        )
+    )
+    assert result.result_code == ResultCode.SUCCESS
+    assert result.response.total_consumed == 2
+    assert consumed[1].value == "1.1.1.1"
+
+
+def test_send_linkable_with_stream_error_is_failed():
+    def handler(request):
+        return httpx.Response(
+            400, json={"error": {"code": "BadRequest", "message": "Invalid"}}
+        )
+
+    result = asyncio.run(
+        async_core(handler).send_linkable(
+            ListExceptionsResp,
+            Api.GET_EXCEPTION_OBJECTS,
+            lambda x: None,
+            stream=True,
+        )
+    )
+    assert result.result_code == ResultCode.ERROR
+    assert result.error.status == 400
+    assert result.error.code == "BadRequest"
+
+
+def test_poll_status_with_strategy(mocker):
+    mock_sleep = mocker.patch.object(
+        async_core_m.asyncio, "sleep", mocker.AsyncMock()
+    )
+    statuses = [Status.QUEUED, Status.RUNNING, Status.SUCCEEDED]
+
+    async def status_call():
+        return BaseStatusResponse.model_construct(status=statuses.pop(0))
+
+    response = asyncio.run(
+        async_core_m._poll_status(
+            status_call, 60, PollStrategy(interval=1, multiplier=3)
+        )
+    )
+    assert response.status == Status.SUCCEEDED
+    assert [c.args[0] for c in mock_sleep.call_args_list] == [0, 1, 3]
+
+
+def test_iter_task_results(mocker):
+    def handler(request):
+        task_id = request.url.path.rsplit("/", 1)[-1]
+        status = "succeeded" if task_id == "1" or handler.calls else "running"
+        handler.calls += task_id == "2"
+        return httpx.Response(
+            200,
+            json={
+                "id": task_id,
+                "status": status,
+                "createdDateTime": "2023-01-01T00:00:00Z",
+                "lastActionDateTime": "2023-01-01T00:00:00Z",
+                "action": "collectFile",
+                "agentGuid": "guid",
+                "endpointName": "name",
+            },
+        )
+
+    handler.calls = 0
+    mocker.patch.object(async_core_m.asyncio, "sleep", mocker.AsyncMock())
+
+    async def collect():
+        return [
+            (task_id, task_result.response.status)
+            async for task_id, task_result in async_core(
+                handler
+            ).iter_task_results(CollectFileTaskResp, ["1", "2"], 60)
+        ]
+
+    assert asyncio.run(collect()) == [
+        ("1", Status.SUCCEEDED),
+        ("2", Status.SUCCEEDED),
+    ]
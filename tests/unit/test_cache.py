@@ -0,0 +1,292 @@
+import asyncio
+
+import httpx
+
+from pytmv1 import (
+    AsyncClient,
+    Client,
+    EndpointCache,
+    EndpointDetail,
+    EndpointSecurityEndpoint,
+    GetAlertNoteResp,
+    NoContentResp,
+    ResponseCache,
+    ResultCode,
+)
+from pytmv1.async_core import AsyncCore
+from pytmv1.core import Core
+from pytmv1.model.enum import Api, HttpMethod
+from tests.data import json_response, page
+
+NOTE = {
+    "id": 1,
+    "content": "note",
+    "creatorName": "John",
+    "createdDateTime": "2024-01-01T00:00:00Z",
+    "creatorMailAddress": None,
+    "lastUpdatedBy": None,
+    "lastUpdatedDateTime": None,
+}
+NOTE_API = Api.GET_ALERT_NOTE.value.format("A1", 1)
+
+
+def test_cache_evicts_least_recently_used():
+    cache = ResponseCache(maxsize=2)
+    cache.put("token", "url1", '"1"', NoContentResp())
+    cache.put("token", "url2", '"2"', NoContentResp())
+    assert cache.get("token", "url1")[0] == '"1"'
+    cache.put("token", "url3", '"3"', NoContentResp())
+    assert len(cache) == 2
+    assert cache.get("token", "url2") is None
+    assert cache.get("other", "url1") is None
+
+
+def test_cache_expires_entries(mocker):
+    clock = mocker.patch("pytmv1.cache.time.monotonic", return_value=100.0)
+    cache = ResponseCache(ttl=10)
+    cache.put("token", "url", '"1"', NoContentResp())
+    clock.return_value = 109.0
+    assert cache.get("token", "url")
+    clock.return_value = 110.0
+    assert cache.get("token", "url") is None
+    assert len(cache) == 0
+
+
+def test_send_with_not_modified_returns_cached(mocker):
+    core = Core(
+        "appname",
+        "dummyToken",
+        "https://dummy.com",
+        1,
+        1,
+        30,
+        30,
+        response_cache=ResponseCache(),
+    )
+    mock_send = mocker.patch.object(
+        core._adapter,
+        "send",
+        side_effect=[
+            json_response(NOTE, headers={"ETag": '"v1"'}),
+            json_response(status=304),
+        ],
+    )
+    first = core.send(GetAlertNoteResp, NOTE_API)
+    second = core.send(GetAlertNoteResp, NOTE_API)
+    assert first.result_code == second.result_code == ResultCode.SUCCESS
+    assert second.response is first.response
+    assert "If-None-Match" not in mock_send.call_args_list[0].args[0].headers
+    assert mock_send.call_args.args[0].headers["If-None-Match"] == '"v1"'
+
+
+def test_send_with_modified_replaces_cached(mocker):
+    cache = ResponseCache()
+    core = Core(
+        "appname",
+        "dummyToken",
+        "https://dummy.com",
+        1,
+        1,
+        30,
+        30,
+        response_cache=cache,
+    )
+    mocker.patch.object(
+        core._adapter,
+        "send",
+        side_effect=[
+            json_response(NOTE, headers={"ETag": '"v1"'}),
+            json_response(
+                {**NOTE, "content": "updated"}, headers={"ETag": '"v2"'}
+            ),
+            json_response(status=204),
+        ],
+    )
+    core.send(GetAlertNoteResp, NOTE_API)
+    result = core.send(GetAlertNoteResp, NOTE_API)
+    assert result.response.data.content == "updated"
+    assert cache.get("dummyToken", core._url + NOTE_API)[0] == '"v2"'
+    core.send(NoContentResp, NOTE_API, HttpMethod.PATCH, json={})
+    assert len(cache) == 1
+
+
+def test_async_send_with_not_modified_returns_cached():
+    headers = []
+
+    def handler(request):
+        headers.append(request.headers.get("If-None-Match"))
+        if len(headers) > 1:
+            return httpx.Response(304)
+        return httpx.Response(200, json=NOTE, headers={"ETag": '"v1"'})
+
+    core = AsyncCore(
+        "appname",
+        "dummyToken",
+        "https://dummy.com",
+        1,
+        30,
+        30,
+        response_cache=ResponseCache(),
+    )
+    core._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    async def send_twice():
+        return [await core.send(GetAlertNoteResp, NOTE_API) for _ in range(2)]
+
+    first, second = asyncio.run(send_twice())
+    assert second.result_code == ResultCode.SUCCESS
+    assert second.response is first.response
+    assert headers == [None, '"v1"']
+
+
+def endpoint_detail(guid, name="host", ip="10.1.2.3", mac="00-0C-29-AA-BB-CC"):
+    return {
+        "agentGuid": guid,
+        "endpointName": name,
+        "interfaces": [{"ipAddresses": [ip], "macAddress": mac}],
+    }
+
+
+def test_endpoint_cache_indexes():
+    cache = EndpointCache()
+    cache.put(EndpointDetail.model_validate(endpoint_detail("1")))
+    cache.put(
+        EndpointSecurityEndpoint(
+            agent_guid="2", endpoint_name="HOST", ip_addresses=["10.1.2.4"]
+        )
+    )
+    assert cache.find_by_name("Host") == ["1", "2"]
+    assert cache.find_by_ip("10.1.2.3") == ["1"]
+    assert cache.find_by_mac("00:0c:29:aa:bb:cc") == ["1"]
+    assert cache.get_detail("2") is None
+    assert cache.get_endpoint("2").ip_addresses == ["10.1.2.4"]
+    cache.put(
+        EndpointDetail.model_validate(endpoint_detail("1", ip="10.1.2.5"))
+    )
+    assert cache.find_by_ip("10.1.2.3") == []
+    assert cache.find_by_ip("10.1.2.5") == ["1"]
+    cache.invalidate("2")
+    assert cache.find_by_name("host") == ["1"]
+
+
+def test_endpoint_cache_evicts_and_expires(mocker):
+    clock = mocker.patch("pytmv1.cache.time.monotonic", return_value=100.0)
+    cache = EndpointCache(maxsize=2, ttl=10)
+    for guid in ("1", "2", "3"):
+        cache.put(EndpointSecurityEndpoint(agent_guid=guid, last_used_ip=guid))
+    assert len(cache) == 2
+    assert cache.find_by_ip("1") == []
+    clock.return_value = 110.0
+    assert cache.find_by_ip("3") == []
+    assert len(cache) == 1
+    cache.put(EndpointSecurityEndpoint(endpoint_name="no guid"))
+    assert len(cache) == 1
+
+
+def test_endpoint_cache_expires_detail_after_inventory_refresh(mocker):
+    clock = mocker.patch("pytmv1.cache.time.monotonic", return_value=100.0)
+    cache = EndpointCache(ttl=10)
+    cache.put(EndpointDetail.model_validate(endpoint_detail("1")))
+    clock.return_value = 105.0
+    cache.put(
+        EndpointSecurityEndpoint(agent_guid="1", last_used_ip="10.1.2.4")
+    )
+    clock.return_value = 110.0
+    assert cache.get_detail("1") is None
+    assert cache.get_endpoint("1").last_used_ip == "10.1.2.4"
+    assert cache.find_by_mac("00-0C-29-AA-BB-CC") == []
+    assert cache.find_by_ip("10.1.2.4") == ["1"]
+    clock.return_value = 115.0
+    assert cache.get_endpoint("1") is None
+    assert len(cache) == 0
+
+
+def test_get_endpoint_reads_through_cache(mocker):
+    cache = EndpointCache()
+    client = Client(
+        Core(
+            "appname",
+            "dummyToken",
+            "https://dummy.com",
+            1,
+            1,
+            30,
+            30,
+            endpoint_cache=cache,
+        )
+    )
+    mock_send = mocker.patch.object(
+        client._core._adapter,
+        "send",
+        return_value=json_response(endpoint_detail("1")),
+    )
+    for _ in range(2):
+        result = client.endpoint.get_endpoint("1")
+        assert result.result_code == ResultCode.SUCCESS
+        assert result.response.data.endpoint_name == "host"
+    assert mock_send.call_count == 1
+    assert cache.find_by_mac("00-0C-29-AA-BB-CC") == ["1"]
+
+
+def test_consume_endpoints_warms_cache(mocker):
+    cache = EndpointCache()
+    client = Client(
+        Core(
+            "appname",
+            "dummyToken",
+            "https://dummy.com",
+            1,
+            1,
+            30,
+            30,
+            endpoint_cache=cache,
+        )
+    )
+    mocker.patch.object(
+        client._core._adapter,
+        "send",
+        return_value=json_response(
+            page(
+                {"agentGuid": "1", "lastUsedIp": "10.1.2.3"},
+                {"agentGuid": "2", "ipAddresses": ["10.1.2.4"]},
+            ),
+        ),
+    )
+    put = mocker.spy(cache, "put")
+    result = client.endpoint.consume_endpoints(lambda endpoint: None)
+    assert result.result_code == ResultCode.SUCCESS
+    assert put.call_count == 2
+    assert cache.find_by_ip("10.1.2.3") == ["1"]
+    assert cache.find_by_ip("10.1.2.4") == ["2"]
+
+
+def test_async_get_endpoint_reads_through_cache():
+    cache = EndpointCache()
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, json=endpoint_detail("1"))
+
+    core = AsyncCore(
+        "appname",
+        "dummyToken",
+        "https://dummy.com",
+        1,
+        30,
+        30,
+        endpoint_cache=cache,
+    )
+    core._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    client = AsyncClient(core)
+
+    async def get_twice():
+        return [await client.endpoint.get_endpoint("1") for _ in range(2)]
+
+    results = asyncio.run(get_twice())
+    assert [result.result_code for result in results] == [
+        ResultCode.SUCCESS,
+        ResultCode.SUCCESS,
+    ]
+    assert len(requests) == 1
+    assert cache.find_by_name("host") == ["1"]
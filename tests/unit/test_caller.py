@@ -7,3 +7,54 @@ def test_client():
     assert client._core._appname == "dummy_name"
     assert client._core._token == "dummy_token"
     assert client._core._url == "https://dummy.com/" + API_VERSION
+
+
+def test_init_keeps_clients_by_tenant():
+    client = pytmv1.init("dummy_name", "dummy_token", "https://dummy.com")
+    other = pytmv1.init("dummy_name", "other_token", "https://dummy.com")
+    assert other is not client
+    assert pytmv1.init("dummy_name", "dummy_token", "https://dummy.com") is (
+        client
+    )
+    assert other._core._adapter is client._core._adapter
+
+
+def test_registry_shares_pool_by_region():
+    registry = pytmv1.ClientRegistry(maxsize=2)
+    client = registry.get("app", "token1", "https://region1.com")
+    other = registry.get("app", "token2", "https://region1.com")
+    region2 = registry.get("app", "token1", "https://region2.com")
+    http2 = registry.get("app", "token1", "https://region1.com", http2=True)
+    assert len(registry) == 2
+    assert other._core._adapter is client._core._adapter
+    assert region2._core._adapter is not client._core._adapter
+    assert http2._core._adapter is not client._core._adapter
+    assert registry.get("app", "token1", "https://region2.com") is region2
+
+
+def test_registry_closes_evicted_pools(mocker):
+    registry = pytmv1.ClientRegistry(maxsize=2)
+    client = registry.get("app", "token1", "https://region1.com")
+    close = mocker.spy(client._core._adapter, "close")
+    registry.get("app", "token2", "https://region1.com")
+    registry.get("app", "token3", "https://region2.com")
+    assert close.call_count == 0
+    registry.get("app", "token4", "https://region2.com")
+    assert close.call_count == 1
+    registry.close()
+    assert len(registry) == 0
+
+
+def test_registry_evicts_idle_clients(mocker):
+    clock = mocker.patch.object(pytmv1.client.time, "monotonic")
+    clock.return_value = 100.0
+    registry = pytmv1.ClientRegistry(idle_timeout=60)
+    client = registry.get("app", "token1", "https://region1.com")
+    close = mocker.spy(client._core._adapter, "close")
+    clock.return_value = 130.0
+    registry.get("app", "token2", "https://region2.com")
+    clock.return_value = 170.0
+    assert registry.get("app", "token2", "https://region2.com")
+    assert len(registry) == 1
+    assert close.call_count == 1
+    assert registry.get("app", "token1", "https://region1.com") is not client
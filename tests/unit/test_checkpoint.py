@@ -0,0 +1,204 @@
+import asyncio
+from urllib.parse import parse_qs, urlsplit
+
+import httpx
+import pytest
+
+from pytmv1 import (
+    AsyncClient,
+    Checkpoint,
+    Client,
+    FileCheckpointStore,
+    ListOatsResp,
+    ResultCode,
+    SQLiteCheckpointStore,
+)
+from pytmv1.async_core import AsyncCore
+from pytmv1.model.enum import Api
+from tests.data import json_response, oat_item, page
+
+NEXT_LINK = "https://dummy.com/v3.0/oat/detections?skipToken=abc"
+TIME_RANGE = ("detectedStartDateTime", "detectedEndDateTime")
+
+
+def oat_page(uuids, next_link=None):
+    return page(*map(oat_item, uuids), next_link=next_link)
+
+
+def query(url):
+    return parse_qs(urlsplit(url).query)
+
+
+def failing_consumer(consumed, fail_on):
+    def consumer(item):
+        if item.uuid == fail_on:
+            raise RuntimeError("consumer failure")
+        consumed.append(item.uuid)
+
+    return consumer
+
+
+def test_file_store(tmp_path):
+    store = FileCheckpointStore(str(tmp_path / "oat.checkpoint"))
+    assert store.load() is None
+    store.save(Checkpoint(NEXT_LINK, 3, "2024-01-01T00:00:00Z"))
+    assert store.load() == Checkpoint(NEXT_LINK, 3, "2024-01-01T00:00:00Z")
+    assert [path.name for path in tmp_path.iterdir()] == ["oat.checkpoint"]
+
+
+def test_sqlite_store(tmp_path):
+    path = str(tmp_path / "checkpoints.db")
+    oat = SQLiteCheckpointStore(path, "oat")
+    alert = SQLiteCheckpointStore(path, "alert")
+    assert oat.load() is None
+    oat.save(Checkpoint(NEXT_LINK, 1, "2024-01-01T00:00:00Z"))
+    oat.save(Checkpoint(None, 0, "2024-01-02T00:00:00Z"))
+    alert.save(Checkpoint(None, 0, "2024-01-03T00:00:00Z"))
+    assert SQLiteCheckpointStore(path, "oat").load() == Checkpoint(
+        None, 0, "2024-01-02T00:00:00Z"
+    )
+    assert alert.load().watermark == "2024-01-03T00:00:00Z"
+
+
+def test_send_linkable_resumes_from_checkpoint(mocker, core, tmp_path):
+    store = FileCheckpointStore(str(tmp_path / "oat.checkpoint"))
+    consumed = []
+    mock_send = mocker.patch.object(
+        core._adapter,
+        "send",
+        side_effect=[
+            json_response(oat_page(["1", "2"], NEXT_LINK)),
+            json_response(oat_page(["3", "4", "5"])),
+        ],
+    )
+    result = core.send_linkable(
+        ListOatsResp,
+        Api.GET_OAT_LIST,
+        failing_consumer(consumed, "4"),
+        checkpoint=store,
+        time_range=TIME_RANGE,
+        params={"detectedStartDateTime": "2024-01-01T00:00:00Z"},
+    )
+    assert result.result_code == ResultCode.ERROR
+    assert consumed == ["1", "2", "3"]
+    end_time = query(mock_send.call_args_list[0].args[0].url)[
+        "detectedEndDateTime"
+    ][0]
+    assert store.load() == Checkpoint(NEXT_LINK, 1, end_time)
+
+    mock_send = mocker.patch.object(
+        core._adapter,
+        "send",
+        return_value=json_response(oat_page(["3", "4", "5"])),
+    )
+    result = core.send_linkable(
+        ListOatsResp,
+        Api.GET_OAT_LIST,
+        failing_consumer(consumed, None),
+        checkpoint=store,
+        time_range=TIME_RANGE,
+    )
+    assert result.result_code == ResultCode.SUCCESS
+    assert result.response.total_consumed == 2
+    assert consumed == ["1", "2", "3", "4", "5"]
+    assert mock_send.call_args.args[0].url.endswith(
+        "/v3.0/oat/detections?skipToken=abc"
+    )
+    assert store.load() == Checkpoint(None, 0, end_time)
+
+
+def test_send_linkable_starts_from_watermark(mocker, core, tmp_path):
+    store = FileCheckpointStore(str(tmp_path / "oat.checkpoint"))
+    store.save(Checkpoint(None, 0, "2024-01-01T00:00:00Z"))
+    mock_send = mocker.patch.object(
+        core._adapter,
+        "send",
+        return_value=json_response(oat_page(["1"])),
+    )
+    items = []
+    result = core.send_linkable(
+        ListOatsResp,
+        Api.GET_OAT_LIST,
+        items.append,
+        checkpoint=store,
+        time_range=TIME_RANGE,
+        params={"detectedEndDateTime": "2024-01-02T00:00:00Z", "top": 50},
+    )
+    assert result.result_code == ResultCode.SUCCESS
+    assert [item.uuid for item in items] == ["1"]
+    assert query(mock_send.call_args.args[0].url) == {
+        "detectedStartDateTime": ["2024-01-01T00:00:00Z"],
+        "detectedEndDateTime": ["2024-01-02T00:00:00Z"],
+        "top": ["50"],
+    }
+    assert store.load() == Checkpoint(None, 0, "2024-01-02T00:00:00Z")
+
+
+def test_async_send_linkable_resumes_from_checkpoint(tmp_path):
+    store = FileCheckpointStore(str(tmp_path / "oat.checkpoint"))
+    store.save(Checkpoint(NEXT_LINK, 2, "2024-01-02T00:00:00Z"))
+    urls = []
+    consumed = []
+
+    def handler(request):
+        urls.append(str(request.url))
+        return httpx.Response(200, json=oat_page(["3", "4", "5"]))
+
+    async def consumer(item):
+        consumed.append(item.uuid)
+
+    core = AsyncCore("appname", "dummyToken", "https://dummy.com", 1, 30, 30)
+    core._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    result = asyncio.run(
+        core.send_linkable(
+            ListOatsResp,
+            Api.GET_OAT_LIST,
+            consumer,
+            checkpoint=store,
+            time_range=TIME_RANGE,
+        )
+    )
+    assert result.result_code == ResultCode.SUCCESS
+    assert consumed == ["5"]
+    assert urls == [NEXT_LINK]
+    assert store.load() == Checkpoint(None, 0, "2024-01-02T00:00:00Z")
+
+
+@pytest.mark.parametrize("options", [{"windows": 2}, {"stream": True}])
+def test_checkpoint_with_windows_or_stream_is_rejected(
+    mocker, core, tmp_path, options
+):
+    store = FileCheckpointStore(str(tmp_path / "checkpoint"))
+    mock_send = mocker.patch.object(core._adapter, "send")
+    client = Client(core)
+    with pytest.raises(ValueError):
+        client.endpoint.consume_activity(print, checkpoint=store, **options)
+    with pytest.raises(ValueError):
+        client.email.consume_activity(print, checkpoint=store, **options)
+    with pytest.raises(ValueError):
+        core.send_linkable(
+            ListOatsResp,
+            Api.GET_OAT_LIST,
+            print,
+            stream=True,
+            checkpoint=store,
+        )
+    mock_send.assert_not_called()
+    assert store.load() is None
+
+
+def test_async_checkpoint_with_stream_is_rejected(tmp_path):
+    store = FileCheckpointStore(str(tmp_path / "checkpoint"))
+    client = AsyncClient(
+        AsyncCore("appname", "dummyToken", "https://dummy.com", 1, 30, 30)
+    )
+    with pytest.raises(ValueError):
+        asyncio.run(
+            client.endpoint.consume_activity(
+                print, windows=2, checkpoint=store
+            )
+        )
+    with pytest.raises(ValueError):
+        asyncio.run(
+            client.email.consume_activity(print, stream=True, checkpoint=store)
+        )
@@ -0,0 +1,22 @@
+import pytest
+from requests.exceptions import JSONDecodeError
+
+from pytmv1 import codec
+
+
+@pytest.mark.parametrize("document", [b'{"id": 1}', '{"id": 1}'])
+def test_loads(document):
+    assert codec.loads(document) == {"id": 1}
+
+
+def test_loads_without_orjson(mocker):
+    mocker.patch.object(codec, "orjson", None)
+    assert codec.loads(b'[{"id": "\\u00e9"}]') == [{"id": "é"}]
+
+
+@pytest.mark.parametrize("orjson", [True, False])
+def test_loads_with_invalid_json_is_failed(mocker, orjson):
+    if not orjson:
+        mocker.patch.object(codec, "orjson", None)
+    with pytest.raises(JSONDecodeError):
+        codec.loads(b'{"id": ')
@@ -0,0 +1,165 @@
+import json
+
+import pytest
+
+from pytmv1 import (
+    ListEndpointActivityResp,
+    ListOatsResp,
+    OatEvent,
+    ResultCode,
+    columnar,
+)
+from pytmv1.model.enum import Api
+from pytmv1.model.projection import project
+from tests.data import json_response, oat_item
+
+FILTERS = [{"id": "F1", "name": "filter"}]
+
+
+def oat_record(uuid, ips=None):
+    if ips is None:
+        return oat_item(uuid, filters=FILTERS)
+    return oat_item(
+        uuid, filters=FILTERS, endpoint={"endpointName": "host", "ips": ips}
+    )
+
+
+def columnar_item_type(select):
+    return (
+        project(ListEndpointActivityResp, select)
+        .model_fields["items"]
+        .annotation.__args__[0]
+    )
+
+
+def test_columns_flattens_nested_models():
+    columns = columnar.columns(OatEvent)
+    assert columns["endpoint.ips"].path == ("endpoint", "ips")
+    assert columns["endpoint.ips"].kind is str
+    assert columns["endpoint.ips"].many
+    assert columns["entity_type"].kind is str
+    assert columns["filters"].kind is None
+    assert "endpoint" not in columns
+
+
+def test_to_columns():
+    item_type = (
+        project(
+            ListEndpointActivityResp,
+            ["eventSubId", "objectIntegrityLevel", "endpointIp"],
+        )
+        .model_fields["items"]
+        .annotation.__args__[0]
+    )
+    batch = columnar.to_columns(
+        item_type,
+        [
+            {
+                "eventSubId": 2,
+                "objectIntegrityLevel": 8200,
+                "endpointIp": ["1.1.1.1"],
+            },
+            {"eventSubId": "3"},
+        ],
+    )
+    assert batch == {
+        "endpoint_ip": [["1.1.1.1"], []],
+        "event_sub_id": ["2", "3"],
+        "object_integrity_level": [8192, None],
+    }
+
+
+def test_to_columns_with_missing_nested_model():
+    batch = columnar.to_columns(
+        OatEvent, [oat_record("1", ["1.1.1.1"]), oat_record("2")]
+    )
+    assert batch["uuid"] == ["1", "2"]
+    assert batch["endpoint.endpoint_name"] == ["host", None]
+    assert batch["endpoint.ips"] == [["1.1.1.1"], []]
+    assert batch["filters"] == [[{"id": "F1", "name": "filter"}]] * 2
+
+
+def test_to_record_batch():
+    pyarrow = pytest.importorskip("pyarrow")
+    records = [oat_record("1", ["1.1.1.1"]), oat_record("2")]
+    record_batch = columnar.to_record_batch(
+        OatEvent, columnar.to_columns(OatEvent, records)
+    )
+    assert record_batch.num_rows == 2
+    assert record_batch.schema.field("endpoint.ips").type == pyarrow.list_(
+        pyarrow.string()
+    )
+    assert record_batch.column("uuid").to_pylist() == ["1", "2"]
+    assert json.loads(record_batch.column("filters")[0].as_py()) == [
+        {"id": "F1", "name": "filter"}
+    ]
+
+
+def test_to_record_batch_without_pyarrow_is_failed(monkeypatch):
+    monkeypatch.setattr(columnar, "pyarrow", None)
+    with pytest.raises(ImportError):
+        columnar.to_record_batch(OatEvent, {})
+
+
+def test_send_batches(mocker, core):
+    mock_send = mocker.patch.object(
+        core._adapter,
+        "send",
+        side_effect=[
+            json_response(
+                {
+                    "nextLink": "https://host/v3.0/path?skipToken=token",
+                    "items": [oat_record("1", ["1.1.1.1"]), oat_record("2")],
+                }
+            ),
+            json_response({"items": []}),
+        ],
+    )
+    batches = []
+    result = core.send_batches(ListOatsResp, Api.GET_OAT_LIST, batches.append)
+    assert result.result_code == ResultCode.SUCCESS
+    assert result.response.total_consumed == 2
+    assert [batch["uuid"] for batch in batches] == [["1", "2"]]
+    assert mock_send.call_count == 2
+    assert mock_send.call_args.args[0].url.endswith("/path?skipToken=token")
+
+
+def test_send_batches_with_error_is_failed(mocker, core):
+    response = json_response(
+        {"error": {"code": "BadRequest", "message": "Invalid"}}
+    )
+    response.status_code = 400
+    mocker.patch.object(core._adapter, "send", return_value=response)
+    result = core.send_batches(ListOatsResp, Api.GET_OAT_LIST, print)
+    assert result.result_code == ResultCode.ERROR
+    assert result.error.status == 400
+
+
+def test_to_columns_coerces_like_models():
+    batch = columnar.to_columns(
+        columnar_item_type(["objectSignerValid", "eventTime"]),
+        [{"objectSignerValid": ["false", "true"], "eventTime": "1704067200"}],
+    )
+    assert batch == {
+        "event_time": [1704067200],
+        "object_signer_valid": [[False, True]],
+    }
+
+
+def test_send_batches_with_malformed_record_is_failed(mocker, core):
+    mocker.patch.object(
+        core._adapter,
+        "send",
+        return_value=json_response(
+            {"progressRate": 100, "items": [{"eventTime": "abc"}]}
+        ),
+    )
+    batches = []
+    result = core.send_batches(
+        project(ListEndpointActivityResp, ["eventTime"]),
+        Api.GET_ENDPOINT_ACTIVITY_DATA,
+        batches.append,
+    )
+    assert result.result_code == ResultCode.ERROR
+    assert result.error.code == "ValidationError"
+    assert batches == []
@@ -1,25 +1,37 @@
+import json
+import sys
 import time
+from datetime import datetime
 
 import pytest
 from pydantic import ValidationError
-from requests import RequestException, Response
+from requests import ConnectionError as RequestsConnectionError
+from requests import RequestException, Response, Timeout
 
 from pytmv1 import (
     AddAlertNoteResp,
+    BaseTaskResp,
     BytesResp,
     CollectFileTaskResp,
+    EndpointActivity,
     EndpointDetail,
     EndpointSecurityEndpoint,
+    EndpointTaskResp,
     Error,
     ExceptionObject,
     GetEndpointDetailsResp,
+    ListEndpointActivityResp,
     ListEndpointSecurityResp,
     ListExceptionsResp,
     ListSandboxSuspiciousResp,
     MsError,
+    MultiApiKeyResp,
     MultiResp,
     NoContentResp,
+    PollStrategy,
+    RateLimiter,
     ResultCode,
+    RetryPolicy,
     SandboxAnalysisResultResp,
     SandboxSubmissionStatusResp,
     Status,
@@ -28,6 +40,7 @@ from pytmv1 import (
 from pytmv1 import core as core_m
 from pytmv1 import (
     result,
+    utils,
 )
 from pytmv1.core import API_VERSION, USERAGENT_SUFFIX, Core
 from pytmv1.exception import (
@@ -39,7 +52,7 @@ from pytmv1.exception import (
 )
 from pytmv1.model.enum import Api
 from pytmv1.model.response import BaseStatusResponse
-from tests.data import TextResponse
+from tests.data import TextResponse, json_response
 
 API_URL = "https://dummy.com/v3.0"
 
@@ -107,6 +120,79 @@ def test_consume_linkable_without_next_link(mocker, core):
     assert total == 0
 
 
+def test_consume_linkable_with_many_pages_is_not_recursive(mocker, core):
+    pages = 2 * sys.getrecursionlimit()
+    mocker.patch.object(
+        core,
+        "_process",
+        side_effect=[
+            ListExceptionsResp(
+                nextLink="https://host/api/path?skipToken=token",
+                items=[ExceptionObject.model_construct()],
+            )
+            for _ in range(pages - 1)
+        ]
+        + [ListExceptionsResp(items=[ExceptionObject.model_construct()])],
+    )
+    total = core._consume_linkable(
+        lambda: core._process(ListExceptionsResp, Api.GET_EXCEPTION_OBJECTS),
+        lambda x: None,
+        {},
+    )
+    assert total == pages
+
+
+def test_consume_linkable_with_prefetch(mocker, core):
+    mocker.patch.object(
+        core,
+        "_process",
+        side_effect=[
+            ListExceptionsResp(
+                nextLink="https://host/v3.0/path?skipToken=" + str(i),
+                items=[ExceptionObject.model_construct(value=str(i))],
+            )
+            for i in range(4)
+        ]
+        + [
+            ListExceptionsResp(
+                items=[ExceptionObject.model_construct(value="4")]
+            )
+        ],
+    )
+    consumed = []
+    total = core._consume_linkable(
+        lambda: core._process(ListExceptionsResp, Api.GET_EXCEPTION_OBJECTS),
+        lambda x: consumed.append(x.value),
+        {},
+        2,
+    )
+    assert total == 5
+    assert consumed == ["0", "1", "2", "3", "4"]
+
+
+def test_consume_linkable_with_prefetch_error_is_raised(mocker, core):
+    mocker.patch.object(
+        core,
+        "_process",
+        side_effect=[
+            ListExceptionsResp(
+                nextLink="https://host/v3.0/path?skipToken=c2tpcFRva2Vu",
+                items=[ExceptionObject.model_construct()],
+            ),
+            RequestException("page error"),
+        ],
+    )
+    with pytest.raises(RequestException):
+        core._consume_linkable(
+            lambda: core._process(
+                ListExceptionsResp, Api.GET_EXCEPTION_OBJECTS
+            ),
+            lambda x: None,
+            {},
+            1,
+        )
+
+
 def test_error():
     error = result._error(
         ServerJsonError(
@@ -178,17 +264,19 @@ def test_parse_data_with_html_is_failed():
 def test_parse_data_with_json():
     raw_response = Response()
     raw_response.headers = {"Content-Type": "application/json"}
-    raw_response.json = lambda: {
-        "items": [
-            {
-                "riskLevel": "high",
-                "analysisCompletionDateTime": "2021-05-07T03:08:40",
-                "expiredDateTime": "2021-06-07T03:08:40Z",
-                "rootSha1": "fb5608fa03de204a12fe1e9e5275e4a682107471",
-                "ip": "6.6.6.6",
-            }
-        ]
-    }
+    raw_response._content = json.dumps(
+        {
+            "items": [
+                {
+                    "riskLevel": "high",
+                    "analysisCompletionDateTime": "2021-05-07T03:08:40",
+                    "expiredDateTime": "2021-06-07T03:08:40Z",
+                    "rootSha1": "fb5608fa03de204a12fe1e9e5275e4a682107471",
+                    "ip": "6.6.6.6",
+                }
+            ]
+        }
+    ).encode()
     response = core_m._parse_data(raw_response, ListSandboxSuspiciousResp)
     assert response.items[0].risk_level == "high"
     assert (
@@ -204,11 +292,29 @@ def test_parse_data_with_json():
     assert response.items[0].value == "6.6.6.6"
 
 
+def test_parse_data_with_lazy_validation():
+    raw_response = Response()
+    raw_response.headers = {"Content-Type": "application/json"}
+    raw_response._content = json.dumps(
+        {
+            "nextLink": "https://host/v3.0/path?skipToken=token",
+            "items": [exception_item("1.1.1.1"), {"type": "ip"}],
+        }
+    ).encode()
+    response = core_m._parse_data(raw_response, ListExceptionsResp, True)
+    assert response.next_link == "https://host/v3.0/path?skipToken=token"
+    assert len(response.items) == 2
+    assert isinstance(response.items[1], ExceptionObject)
+    assert response.items[0].value == "1.1.1.1"
+    with pytest.raises(ValidationError):
+        response.items[1].value
+
+
 def test_parse_data_with_multi_and_wrong_model_is_failed():
     raw_response = Response()
     raw_response.headers = {"Content-Type": "application/json"}
     raw_response.status_code = 207
-    raw_response.json = lambda: {"items": [{"status": 200}]}
+    raw_response._content = json.dumps({"items": [{"status": 200}]}).encode()
     with pytest.raises(ValidationError):
         core_m._parse_data(raw_response, AddAlertNoteResp)
 
@@ -217,7 +323,7 @@ def test_parse_data_with_single_and_wrong_model_is_failed():
     raw_response = Response()
     raw_response.headers = {"Content-Type": "application/json"}
     raw_response.status_code = 200
-    raw_response.json = lambda: {"location": "test"}
+    raw_response._content = json.dumps({"location": "test"}).encode()
     with pytest.raises(ValidationError):
         core_m._parse_data(raw_response, MultiResp)
 
@@ -261,6 +367,43 @@ def test_poll_status_with_succeeded_status():
     assert time.time() - start_time < 20
 
 
+def test_poll_status_with_strategy(mocker):
+    mock_sleep = mocker.patch.object(core_m.time, "sleep")
+    status_call = mocker.Mock(
+        side_effect=[
+            BaseStatusResponse.model_construct(status=Status.RUNNING),
+        ]
+        * 4
+        + [BaseStatusResponse.model_construct(status=Status.SUCCEEDED)]
+    )
+    response = core_m._poll_status(
+        status_call,
+        60,
+        PollStrategy(
+            first_delay=0.5, interval=1, multiplier=2, max_interval=3
+        ),
+    )
+    assert response.status == Status.SUCCEEDED
+    assert status_call.call_count == 5
+    assert [c.args[0] for c in mock_sleep.call_args_list] == [
+        0.5,
+        1,
+        2,
+        3,
+        3,
+    ]
+
+
+def test_poll_status_with_strategy_is_bounded_by_poll_time():
+    start_time = time.time()
+    core_m._poll_status(
+        lambda: BaseStatusResponse.model_construct(status=Status.RUNNING),
+        0.3,
+        PollStrategy(interval=10),
+    )
+    assert time.time() - start_time < 1
+
+
 def test_send(core, mocker):
     raw_response = Response()
     raw_response.status_code = 204
@@ -271,6 +414,111 @@ def test_send(core, mocker):
     assert result.result_code == ResultCode.SUCCESS
 
 
+def test_send_with_throttling_is_retried(mocker):
+    mock_sleep = mocker.patch.object(core_m.time, "sleep")
+    core = Core("appname", "dummyToken", "https://dummy.com", 1, 1, 30, 30)
+    throttled = json_response({"error": {"code": "TooManyRequests"}}, 429)
+    throttled.headers["Retry-After"] = "3"
+    mock_send = mocker.patch.object(
+        core._adapter,
+        "send",
+        side_effect=[throttled, json_response({"items": []})],
+    )
+    result = core.send(ListExceptionsResp, Api.GET_EXCEPTION_OBJECTS)
+    assert result.result_code == ResultCode.SUCCESS
+    assert mock_send.call_count == 2
+    assert 2 < mock_sleep.call_args.args[0] <= 3
+
+
+def test_send_with_throttling_is_failed(mocker):
+    mocker.patch.object(core_m.time, "sleep")
+    core = Core(
+        "appname",
+        "dummyToken",
+        "https://dummy.com",
+        1,
+        1,
+        30,
+        30,
+        rate_limiter=RateLimiter(max_retries=1),
+    )
+    mock_send = mocker.patch.object(
+        core._adapter,
+        "send",
+        side_effect=lambda *args, **kwargs: json_response(
+            {"error": {"code": "TooManyRequests"}}, 429
+        ),
+    )
+    result = core.send(ListExceptionsResp, Api.GET_EXCEPTION_OBJECTS)
+    assert result.result_code == ResultCode.ERROR
+    assert result.error.status == 429
+    assert mock_send.call_count == 2
+
+
+def test_send_with_connection_error_is_retried(mocker):
+    mock_sleep = mocker.patch.object(core_m.time, "sleep")
+    core = Core("appname", "dummyToken", "https://dummy.com", 1, 1, 30, 30)
+    mock_send = mocker.patch.object(
+        core._adapter,
+        "send",
+        side_effect=[
+            RequestsConnectionError("reset"),
+            json_response({"error": {"code": "BadGateway"}}, 502),
+            json_response({"items": []}),
+        ],
+    )
+    result = core.send(ListExceptionsResp, Api.GET_EXCEPTION_OBJECTS)
+    assert result.result_code == ResultCode.SUCCESS
+    assert mock_send.call_count == 3
+    assert [c.args[0] for c in mock_sleep.call_args_list] == [0.5, 1]
+
+
+def test_send_with_connection_error_is_failed(mocker):
+    mocker.patch.object(core_m.time, "sleep")
+    core = Core(
+        "appname",
+        "dummyToken",
+        "https://dummy.com",
+        1,
+        1,
+        30,
+        30,
+        retry_policy=RetryPolicy(retries=2),
+    )
+    mock_send = mocker.patch.object(
+        core._adapter, "send", side_effect=Timeout("timeout")
+    )
+    result = core.send(ListExceptionsResp, Api.GET_EXCEPTION_OBJECTS)
+    assert result.result_code == ResultCode.ERROR
+    assert result.error.code == "Timeout"
+    assert mock_send.call_count == 3
+
+
+@pytest.mark.parametrize("retry_post, calls", [(False, 1), (True, 2)])
+def test_send_multi_with_server_error(mocker, retry_post, calls):
+    mocker.patch.object(core_m.time, "sleep")
+    core = Core(
+        "appname",
+        "dummyToken",
+        "https://dummy.com",
+        1,
+        1,
+        30,
+        30,
+        retry_policy=RetryPolicy(retries=1, retry_post=retry_post),
+    )
+    mock_send = mocker.patch.object(
+        core._adapter,
+        "send",
+        side_effect=lambda *args, **kwargs: json_response(
+            {"error": {"code": "ServiceUnavailable"}}, 503
+        ),
+    )
+    result = core.send_multi(MultiResp, Api.ADD_TO_BLOCK_LIST, json=[])
+    assert result.result_code == ResultCode.ERROR
+    assert mock_send.call_count == calls
+
+
 def test_send_multi_failed(core, mocker):
     mock_send_multi = mocker.patch.object(
         core, "_process", side_effect=RuntimeError()
@@ -282,6 +530,132 @@ def test_send_multi_failed(core, mocker):
     assert result.errors[0].code == "RuntimeError"
 
 
+def test_send_multi_with_chunks(core, mocker):
+    mocker.patch.dict(core_m.MULTI_CHUNK_SIZES, {Api.ADD_TO_BLOCK_LIST: 2})
+    mock_process = mocker.patch.object(
+        core,
+        "_process",
+        side_effect=lambda class_, api, method, json: class_(
+            items=[
+                {
+                    "status": 202,
+                    "headers": [
+                        {"name": "Operation-Location", "value": f"/tasks/{i}"}
+                    ],
+                }
+                for i in json
+            ]
+        ),
+    )
+    result = core.send_multi(
+        MultiResp, Api.ADD_TO_BLOCK_LIST, json=["1", "2", "3", "4", "5"]
+    )
+    assert mock_process.call_count == 3
+    assert result.result_code == ResultCode.SUCCESS
+    assert [item.task_id for item in result.response.items] == [
+        "1",
+        "2",
+        "3",
+        "4",
+        "5",
+    ]
+
+
+def test_send_multi_with_chunks_is_failed(core, mocker):
+    mocker.patch.dict(core_m.MULTI_CHUNK_SIZES, {Api.ADD_TO_BLOCK_LIST: 2})
+
+    def process(class_, api, method, json):
+        if json == ["1", "2"]:
+            return class_(items=[{"status": 202}, {"status": 202}])
+        if json == ["3", "4"]:
+            raise ServerMultiJsonError(
+                [MsError(status=202), MsError(status=400, code="Invalid")]
+            )
+        raise RequestException("timeout")
+
+    mocker.patch.object(core, "_process", side_effect=process)
+    result = core.send_multi(
+        MultiResp, Api.ADD_TO_BLOCK_LIST, json=["1", "2", "3", "4", "5"]
+    )
+    assert result.result_code == ResultCode.ERROR
+    assert [item.status for item in result.response.items] == [
+        202,
+        202,
+        202,
+        400,
+        500,
+    ]
+    assert [error.status for error in result.errors] == [202, 400, 500]
+    assert result.errors[2].code == "RequestException"
+
+
+def test_send_multi_with_middle_chunk_is_failed(core, mocker):
+    mocker.patch.dict(core_m.MULTI_CHUNK_SIZES, {Api.ADD_TO_BLOCK_LIST: 2})
+
+    def process(class_, api, method, json):
+        if json == ["3", "4"]:
+            raise RequestException("timeout")
+        return class_(
+            items=[
+                {
+                    "status": 202,
+                    "headers": [
+                        {"name": "Operation-Location", "value": f"/tasks/{i}"}
+                    ],
+                }
+                for i in json
+            ]
+        )
+
+    mocker.patch.object(core, "_process", side_effect=process)
+    result = core.send_multi(
+        MultiResp, Api.ADD_TO_BLOCK_LIST, json=["1", "2", "3", "4", "5"]
+    )
+    assert result.result_code == ResultCode.ERROR
+    assert [(item.status, item.task_id) for item in result.response.items] == [
+        (202, "1"),
+        (202, "2"),
+        (500, None),
+        (500, None),
+        (202, "5"),
+    ]
+    assert [error.code for error in result.errors] == [
+        "RequestException",
+        "RequestException",
+    ]
+
+
+def test_send_multi_with_chunks_is_failed_keeps_items(core, mocker):
+    mocker.patch.dict(core_m.MULTI_CHUNK_SIZES, {Api.CREATE_API_KEYS: 1})
+
+    def process(class_, api, method, json):
+        if json[0]["name"] == "1":
+            return class_(
+                items=[
+                    {
+                        "status": 201,
+                        "body": {
+                            "id": "id-1",
+                            "value": "secret",
+                            "expiredDateTime": "2025-01-01T00:00:00Z",
+                        },
+                    }
+                ]
+            )
+        raise ServerMultiJsonError([MsError(status=400, code="Invalid")])
+
+    mocker.patch.object(core, "_process", side_effect=process)
+    result = core.send_multi(
+        MultiApiKeyResp,
+        Api.CREATE_API_KEYS,
+        json=[{"name": "1"}, {"name": "2"}],
+    )
+    assert result.result_code == ResultCode.ERROR
+    assert result.response.items[0].id == "id-1"
+    assert result.response.items[0].value == "secret"
+    assert [error.code for error in result.errors] == ["Invalid"]
+
+
 def test_send_linkable(mocker, core):
     mock_process = mocker.patch.object(core, "_process")
     mock_process.return_value = ListExceptionsResp(
@@ -297,6 +671,191 @@ def test_send_linkable(mocker, core):
     assert result.response.total_consumed == 1
 
 
+def test_send_linkable_with_stream(mocker, core):
+    mock_send = mocker.patch.object(
+        core._adapter,
+        "send",
+        side_effect=[
+            json_response(
+                {
+                    "nextLink": "https://host/v3.0/path?skipToken=token",
+                    "items": [exception_item("1.1.1.1")] * 2,
+                }
+            ),
+            json_response({"items": [exception_item("2.2.2.2")]}),
+        ],
+    )
+    consumed = []
+    result = core.send_linkable(
+        ListExceptionsResp,
+        Api.GET_EXCEPTION_OBJECTS,
+        consumed.append,
+        stream=True,
+    )
+    assert result.result_code == ResultCode.SUCCESS
+    assert result.response.total_consumed == 3
+    assert [item.value for item in consumed] == [
+        "1.1.1.1",
+        "1.1.1.1",
+        "2.2.2.2",
+    ]
+    assert mock_send.call_args.kwargs["stream"]
+    assert mock_send.call_args.args[0].url.endswith("/path?skipToken=token")
+
+
+def test_send_linkable_with_stream_error_is_failed(mocker, core):
+    mocker.patch.object(
+        core._adapter,
+        "send",
+        return_value=json_response(
+            {"error": {"code": "BadRequest", "message": "Invalid"}}, 400
+        ),
+    )
+    result = core.send_linkable(
+        ListExceptionsResp,
+        Api.GET_EXCEPTION_OBJECTS,
+        lambda x: None,
+        stream=True,
+    )
+    assert result.result_code == ResultCode.ERROR
+    assert result.error.status == 400
+    assert result.error.code == "BadRequest"
+
+
+def test_send_linkable_parallel(mocker, core):
+    mock_process = mocker.patch.object(
+        core,
+        "_process",
+        side_effect=lambda class_, api, **kwargs: ListExceptionsResp(
+            items=[
+                ExceptionObject.model_construct(
+                    value=kwargs["params"]["startDateTime"]
+                )
+            ]
+        ),
+    )
+    consumed = []
+    result = core.send_linkable_parallel(
+        ListExceptionsResp,
+        Api.GET_EXCEPTION_OBJECTS,
+        lambda x: consumed.append(x.value),
+        [{"startDateTime": "1"}, {"startDateTime": "2"}],
+        headers={"TMV1-Query": "dpt:443"},
+    )
+    assert result.result_code == ResultCode.SUCCESS
+    assert result.response.total_consumed == 2
+    assert sorted(consumed) == ["1", "2"]
+    assert mock_process.call_args.kwargs["headers"] == {
+        "TMV1-Query": "dpt:443"
+    }
+
+
+def test_send_linkable_parallel_with_boundary_records(mocker, core):
+    windows = utils.split_time_range(
+        "2024-01-01T00:00:00Z", "2024-01-01T00:02:00Z", 2
+    )
+    boundary = utils.window_boundaries(windows)[0]
+    records = [
+        EndpointActivity(endpointGuid="1", eventTime=boundary - 500, uuid="1"),
+        EndpointActivity(endpointGuid="2", eventTime=boundary, uuid="2"),
+        EndpointActivity(endpointGuid="3", eventTime=boundary + 500, uuid="3"),
+    ]
+
+    def search(class_, api, params, **kwargs):
+        # Both bounds included
+        start, end = (
+            datetime.fromisoformat(
+                params[key].replace("Z", "+00:00")
+            ).timestamp()
+            * 1000
+            for key in ("startDateTime", "endDateTime")
+        )
+        return ListEndpointActivityResp.model_construct(
+            items=[r for r in records if start <= r.event_time <= end]
+        )
+
+    mocker.patch.object(core, "_process", side_effect=search)
+    consumed = []
+    result = core.send_linkable_parallel(
+        ListEndpointActivityResp,
+        Api.GET_ENDPOINT_ACTIVITY_DATA,
+        lambda x: consumed.append(x.uuid),
+        [
+            {"startDateTime": start, "endDateTime": end}
+            for start, end in windows
+        ],
+        boundaries=utils.window_boundaries(windows),
+    )
+    assert result.result_code == ResultCode.SUCCESS
+    assert result.response.total_consumed == 3
+    assert sorted(consumed) == ["1", "2", "3"]
+
+
+def test_send_linkable_parallel_with_records_without_time(mocker, core):
+    windows = utils.split_time_range(
+        "2024-01-01T00:00:00Z", "2024-01-01T00:02:00Z", 2
+    )
+    mocker.patch.object(
+        core,
+        "_process",
+        side_effect=lambda *args, **kwargs: (
+            ListEndpointActivityResp.model_construct(
+                items=[
+                    EndpointActivity(endpointGuid="1"),
+                    EndpointActivity(endpointGuid="1"),
+                ]
+            )
+        ),
+    )
+    consumed = []
+    result = core.send_linkable_parallel(
+        ListEndpointActivityResp,
+        Api.GET_ENDPOINT_ACTIVITY_DATA,
+        consumed.append,
+        [
+            {"startDateTime": start, "endDateTime": end}
+            for start, end in windows
+        ],
+        boundaries=utils.window_boundaries(windows),
+    )
+    assert result.response.total_consumed == 4
+    assert len(consumed) == 4
+
+
+def test_boundary_filter_forgets_consumed_boundaries():
+    boundary_filter = core_m._BoundaryFilter([1000, 2000])
+    record = EndpointActivity(endpointGuid="1", eventTime=1500)
+    assert boundary_filter.is_new(record)
+    assert not boundary_filter.is_new(record)
+    boundary_filter.done(0)
+    boundary_filter.done(1)
+    assert list(boundary_filter._seen) == [2000]
+    assert boundary_filter.is_new(record)
+
+
+def test_iter_linkable(mocker, core):
+    mock_process = mocker.patch.object(
+        core,
+        "_process",
+        side_effect=[
+            ListExceptionsResp(
+                nextLink="https://host/v3.0/path?skipToken=c2tpcFRva2Vu",
+                items=[ExceptionObject.model_construct(value="1")],
+            ),
+            ListExceptionsResp(
+                items=[ExceptionObject.model_construct(value="2")]
+            ),
+        ],
+    )
+    items = core.iter_linkable(ListExceptionsResp, Api.GET_EXCEPTION_OBJECTS)
+    mock_process.assert_not_called()
+    assert next(items).value == "1"
+    assert mock_process.call_count == 1
+    assert [item.value for item in items] == ["2"]
+    assert mock_process.call_count == 2
+    assert mock_process.call_args.args[1] == "/path?skipToken=c2tpcFRva2Vu"
+
+
 def test_send_sandbox_result_with_polling(core, mocker):
     mock_poll = mocker.patch.object(core_m, "_poll_status")
     mock_poll.return_value = SandboxSubmissionStatusResp.model_construct(
@@ -399,6 +958,54 @@ def test_send_task_result_with_poll(core, mocker):
     assert result.result_code == ResultCode.SUCCESS
 
 
+def test_send_task_result_with_poll_strategy(core, mocker):
+    mock_poll = mocker.patch.object(core_m, "_poll_status")
+    strategy = PollStrategy.exponential()
+    core.send_task_result(CollectFileTaskResp, "123", True, 10)
+    assert mock_poll.call_args.args[2] == PollStrategy()
+    core.send_task_result(CollectFileTaskResp, "123", True, 10, strategy)
+    assert mock_poll.call_args.args[2] is strategy
+
+
+def test_iter_task_results(core, mocker):
+    mock_sleep = mocker.patch.object(core_m.time, "sleep")
+    statuses = {"1": [Status.SUCCEEDED], "2": [Status.RUNNING, Status.FAILED]}
+
+    def send_task_result(class_, task_id, poll, poll_time_sec):
+        if task_id == "3":
+            return result.Result.failed(RequestException())
+        return result.Result.success(
+            CollectFileTaskResp.model_construct(
+                id=task_id, status=statuses[task_id].pop(0)
+            )
+        )
+
+    mock_send = mocker.patch.object(
+        core, "send_task_result", side_effect=send_task_result
+    )
+    results = list(
+        core.iter_task_results(CollectFileTaskResp, ["1", "2", "3", "2"], 60)
+    )
+    assert {task_id for task_id, _ in results[:2]} == {"1", "3"}
+    assert results[2][0] == "2"
+    assert results[2][1].response.status == Status.FAILED
+    assert mock_send.call_count == 4
+    assert [c.args[0] for c in mock_sleep.call_args_list] == [0, 2]
+
+
+def test_iter_task_results_with_deadline(core, mocker):
+    mocker.patch.object(
+        core,
+        "send_task_result",
+        return_value=result.Result.success(
+            CollectFileTaskResp.model_construct(status=Status.RUNNING)
+        ),
+    )
+    results = list(core.iter_task_results(CollectFileTaskResp, ["1"], 0))
+    assert len(results) == 1
+    assert results[0][1].response.status == Status.RUNNING
+
+
 def test_send_task_result_with_poll_is_failed(core, mocker):
     mock_poll = mocker.patch.object(
         core_m, "_poll_status", side_effect=RequestException()
@@ -467,9 +1074,9 @@ def test_validate_with_json_error_is_failed():
     raw_response = Response()
     raw_response.headers = {"Content-Type": "application/json"}
     raw_response.status_code = 500
-    raw_response.json = lambda: {
-        "error": {"code": "CODE", "message": "some error", "number": 1}
-    }
+    raw_response._content = json.dumps(
+        {"error": {"code": "CODE", "message": "some error", "number": 1}}
+    ).encode()
     with pytest.raises(ServerJsonError, match="some error"):
         core_m._validate(raw_response)
 
@@ -484,10 +1091,12 @@ def test_validate_with_text_error_is_failed():
 def test_validate_multi_with_multi_data_is_failed():
     raw_response = Response()
     raw_response.status_code = 207
-    raw_response.json = lambda: [
-        {"status": "400", "code": "code", "message": "message"},
-        {"status": "403", "code": "code", "message": "message"},
-    ]
+    raw_response._content = json.dumps(
+        [
+            {"status": "400", "code": "code", "message": "message"},
+            {"status": "403", "code": "code", "message": "message"},
+        ]
+    ).encode()
     with pytest.raises(ServerMultiJsonError, match="400.*403"):
         core_m._validate(raw_response)
 
@@ -495,19 +1104,21 @@ def test_validate_multi_with_multi_data_is_failed():
 def test_validate_multi_with_single_data_is_failed():
     raw_response = Response()
     raw_response.status_code = 207
-    raw_response.json = lambda: [
-        {
-            "status": "400",
-            "headers": [
-                {
-                    "name": "Operation-Location",
-                    "value": "https://dummy-test.com/task/000004",
-                }
-            ],
-            "code": "code",
-            "message": "message",
-        }
-    ]
+    raw_response._content = json.dumps(
+        [
+            {
+                "status": "400",
+                "headers": [
+                    {
+                        "name": "Operation-Location",
+                        "value": "https://dummy-test.com/task/000004",
+                    }
+                ],
+                "code": "code",
+                "message": "message",
+            }
+        ]
+    ).encode()
     with pytest.raises(ServerMultiJsonError, match="400"):
         core_m._validate(raw_response)
 
@@ -516,32 +1127,34 @@ def test_parse_data_with_endpoint_security():
     raw_response = Response()
     raw_response.headers = {"Content-Type": "application/json"}
     raw_response.status_code = 200
-    raw_response.json = lambda: {
-        "items": [
-            {
-                "endpointName": "test-host",
-                "agentGuid": "abc-123",
-                "type": "desktop",
-                "osPlatform": "windows",
-                "osName": "Windows 11",
-                "ipAddresses": ["192.168.1.1"],
-                "isolationStatus": "off",
-                "eppAgent": {
-                    "status": "on",
-                    "protectionManager": "A1-US",
-                    "version": "1.2.3.4",
-                    "componentVersion": "latestVersion",
-                },
-                "edrSensor": {
-                    "connectivity": "connected",
-                    "status": "enabled",
-                    "version": "1.0.0",
-                },
-            }
-        ],
-        "count": 1,
-        "totalCount": 1,
-    }
+    raw_response._content = json.dumps(
+        {
+            "items": [
+                {
+                    "endpointName": "test-host",
+                    "agentGuid": "abc-123",
+                    "type": "desktop",
+                    "osPlatform": "windows",
+                    "osName": "Windows 11",
+                    "ipAddresses": ["192.168.1.1"],
+                    "isolationStatus": "off",
+                    "eppAgent": {
+                        "status": "on",
+                        "protectionManager": "A1-US",
+                        "version": "1.2.3.4",
+                        "componentVersion": "latestVersion",
+                    },
+                    "edrSensor": {
+                        "connectivity": "connected",
+                        "status": "enabled",
+                        "version": "1.0.0",
+                    },
+                }
+            ],
+            "count": 1,
+            "totalCount": 1,
+        }
+    ).encode()
     response = core_m._parse_data(raw_response, ListEndpointSecurityResp)
     assert response.count == 1
     assert response.total_count == 1
@@ -640,85 +1253,87 @@ def test_parse_data_with_endpoint_details():
     raw_response = Response()
     raw_response.headers = {"Content-Type": "application/json"}
     raw_response.status_code = 200
-    raw_response.json = lambda: {
-        "endpointName": "example-hostname",
-        "agentGuid": "94222d63-90da-a1eb-a051-a85d6b61f5fe",
-        "displayName": "example-display-name",
-        "description": "example-description",
-        "type": "desktop",
-        "os": {
-            "name": "Windows 11",
-            "platform": "windows",
-            "architecture": "x86_64",
-            "version": "10.0.22621",
-            "kernelVersion": "10.0.22621",
-        },
-        "lastUsedIp": "192.168.1.100",
-        "serviceGatewayOrProxy": "Direct connection",
-        "isolationStatus": "off",
-        "interfaces": [
-            {
-                "ipAddresses": ["192.168.0.1", "10.1.1.253"],
-                "macAddress": "ff:ff:00:00:00:ff",
-            }
-        ],
-        "eppAgent": {
-            "endpointGroup": "Computers",
-            "protectionManager": "A1-US",
-            "productNames": ["Apex One"],
-            "status": "on",
-            "version": "1.2.3.4",
-            "installedComponentIds": ["1208221992"],
-            "domainHierarchy": "/example/example-sub-domain",
-            "virtualMachineDetails": [
-                {"key": "example key", "value": "example value"}
-            ],
-            "patterns": [
-                {
-                    "id": "512",
-                    "name": "Common Firewall Pattern",
-                    "version": "2.219.00",
-                    "updatedDateTime": "2023-02-06T10:00:00Z",
-                }
-            ],
-            "engines": [
-                {
-                    "id": "1207960102",
-                    "name": "Advanced Threat Scan Engine",
-                    "version": "23.600.10",
-                    "updatedDateTime": "2023-02-06T10:00:00Z",
-                }
-            ],
-            "features": [
-                {
-                    "name": "AntiMalwareScans",
-                    "status": "enabled",
-                    "outdatedPatternIds": ["1208221762"],
-                    "notCompliantSubFeatures": [],
-                }
-            ],
-        },
-        "edrSensor": {
-            "endpointGroup": "Example XES Group Name",
-            "productNames": ["XDR Endpoint Sensor"],
-            "connectivity": "connected",
-            "version": "1.0.0",
-            "status": "enabled",
-            "edrSettings": {
-                "monitoringLevel": "cautious",
-                "deepfakeDetector": {"status": "enabled"},
+    raw_response._content = json.dumps(
+        {
+            "endpointName": "example-hostname",
+            "agentGuid": "94222d63-90da-a1eb-a051-a85d6b61f5fe",
+            "displayName": "example-display-name",
+            "description": "example-description",
+            "type": "desktop",
+            "os": {
+                "name": "Windows 11",
+                "platform": "windows",
+                "architecture": "x86_64",
+                "version": "10.0.22621",
+                "kernelVersion": "10.0.22621",
             },
-            "advancedRiskTelemetryStatus": "enabled",
-            "patterns": [
+            "lastUsedIp": "192.168.1.100",
+            "serviceGatewayOrProxy": "Direct connection",
+            "isolationStatus": "off",
+            "interfaces": [
                 {
-                    "id": "1208222296",
-                    "name": "Smart Telemetry Pattern",
-                    "version": "2.219.00",
-                    "updatedDateTime": "2024-09-01T10:00:00Z",
+                    "ipAddresses": ["192.168.0.1", "10.1.1.253"],
+                    "macAddress": "ff:ff:00:00:00:ff",
                 }
             ],
-        },
-    }
+            "eppAgent": {
+                "endpointGroup": "Computers",
+                "protectionManager": "A1-US",
+                "productNames": ["Apex One"],
+                "status": "on",
+                "version": "1.2.3.4",
+                "installedComponentIds": ["1208221992"],
+                "domainHierarchy": "/example/example-sub-domain",
+                "virtualMachineDetails": [
+                    {"key": "example key", "value": "example value"}
+                ],
+                "patterns": [
+                    {
+                        "id": "512",
+                        "name": "Common Firewall Pattern",
+                        "version": "2.219.00",
+                        "updatedDateTime": "2023-02-06T10:00:00Z",
+                    }
+                ],
+                "engines": [
+                    {
+                        "id": "1207960102",
+                        "name": "Advanced Threat Scan Engine",
+                        "version": "23.600.10",
+                        "updatedDateTime": "2023-02-06T10:00:00Z",
+                    }
+                ],
+                "features": [
+                    {
+                        "name": "AntiMalwareScans",
+                        "status": "enabled",
+                        "outdatedPatternIds": ["1208221762"],
+                        "notCompliantSubFeatures": [],
+                    }
+                ],
+            },
+            "edrSensor": {
+                "endpointGroup": "Example XES Group Name",
+                "productNames": ["XDR Endpoint Sensor"],
+                "connectivity": "connected",
+                "version": "1.0.0",
+                "status": "enabled",
+                "edrSettings": {
+                    "monitoringLevel": "cautious",
+                    "deepfakeDetector": {"status": "enabled"},
+                },
+                "advancedRiskTelemetryStatus": "enabled",
+                "patterns": [
+                    {
+                        "id": "1208222296",
+                        "name": "Smart Telemetry Pattern",
+                        "version": "2.219.00",
+                        "updatedDateTime": "2024-09-01T10:00:00Z",
+                    }
+                ],
+            },
+        }
+    ).encode()
     response = core_m._parse_data(raw_response, GetEndpointDetailsResp)
     detail = response.data
     assert detail.endpoint_name == "example-hostname"
@@ -766,3 +1381,61 @@ def test_send_endpoint_details(core, mocker):
     mock_process.assert_called()
     assert result.result_code == ResultCode.SUCCESS
     assert result.response.data.endpoint_name == "test-host"
+
+
+def exception_item(ip):
+    return {
+        "type": "ip",
+        "ip": ip,
+        "lastModifiedDateTime": "2023-01-12T14:05:37Z",
+    }
+
+
+def test_parse_data_with_task_is_decoded_once(mocker):
+    loads = mocker.spy(core_m.codec, "loads")
+    response = core_m._parse_data(
+        json_response(
+            {
+                "id": "00000001",
+                "status": "succeeded",
+                "action": "isolate",
+                "createdDateTime": "2024-01-01T00:00:00Z",
+                "lastActionDateTime": "2024-01-01T00:00:00Z",
+                "agentGuid": "guid",
+                "endpointName": "host",
+            }
+        ),
+        BaseTaskResp,
+    )
+    assert isinstance(response, EndpointTaskResp)
+    assert response.endpoint_name == "host"
+    assert loads.call_count == 1
+
+
+def test_validate_and_parse_multi_is_decoded_once(mocker):
+    loads = mocker.spy(core_m.codec, "loads")
+    raw_response = json_response(
+        [
+            {
+                "status": 202,
+                "headers": [
+                    {
+                        "name": "Operation-Location",
+                        "value": f"{API_URL}/response/tasks/00000001",
+                    }
+                ],
+            }
+        ],
+        207,
+    )
+    core_m._validate(raw_response)
+    response = core_m._parse_data(raw_response, MultiResp)
+    assert response.items[0].task_id == "00000001"
+    assert loads.call_count == 1
+
+
+def test_parse_data_with_invalid_json_is_failed():
+    raw_response = json_response({})
+    raw_response._content = b'{"items": ['
+    with pytest.raises(RequestException):
+        core_m._parse_data(raw_response, ListExceptionsResp)
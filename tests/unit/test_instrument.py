@@ -0,0 +1,188 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from pytmv1 import (
+    AsyncClient,
+    Client,
+    Instrumentation,
+    ListExceptionsResp,
+    ResultCode,
+    RetryPolicy,
+)
+from pytmv1.async_core import AsyncCore
+from pytmv1.core import Core
+from pytmv1.instrument import api_path
+from pytmv1.model.enum import Api
+from tests.data import exception_page, json_response
+
+
+class Recorder(Instrumentation):
+    def __init__(self):
+        self.calls = []
+
+    def request(self, api, method):
+        self.calls.append(("request", api, method))
+
+    def response(self, api, method, status, elapsed, server_time, size):
+        self.calls.append(("response", api, status, size))
+
+    def retried(self, api, reason):
+        self.calls.append(("retried", api, reason))
+
+    def parsed(self, api, records, elapsed):
+        self.calls.append(("parsed", api, records))
+
+    def consumed(self, api, records, elapsed):
+        self.calls.append(("consumed", api, records))
+
+    def polled(self, status, polls, elapsed):
+        self.calls.append(("polled", status, polls))
+
+    def failed(self, operation, status, code):
+        self.calls.append(("failed", operation, status, code))
+
+
+@pytest.mark.parametrize(
+    "url, expected",
+    [
+        (
+            "https://dummy.com/v3.0/workbench/alerts/WB-1?top=10",
+            "/workbench/alerts/{0}",
+        ),
+        (
+            "https://dummy.com/v3.0/workbench/alerts/WB-1/notes/delete",
+            "/workbench/alerts/{0}/notes/delete",
+        ),
+        (
+            "https://dummy.com/v3.0/workbench/alerts/WB-1/notes/2",
+            "/workbench/alerts/{0}/notes/{1}",
+        ),
+        ("https://dummy.com/v3.0/oat/detections", "/oat/detections"),
+        ("https://dummy.com/other", "/other"),
+    ],
+)
+def test_api_path(url, expected):
+    assert api_path(url) == expected
+
+
+def test_consume_is_instrumented(mocker):
+    recorder = Recorder()
+    client = Client(
+        Core(
+            "appname",
+            "dummyToken",
+            "https://dummy.com",
+            1,
+            1,
+            30,
+            30,
+            retry_policy=RetryPolicy(retries=1, backoff_factor=0),
+            instrumentation=recorder,
+        )
+    )
+    mocker.patch.object(
+        client._core._adapter,
+        "send",
+        side_effect=[
+            json_response({}, 503),
+            json_response(exception_page()),
+        ],
+    )
+    result = client.object.consume_exception(lambda item: None)
+    assert result.result_code == ResultCode.SUCCESS
+    api = Api.GET_EXCEPTION_OBJECTS.value
+    assert recorder.calls == [
+        ("request", api, "GET"),
+        ("response", api, 503, 2),
+        ("retried", api, "503"),
+        ("request", api, "GET"),
+        ("response", api, 200, len(json.dumps(exception_page()))),
+        ("parsed", api, 1),
+        ("consumed", api, 1),
+    ]
+
+
+def test_failed_result_is_instrumented(mocker):
+    recorder = Recorder()
+    core = Core(
+        "appname",
+        "dummyToken",
+        "https://dummy.com",
+        1,
+        1,
+        30,
+        30,
+        instrumentation=recorder,
+    )
+    mocker.patch.object(
+        core._adapter,
+        "send",
+        return_value=json_response(exception_page()),
+    )
+
+    def consumer(item):
+        raise RuntimeError("consumer failure")
+
+    result = core.send_linkable(
+        ListExceptionsResp, Api.GET_EXCEPTION_OBJECTS, consumer
+    )
+    assert result.result_code == ResultCode.ERROR
+    assert recorder.calls[-1] == (
+        "failed",
+        "send_linkable",
+        500,
+        "RuntimeError",
+    )
+
+
+def test_async_poll_is_instrumented():
+    recorder = Recorder()
+
+    def handler(request):
+        return httpx.Response(
+            200,
+            json={
+                "id": "1",
+                "status": "succeeded",
+                "action": "isolate",
+                "createdDateTime": "2024-01-01T00:00:00Z",
+                "lastActionDateTime": "2024-01-01T00:00:00Z",
+                "agentGuid": "guid",
+                "endpointName": "host",
+            },
+        )
+
+    core = AsyncCore(
+        "appname",
+        "dummyToken",
+        "https://dummy.com",
+        1,
+        30,
+        30,
+        instrumentation=recorder,
+    )
+    core._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    result = asyncio.run(
+        AsyncClient(core).task.get_result("1", poll=True, poll_time_sec=0)
+    )
+    assert result.result_code == ResultCode.SUCCESS
+    assert recorder.calls[-1] == ("polled", "succeeded", 1)
+
+
+def test_prometheus_instrumentation():
+    prometheus_client = pytest.importorskip("prometheus_client")
+    from pytmv1 import PrometheusInstrumentation
+
+    registry = prometheus_client.CollectorRegistry()
+    instrumentation = PrometheusInstrumentation(registry)
+    instrumentation.response("/oat/detections", "GET", 200, 0.1, 0.05, 10)
+    instrumentation.retried("/oat/detections", "503")
+    assert (
+        registry.get_sample_value(
+            "pytmv1_response_bytes_total", {"api": "/oat/detections"}
+        )
+        == 10
+    )
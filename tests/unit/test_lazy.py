@@ -0,0 +1,61 @@
+import copy
+import pickle
+
+import pytest
+from pydantic import ValidationError
+
+from pytmv1 import ExceptionObject, ObjectType, SaeAlert
+from pytmv1.model import lazy
+
+EXCEPTION = {
+    "type": "ip",
+    "ip": "1.1.1.1",
+    "lastModifiedDateTime": "2023-01-12T14:05:37Z",
+}
+
+
+def test_construct():
+    record = lazy.construct(ExceptionObject, dict(EXCEPTION))
+    assert isinstance(record, ExceptionObject)
+    assert record.__dict__ == {}
+    assert record.value == "1.1.1.1"
+    assert record.type == ObjectType.IP
+    assert record == ExceptionObject(**EXCEPTION)
+
+
+def test_construct_validates_field_on_access():
+    record = lazy.construct(
+        SaeAlert, {"id": "1", "score": "64", "workbenchLink": "link"}
+    )
+    assert record.score == 64
+    assert record.id == "1"
+    assert record.__dict__ == {"score": 64, "id": "1"}
+    assert record.model_fields_set == {"score", "id"}
+
+
+def test_construct_with_invalid_field_is_failed():
+    record = lazy.construct(SaeAlert, {"id": "1", "score": "high"})
+    assert record.id == "1"
+    with pytest.raises(ValidationError):
+        record.score
+
+
+def test_construct_with_missing_field_is_failed():
+    record = lazy.construct(SaeAlert, {"id": "1"})
+    with pytest.raises(ValidationError):
+        record.score
+
+
+def test_model_dump():
+    record = lazy.construct(ExceptionObject, dict(EXCEPTION))
+    assert record.model_dump() == ExceptionObject(**EXCEPTION).model_dump()
+
+
+def test_copy_and_pickle():
+    record = lazy.construct(ExceptionObject, dict(EXCEPTION))
+    assert copy.copy(record) == record
+    assert copy.deepcopy(record) == record
+    assert pickle.loads(pickle.dumps(record)) == record
+    assert record.model_copy(update={"description": "desc"}).description == (
+        "desc"
+    )
@@ -0,0 +1,103 @@
+import logging
+
+from requests import Request
+
+from pytmv1 import ListExceptionsResp
+from pytmv1 import core as core_m
+from pytmv1 import logs
+from pytmv1.core import Core
+from pytmv1.model.enum import HttpMethod
+from pytmv1.result import result
+from tests.data import json_response
+
+
+def test_cap():
+    assert logs.cap("abc", 3) == "abc"
+    assert logs.cap("abcdef", 3) == "abc...[3 more characters]"
+
+
+def test_lazy_renders_on_emit_only():
+    calls = []
+
+    def render(value):
+        calls.append(value)
+        return value * 3000
+
+    lazy = logs.Lazy(render, "a")
+    assert calls == []
+    assert len(str(lazy)) < 2100
+    assert calls == ["a"]
+
+
+def test_summary():
+    page = ListExceptionsResp(items=[])
+    page.items.extend([None, None])
+    assert logs.summary(page) == "ListExceptionsResp(items=[2 items])"
+    assert logs.summary(1) == "1"
+
+
+def test_hide_binary_caps_body():
+    response = json_response(b"[" + b"1," * 5000 + b"1]", charset="utf-8")
+    text = core_m._hide_binary(response)
+    assert text.startswith("[1,1,")
+    assert text.endswith("...[7955 more bytes]")
+
+
+def test_log_request_redacts_token(caplog):
+    request = Request(
+        "GET",
+        "https://dummy.com",
+        headers={"Authorization": "Bearer secret"},
+    ).prepare()
+    with caplog.at_level(logging.INFO, "pytmv1.core"):
+        core_m._log_request(request)
+    assert "secret" not in caplog.text
+    assert "*****" in caplog.text
+
+
+def test_log_response_is_skipped_when_disabled(mocker, caplog):
+    hide_binary = mocker.patch.object(core_m, "_hide_binary")
+    with caplog.at_level(logging.WARNING, "pytmv1.core"):
+        core_m._log_response(json_response(b"{}"))
+    assert caplog.text == ""
+    hide_binary.assert_not_called()
+
+
+def test_process_caps_logged_options(mocker, caplog):
+    core = Core("appname", "dummyToken", "https://dummy.com", 1, 1, 30, 30)
+    mocker.patch.object(
+        core._adapter, "send", return_value=json_response({"items": []})
+    )
+    with caplog.at_level(logging.DEBUG, "pytmv1.core"):
+        core._process(
+            ListExceptionsResp,
+            "/response/suspiciousObjects",
+            HttpMethod.POST,
+            json=[{"url": "x" * 10000}],
+            headers={"Authorization": "Bearer secret"},
+        )
+    message = next(
+        record.getMessage()
+        for record in caplog.records
+        if record.getMessage().startswith("Processing request")
+    )
+    assert "secret" not in message
+    assert message.endswith("more characters]]")
+    assert len(message) < 2300
+
+
+def test_result_caps_and_redacts_arguments(caplog):
+    @result
+    def execute(*args, **kwargs):
+        return ListExceptionsResp(items=[])
+
+    with caplog.at_level(logging.DEBUG, "pytmv1.result"):
+        execute("x" * 10000, headers={"Authorization": "Bearer secret"})
+    message = next(
+        record.getMessage()
+        for record in caplog.records
+        if record.getMessage().startswith("Execution started")
+    )
+    assert "secret" not in message
+    assert "more characters]" in message
+    assert len(message) < 4300
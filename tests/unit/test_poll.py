@@ -0,0 +1,28 @@
+from itertools import islice
+
+import pytest
+
+from pytmv1 import PollStrategy
+
+
+def test_delays():
+    assert list(islice(PollStrategy().delays(), 3)) == [2, 2, 2]
+
+
+def test_delays_with_backoff():
+    strategy = PollStrategy(interval=1, multiplier=2, max_interval=5)
+    assert list(islice(strategy.delays(), 5)) == [1, 2, 4, 5, 5]
+
+
+@pytest.mark.parametrize("jitter", [0.1, 0.5, 1])
+def test_delays_with_jitter(jitter):
+    strategy = PollStrategy(first_delay=4, interval=4, jitter=jitter)
+    for delay in islice(strategy.delays(), 50):
+        assert 4 * (1 - jitter) <= delay <= 4 * (1 + jitter)
+    assert 4 * (1 - jitter) <= strategy.first() <= 4 * (1 + jitter)
+
+
+def test_exponential():
+    strategy = PollStrategy.exponential(jitter=0)
+    assert strategy.first() == 1
+    assert list(islice(strategy.delays(), 7)) == [1, 2, 4, 8, 16, 30, 30]
@@ -0,0 +1,64 @@
+from pytmv1 import (
+    EndpointActivity,
+    IntegrityLevel,
+    ListEmailActivityResp,
+    ListEndpointActivityResp,
+)
+from pytmv1.model.common import BaseConsumable
+from pytmv1.model.projection import project
+
+
+def test_project():
+    select = ["endpointHostName", "objectFileHashSha1"]
+    class_ = project(ListEndpointActivityResp, select)
+    assert issubclass(class_, ListEndpointActivityResp)
+    item_class = class_.model_fields["items"].annotation.__args__[0]
+    assert issubclass(item_class, BaseConsumable)
+    assert not issubclass(item_class, EndpointActivity)
+    assert item_class.__name__ == "EndpointActivityProjection"
+    assert set(item_class.model_fields) == {
+        "endpoint_host_name",
+        "object_file_hash_sha1",
+    }
+
+
+def test_project_declares_selected_fields_only():
+    select = ["endpointHostName", "endpoint_guid"]
+    response = project(ListEndpointActivityResp, select)(
+        progressRate=100,
+        items=[
+            {"endpointHostName": "host", "endpointGuid": "guid", "uuid": "1"}
+        ],
+    )
+    item = response.items[0]
+    assert len(type(item).model_fields) == len(select)
+    assert item.endpoint_host_name == "host"
+    assert item.endpoint_guid == "guid"
+    assert not hasattr(item, "uuid")
+
+
+def test_project_is_cached():
+    assert project(
+        ListEmailActivityResp, ["mailMsgSubject", "msgUuid"]
+    ) is project(ListEmailActivityResp, ["msgUuid", "mailMsgSubject"])
+
+
+def test_project_keeps_field_validators():
+    response = project(
+        ListEndpointActivityResp,
+        ["eventSubId", "objectIntegrityLevel"],
+    )(
+        progressRate=100,
+        items=[{"eventSubId": 2, "objectIntegrityLevel": 8192}],
+    )
+    assert response.items[0].event_sub_id == "2"
+    assert response.items[0].object_integrity_level == IntegrityLevel.MEDIUM
+    assert response.items[0].model_dump() == {
+        "event_sub_id": "2",
+        "object_integrity_level": IntegrityLevel.MEDIUM,
+    }
+
+
+def test_project_without_select():
+    assert project(ListEndpointActivityResp, None) is ListEndpointActivityResp
+    assert project(ListEndpointActivityResp, []) is ListEndpointActivityResp
@@ -0,0 +1,79 @@
+import json
+
+import pytest
+from requests.exceptions import JSONDecodeError
+
+from pytmv1.stream import ItemStreamParser
+
+PAGE = {
+    "progressRate": 100,
+    "items": [
+        {"id": i, "name": "é" * i, "tags": [1.5, None]} for i in range(5)
+    ],
+    "nextLink": "https://host/v3.0/path?skipToken=token",
+}
+
+
+@pytest.mark.parametrize("size", [1, 3, 16, 4096])
+def test_feed(size):
+    raw = json.dumps(PAGE).encode()
+    parser = ItemStreamParser()
+    items = []
+    for start in range(0, len(raw), size):
+        end = start + size
+        items += parser.feed(raw[start:end])
+    items += parser.close()
+    assert items == PAGE["items"]
+    assert parser.envelope == {
+        "progressRate": 100,
+        "nextLink": "https://host/v3.0/path?skipToken=token",
+    }
+
+
+def test_feed_returns_items_before_end():
+    parser = ItemStreamParser()
+    assert parser.feed(b'{"items": [{"id": 1}, {"id": 2}, {"i') == [
+        {"id": 1},
+        {"id": 2},
+    ]
+    assert parser.feed(b'd": 3}], "count": 3}') == [{"id": 3}]
+    assert parser.close() == []
+    assert parser.envelope == {"count": 3}
+
+
+def test_feed_with_null_items():
+    parser = ItemStreamParser()
+    assert parser.feed(b'{"items": null, "nextLink": null}') == []
+    assert parser.close() == []
+    assert parser.envelope == {"items": None, "nextLink": None}
+
+
+def test_close_with_truncated_body_is_failed():
+    parser = ItemStreamParser()
+    parser.feed(b'{"items": [{"id": 1}, {"id"')
+    with pytest.raises(JSONDecodeError):
+        parser.close()
+
+
+def test_feed_with_invalid_body_is_failed():
+    with pytest.raises(JSONDecodeError):
+        ItemStreamParser().feed(b'["items"]')
+
+
+def test_feed_with_split_item_is_decoded_once(mocker):
+    item = {
+        "cmd": 'a "quoted" \\ path\\' * 200,
+        "nested": [{"id": i, "value": [i, "]}"]} for i in range(200)],
+        "count": 12345,
+    }
+    raw = json.dumps({"items": [item, 1.5], "count": 2}).encode()
+    parser = ItemStreamParser()
+    parser._decoder = mocker.Mock(wraps=parser._decoder)
+    items = []
+    for start in range(0, len(raw), 7):
+        end = start + 7
+        items += parser.feed(raw[start:end])
+    items += parser.close()
+    assert items == [item, 1.5]
+    assert parser.envelope == {"count": 2}
+    assert parser._decoder.raw_decode.call_count < 20
@@ -0,0 +1,185 @@
+import asyncio
+from urllib.parse import parse_qs, urlsplit
+
+import httpx
+
+from pytmv1 import (
+    AsyncClient,
+    Checkpoint,
+    Client,
+    Deduplicator,
+    FileCheckpointStore,
+    IncrementalSync,
+    ResultCode,
+)
+from pytmv1.async_core import AsyncCore
+from pytmv1.core import Core
+from tests.data import json_response, oat_item, page
+
+
+def ingested(uuid, date_time):
+    return {**oat_item(uuid), "ingestedDateTime": date_time}
+
+
+def test_deduplicator_evicts_least_recently_seen():
+    dedupe = Deduplicator(2)
+    dedupe.add("1")
+    dedupe.add("2")
+    assert dedupe.seen("1")
+    dedupe.add("3")
+    assert len(dedupe) == 2
+    assert dedupe.seen("1")
+    assert not dedupe.seen("2")
+
+
+def test_deduplicator_with_version():
+    dedupe = Deduplicator()
+    dedupe.add("1", "2024-01-01T00:00:00Z")
+    assert dedupe.seen("1", "2024-01-01T00:00:00Z")
+    assert not dedupe.seen("1", "2024-01-02T00:00:00Z")
+
+
+def test_deduplicator_without_key():
+    dedupe = Deduplicator()
+    dedupe.add(None)
+    assert not dedupe.seen(None)
+    assert len(dedupe) == 0
+
+
+def test_track_compares_parsed_times(tmp_path):
+    store = FileCheckpointStore(str(tmp_path / "oat.checkpoint"))
+    state = IncrementalSync(store)
+    tracked = state.track(lambda item: None, lambda item: None, str)
+    tracked("2024-01-01T00:00:00.5Z")
+    tracked("2024-01-01T00:00:00Z")
+    state.commit()
+    assert store.load().watermark == "2024-01-01T00:00:00.5Z"
+    tracked("2024-01-01T01:00:01+01:00")
+    state.commit()
+    assert store.load().watermark == "2024-01-01T01:00:01+01:00"
+
+
+def test_start_time(tmp_path):
+    store = FileCheckpointStore(str(tmp_path / "oat.checkpoint"))
+    state = IncrementalSync(store, overlap=120)
+    assert state.start_time("2024-01-01T00:00:00Z") == "2024-01-01T00:00:00Z"
+    store.save(Checkpoint(watermark="2024-01-02T00:00:00Z"))
+    assert state.start_time() == "2024-01-01T23:58:00Z"
+
+
+def test_oat_sync(mocker, tmp_path):
+    client = Client(
+        Core("appname", "dummyToken", "https://dummy.com", 1, 1, 30, 30)
+    )
+    store = FileCheckpointStore(str(tmp_path / "oat.checkpoint"))
+    state = IncrementalSync(store, overlap=60)
+    consumed = []
+    mock_send = mocker.patch.object(
+        client._core._adapter,
+        "send",
+        side_effect=[
+            json_response(
+                page(
+                    ingested("1", "2024-01-01T00:00:00Z"),
+                    ingested("2", "2024-01-01T00:05:00Z"),
+                )
+            ),
+            json_response(
+                page(
+                    ingested("2", "2024-01-01T00:05:00Z"),
+                    ingested("3", "2024-01-01T00:06:00Z"),
+                )
+            ),
+        ],
+    )
+
+    def consumer(oat):
+        consumed.append(oat.uuid)
+
+    result = client.oat.sync(consumer, state, "2024-01-01T00:00:00Z")
+    assert result.result_code == ResultCode.SUCCESS
+    assert store.load().watermark == "2024-01-01T00:05:00Z"
+    result = client.oat.sync(consumer, state, "2024-01-01T00:00:00Z")
+    assert result.result_code == ResultCode.SUCCESS
+    assert consumed == ["1", "2", "3"]
+    assert store.load().watermark == "2024-01-01T00:06:00Z"
+    assert parse_qs(urlsplit(mock_send.call_args.args[0].url).query) == {
+        "ingestedStartDateTime": ["2024-01-01T00:04:00Z"],
+        "top": ["50"],
+    }
+
+
+def test_oat_sync_with_error_keeps_watermark(mocker, tmp_path):
+    client = Client(
+        Core("appname", "dummyToken", "https://dummy.com", 1, 1, 30, 30)
+    )
+    store = FileCheckpointStore(str(tmp_path / "oat.checkpoint"))
+    store.save(Checkpoint(watermark="2024-01-01T00:00:00Z"))
+    state = IncrementalSync(store)
+    mocker.patch.object(
+        client._core._adapter,
+        "send",
+        return_value=json_response(
+            page(ingested("1", "2024-01-01T00:05:00Z"), oat_item("2"))
+        ),
+    )
+
+    def consumer(oat):
+        if oat.uuid == "2":
+            raise RuntimeError("consumer failure")
+
+    result = client.oat.sync(consumer, state)
+    assert result.result_code == ResultCode.ERROR
+    assert store.load().watermark == "2024-01-01T00:00:00Z"
+    assert state.dedupe.seen("1")
+    assert not state.dedupe.seen("2")
+
+
+def test_oat_sync_without_uuid(mocker, tmp_path):
+    client = Client(
+        Core("appname", "dummyToken", "https://dummy.com", 1, 1, 30, 30)
+    )
+    state = IncrementalSync(
+        FileCheckpointStore(str(tmp_path / "oat.checkpoint"))
+    )
+    mocker.patch.object(
+        client._core._adapter,
+        "send",
+        return_value=json_response(
+            page(
+                ingested(None, "2024-01-01T00:05:00Z"),
+                ingested(None, "2024-01-01T00:06:00Z"),
+            )
+        ),
+    )
+    consumed = []
+    result = client.oat.sync(consumed.append, state)
+    assert result.result_code == ResultCode.SUCCESS
+    assert len(consumed) == 2
+
+
+def test_async_oat_sync(tmp_path):
+    store = FileCheckpointStore(str(tmp_path / "oat.checkpoint"))
+    state = IncrementalSync(store)
+    state.dedupe.add("1")
+    consumed = []
+
+    def handler(request):
+        return httpx.Response(
+            200,
+            json=page(
+                ingested("1", "2024-01-01T00:00:00Z"),
+                ingested("2", "2024-01-01T00:05:00Z"),
+            ),
+        )
+
+    async def consumer(oat):
+        consumed.append(oat.uuid)
+
+    core = AsyncCore("appname", "dummyToken", "https://dummy.com", 1, 30, 30)
+    core._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    result = asyncio.run(AsyncClient(core).oat.sync(consumer, state))
+    assert result.result_code == ResultCode.SUCCESS
+    assert consumed == ["2"]
+    assert state.dedupe.seen("2")
+    assert store.load().watermark == "2024-01-01T00:05:00Z"
@@ -0,0 +1,70 @@
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+
+from pytmv1 import RateLimit, RateLimiter, throttle
+
+URL = "https://dummy.com/v3.0/search/endpointActivities?top=50"
+
+
+@pytest.fixture
+def clock(mocker):
+    mock_time = mocker.patch.object(throttle, "time")
+    mock_time.monotonic.return_value = 100.0
+    return mock_time.monotonic
+
+
+def test_family():
+    assert throttle.family(URL) == "search"
+    assert throttle.family("https://dummy.com/v3.0/response/tasks/1") == (
+        "response"
+    )
+    assert throttle.family("https://dummy.com/healthcheck") == "healthcheck"
+
+
+def test_reserve_without_limit(clock):
+    limiter = RateLimiter()
+    assert [limiter.reserve(URL) for _ in range(5)] == [0] * 5
+
+
+def test_reserve_with_limit(clock):
+    limiter = RateLimiter({"search": RateLimit(10, burst=2)})
+    waits = [limiter.reserve(URL) for _ in range(4)]
+    assert waits == pytest.approx([0, 0, 0.1, 0.2])
+    assert limiter.reserve("https://dummy.com/v3.0/response/tasks") == 0
+    clock.return_value = 101.0
+    assert limiter.reserve(URL) == 0
+
+
+def test_reserve_with_default_limit(clock):
+    limiter = RateLimiter(default=RateLimit(1))
+    assert limiter.reserve(URL) == 0
+    assert limiter.reserve("https://dummy.com/v3.0/response/tasks") == 0
+    assert limiter.reserve(URL) == pytest.approx(1)
+
+
+def test_throttled_pauses_family(clock):
+    limiter = RateLimiter()
+    assert limiter.throttled(URL, "5", 0) == 5
+    assert limiter.reserve(URL) == 5
+    assert limiter.reserve("https://dummy.com/v3.0/response/tasks") == 0
+
+
+def test_throttled_with_date(clock):
+    retry_after = format_datetime(
+        datetime.now(timezone.utc) + timedelta(seconds=30), usegmt=True
+    )
+    assert 25 < RateLimiter().throttled(URL, retry_after, 0) <= 30
+
+
+@pytest.mark.parametrize(
+    "retry_after, attempt, expected",
+    [(None, 0, 1), (None, 2, 4), ("invalid", 1, 2), ("600", 0, 60)],
+)
+def test_throttled_with_defaults(clock, retry_after, attempt, expected):
+    assert RateLimiter().throttled(URL, retry_after, attempt) == expected
+
+
+def test_throttled_with_retries_exhausted(clock):
+    assert RateLimiter(max_retries=2).throttled(URL, "1", 2) is None
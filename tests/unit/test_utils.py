@@ -1,3 +1,5 @@
+from datetime import datetime, timezone
+
 from pytmv1 import ObjectRequest, QueryOp, SuspiciousObjectRequest, utils
 from pytmv1.model.enum import ObjectType, ScanAction, SearchMode
 
@@ -90,3 +92,49 @@ def test_filter_none():
     assert len(dictionary) == 0
     dictionary = utils.filter_none({"123": "Value"})
     assert len(dictionary) == 1
+
+
+def test_split_time_range():
+    assert utils.split_time_range(
+        "2024-01-01T00:00:00Z", "2024-01-02T00:00:00Z", 3
+    ) == [
+        ("2024-01-01T00:00:00Z", "2024-01-01T08:00:00Z"),
+        ("2024-01-01T08:00:00Z", "2024-01-01T16:00:00Z"),
+        ("2024-01-01T16:00:00Z", "2024-01-02T00:00:00Z"),
+    ]
+
+
+def test_window_boundaries():
+    assert utils.window_boundaries(
+        utils.split_time_range(
+            "2024-01-01T00:00:00Z", "2024-01-02T00:00:00Z", 3
+        )
+    ) == [1704096000000, 1704124800000]
+
+
+def test_parse_time():
+    assert utils.parse_time("2024-01-01T00:00:00.5Z") == datetime(
+        2024, 1, 1, 0, 0, 0, 500000, timezone.utc
+    )
+    assert utils.parse_time("2024-01-01T01:00:00+01:00") == datetime(
+        2024, 1, 1, tzinfo=timezone.utc
+    )
+
+
+def test_window_select():
+    assert utils.window_select(None) is None
+    assert utils.window_select(["uuid"]) == ["uuid", "eventTime"]
+    assert utils.window_select(["uuid", "event_time"]) == [
+        "uuid",
+        "event_time",
+    ]
+
+
+def test_split_time_range_with_short_range():
+    assert utils.split_time_range(
+        "2024-01-01T00:00:00Z", "2024-01-01T00:00:01Z", 5
+    ) == [("2024-01-01T00:00:00Z", "2024-01-01T00:00:01Z")]
+
+
+def test_split_time_range_without_range():
+    assert len(utils.split_time_range(None, None, 4)) == 4